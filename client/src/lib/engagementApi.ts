@@ -15,8 +15,18 @@ interface EngagementResponse {
 // Fetch all engagements for current user
 export const getEngagements = async (): Promise<EngagementResponse[]> => {
   const token = localStorage.getItem("token");
-  const res = await axios.get(API_BASE, { headers: { Authorization: `Bearer ${token}` } });
-  return Array.isArray(res.data) ? res.data : [];
+  const engagements: EngagementResponse[] = [];
+  let cursor: string | undefined;
+  do {
+    const res = await axios.get(API_BASE, {
+      headers: { Authorization: `Bearer ${token}` },
+      params: { limit: 200, cursor },
+    });
+    if (!Array.isArray(res.data)) break;
+    engagements.push(...res.data);
+    cursor = res.headers["x-next-cursor"];
+  } while (cursor);
+  return engagements;
 };
 
 // Mark done
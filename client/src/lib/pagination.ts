@@ -0,0 +1,35 @@
+// List endpoints are cursor-paginated: each page is a JSON array and the
+// cursor for the next page comes back in the X-Next-Cursor header.
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+const PAGE_SIZE = 200;
+
+/**
+ * Drop-in replacement for `fetch` on list endpoints: follows X-Next-Cursor
+ * until the last page and resolves to a Response whose body is the combined
+ * array. Non-OK pages are returned as-is.
+ */
+export async function fetchAllPages(url: string, init?: RequestInit): Promise<Response> {
+  const items: unknown[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const pageUrl = new URL(url, window.location.origin);
+    pageUrl.searchParams.set("limit", String(PAGE_SIZE));
+    if (cursor) pageUrl.searchParams.set("cursor", cursor);
+
+    const res = await fetch(pageUrl.toString(), init);
+    if (!res.ok) return res;
+
+    const page = await res.json();
+    if (!Array.isArray(page)) {
+      return new Response(JSON.stringify(page), { status: res.status, headers: res.headers });
+    }
+    items.push(...page);
+    cursor = res.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+
+  return new Response(JSON.stringify(items), {
+    status: 200,
+    headers: { "Content-Type": "application/json" },
+  });
+}
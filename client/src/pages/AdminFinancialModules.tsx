@@ -112,14 +112,19 @@ export default function AdminFinancialModules() {
   // Save module (update title)
   const handleSaveModuleTitle = async () => {
     if (!editingModule) return;
+    // Rows added in the editor carry temporary ids; only ids the server gave us are sent back
+    const saved = modules.find((m) => m.id === editingModule.id);
+    const savedSectionIds = new Set(saved?.sections.map((s) => s.id));
+    const savedQuizIds = new Set(saved?.quiz.map((q) => q.id));
     try {
       const res = await fetch(`${API_BASE}/admin/financial-modules/${editingModule.id}/`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", ...authHeaders },
         body: JSON.stringify({
           title: editingModule.title,
-          // For simplicity, send sections/quiz as current state (backend will overwrite)
+          // Full current state; the backend diffs it against what is stored
           sections: editingModule.sections.map((s) => ({
+            id: savedSectionIds.has(s.id) ? s.id : undefined,
             title: s.title,
             content: s.content,
             last_updated: s.lastUpdated,
@@ -129,6 +134,7 @@ export default function AdminFinancialModules() {
             download_url: s.download_url,
           })),
           quiz: editingModule.quiz.map((q) => ({
+            id: savedQuizIds.has(q.id) ? q.id : undefined,
             question: q.question,
             options: q.options,
             answer: q.answer,
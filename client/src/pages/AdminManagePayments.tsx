@@ -3,6 +3,7 @@ import AdminDashboardLayout from "@/components/AdminDashboardLayout";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -23,7 +24,7 @@ const AdminManagePayments = () => {
 
   const fetchPayments = async () => {
     try {
-      const res = await fetch(`${API_BASE}/admin/support/payments`, {
+      const res = await fetchAllPages(`${API_BASE}/admin/support/payments`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch payments");
@@ -6,6 +6,7 @@ import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -26,7 +27,7 @@ const AdminMonitorSubscriptions = () => {
 
   const fetchSubscriptions = async () => {
     try {
-      const res = await fetch(`${API_BASE}/admin/support/subscriptions`, {
+      const res = await fetchAllPages(`${API_BASE}/admin/support/subscriptions`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch subscriptions");
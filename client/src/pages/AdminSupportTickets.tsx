@@ -12,6 +12,7 @@ import {
 } from "@/components/ui/tooltip";
 import Modal from "@/components/ui/Modal";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -51,7 +52,7 @@ const AdminSupportTickets = () => {
   // -------------------
   const fetchTickets = async () => {
     try {
-      const res = await fetch(`${API_BASE}/admin/support-tickets/`, {
+      const res = await fetchAllPages(`${API_BASE}/admin/support-tickets/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch tickets");
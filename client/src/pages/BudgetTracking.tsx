@@ -15,6 +15,7 @@ import {
   Tooltip as PieTooltip,
   ResponsiveContainer,
 } from "recharts";
+import { fetchAllPages } from "@/lib/pagination";
 
 // === Types ===
 interface Income {
@@ -135,7 +136,7 @@ const BudgetTracking = () => {
 
   const fetchIncomes = async () => {
     try {
-      const res = await fetch(`${API_BASE}/income/`, { headers: { Authorization: `${tokenType} ${token}` } });
+      const res = await fetchAllPages(`${API_BASE}/income/`, { headers: { Authorization: `${tokenType} ${token}` } });
       if (!res.ok) throw new Error("Failed to fetch incomes");
       const data = await res.json();
       setIncomes(data.map(mapIncome));
@@ -146,7 +147,7 @@ const BudgetTracking = () => {
 
   const fetchExpenses = async () => {
     try {
-      const res = await fetch(`${API_BASE}/expenses/`, { headers: { Authorization: `${tokenType} ${token}` } });
+      const res = await fetchAllPages(`${API_BASE}/expenses/`, { headers: { Authorization: `${tokenType} ${token}` } });
       if (!res.ok) throw new Error("Failed to fetch expenses");
       const data = await res.json();
       setExpenses(data.map(mapExpense));
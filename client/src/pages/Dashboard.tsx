@@ -4,6 +4,7 @@ import DashboardLayout from "@/components/DashboardLayout";
 import { TrendingUp, TrendingDown, Calendar, Award } from "lucide-react";
 import { getCookie } from "@/lib/cookie";
 import { getCurrentUser } from "@/lib/authApi";
+import { fetchAllPages } from "@/lib/pagination";
 
 interface IncomeItem {
   id: number;
@@ -96,7 +97,7 @@ const Dashboard = () => {
   const fetchData = async () => {
     try {
       // Incomes
-      const incomeRes = await fetch(`${API_BASE}/income/`, { headers: { Authorization: `${tokenType} ${token}` } });
+      const incomeRes = await fetchAllPages(`${API_BASE}/income/`, { headers: { Authorization: `${tokenType} ${token}` } });
       const incomeDataRaw = await incomeRes.json();
       const incomeData: IncomeItem[] = (incomeDataRaw || []).map((i: any) => ({
         id: i.id,
@@ -106,7 +107,7 @@ const Dashboard = () => {
       }));
 
       // Expenses
-      const expenseRes = await fetch(`${API_BASE}/expenses/`, { headers: { Authorization: `${tokenType} ${token}` } });
+      const expenseRes = await fetchAllPages(`${API_BASE}/expenses/`, { headers: { Authorization: `${tokenType} ${token}` } });
       const expenseDataRaw = await expenseRes.json();
       const expenseData: ExpenseItem[] = (expenseDataRaw || []).map((e: any) => ({
         id: e.id,
@@ -154,7 +155,7 @@ const Dashboard = () => {
       }
 
       // Payments
-      const paymentsRes = await fetch(`${API_BASE}/payments/`, { headers: { Authorization: `${tokenType} ${token}` } });
+      const paymentsRes = await fetchAllPages(`${API_BASE}/payments/`, { headers: { Authorization: `${tokenType} ${token}` } });
       const paymentsRaw = await paymentsRes.json();
       const today = new Date();
       const upcoming = (paymentsRaw || [])
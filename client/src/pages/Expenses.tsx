@@ -7,6 +7,7 @@ import { getCookie } from "@/lib/cookie";
 import Modal from "@/components/ui/Modal";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -37,7 +38,7 @@ const Expenses = () => {
 
   const fetchExpenses = async () => {
     try {
-      const res = await fetch(`${API_BASE}/expenses/`, {
+      const res = await fetchAllPages(`${API_BASE}/expenses/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch expenses");
@@ -7,6 +7,7 @@ import { getCookie } from "@/lib/cookie";
 import Modal from "@/components/ui/Modal";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -35,7 +36,7 @@ const IncomePage = () => {
 
   const fetchIncomes = async () => {
     try {
-      const res = await fetch(`${API_BASE}/income/`, {
+      const res = await fetchAllPages(`${API_BASE}/income/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch incomes");
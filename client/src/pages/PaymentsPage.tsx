@@ -7,6 +7,7 @@ import { getCookie } from "@/lib/cookie";
 import Modal from "@/components/ui/Modal";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -38,7 +39,7 @@ const PaymentsPage = () => {
   // Fetch all payments
   const fetchPayments = async () => {
     try {
-      const res = await fetch(`${API_BASE}/payments/`, {
+      const res = await fetchAllPages(`${API_BASE}/payments/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch payments");
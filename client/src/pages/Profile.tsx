@@ -23,6 +23,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { updateUserProfile } from "@/lib/authApi";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -114,7 +115,7 @@ const [expenses, setExpenses] = useState<Expense[]>([]);
   
     const fetchDocuments = async () => {
       try {
-        const res = await fetch(`${API_BASE}/documents/`, {
+        const res = await fetchAllPages(`${API_BASE}/documents/`, {
           headers: { Authorization: `${tokenType} ${token}` },
         });
         if (!res.ok) throw new Error("Failed to fetch documents");
@@ -176,7 +177,7 @@ const [expenses, setExpenses] = useState<Expense[]>([]);
   
     const fetchExpenses = async () => {
       try {
-        const res = await fetch(`${API_BASE}/expenses/`, {
+        const res = await fetchAllPages(`${API_BASE}/expenses/`, {
           headers: { Authorization: `${tokenType} ${token}` },
         });
         if (!res.ok) throw new Error("Failed to fetch expenses");
@@ -9,6 +9,7 @@ import { Progress } from "@/components/ui/progress";
 import { useToast } from "@/hooks/use-toast";
 import { Upload, Lock, CheckCircle2, FileText, Trash2 } from "lucide-react";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 interface Document {
   id: number;
@@ -39,7 +40,7 @@ const UploadDocuments = () => {
 
   const fetchUserDocuments = async () => {
     try {
-      const res = await fetch(`${API_BASE}/documents/`, {
+      const res = await fetchAllPages(`${API_BASE}/documents/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch documents");
@@ -8,6 +8,7 @@ import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from "@/comp
 import { Button } from "@/components/ui/button";
 import Modal from "@/components/ui/Modal";
 import { getCookie } from "@/lib/cookie";
+import { fetchAllPages } from "@/lib/pagination";
 
 const API_BASE = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
 
@@ -36,7 +37,7 @@ const SupportTickets = () => {
   // Fetch tickets from backend
   const fetchTickets = async () => {
     try {
-      const res = await fetch(`${API_BASE}/support-tickets/`, {
+      const res = await fetchAllPages(`${API_BASE}/support-tickets/`, {
         headers: { Authorization: `${tokenType} ${token}` },
       });
       if (!res.ok) throw new Error("Failed to fetch tickets");
@@ -1,20 +1,40 @@
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.principal_cache import Principal, principal_cache
 from app.api.dependencies.db import get_db
+from app.db.session import SessionLocal
 from app.models.users import User  # <-- only import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _load_principal(user_id: int) -> Principal | None:
+    """Cache miss: read the user row once and snapshot it."""
+    with SessionLocal() as db:
+        user = db.get(User, user_id)
+        return Principal.from_user(user) if user else None
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> Principal:
+    """
+    Resolve the bearer token to a cached `Principal`.
+    Cache hits stay on the event loop; only a miss opens a DB session
+    (in the threadpool).
+    """
+    credentials_exception = _credentials_exception()
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -22,11 +42,29 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        user_id = int(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
+    principal = await principal_cache.aget(user_id)
+    if principal is None:
+        principal = await run_in_threadpool(_load_principal, user_id)
+        if principal is None:
+            raise credentials_exception
+        await principal_cache.aset(principal)
+
+    return principal
 
+
+def get_current_db_user(
+    principal: Principal = Depends(get_current_user), db: Session = Depends(get_db)
+) -> User:
+    """
+    Full `User` row for handlers that mutate the user or need profile fields
+    not carried by the principal.
+    """
+    user = db.get(User, principal.id)
+    if user is None:
+        principal_cache.invalidate(principal.id)
+        raise _credentials_exception()
     return user
@@ -1,4 +1,8 @@
-from app.db.session import SessionLocal
+from fastapi import Request
+from sqlalchemy import exc
+
+from app.core.read_your_writes import bearer_user_id, has_recent_write
+from app.db.session import SessionLocal, AsyncSessionLocal, read_router
 
 # -----------------------------
 # FastAPI Dependency
@@ -15,3 +19,32 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Async database session dependency for `async def` routes.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db(request: Request):
+    """
+    Read-only session for list/report endpoints that tolerate replica lag.
+    Uses a healthy replica (round-robin) unless the caller wrote recently,
+    in which case it stays on the primary. Handlers must not write with it.
+    """
+    user_id = bearer_user_id(request)
+    if user_id is not None and has_recent_write(user_id):
+        db = read_router.session(bind=read_router.primary)
+    else:
+        db = read_router.session()
+    try:
+        yield db
+    except exc.DBAPIError as e:
+        if e.connection_invalidated:
+            read_router.mark_unhealthy(db.get_bind())
+        raise
+    finally:
+        db.close()
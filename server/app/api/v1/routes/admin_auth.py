@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from app.services.admin_auth_service import AdminAuthService
 from app.schemas.admin_auth import AdminCreate
 from app.api.dependencies.db import get_db
+from app.core.rate_limiter import rate_limit, LOGIN_LIMIT
 
 router = APIRouter(prefix="/admin", tags=["Admin Auth"])
 
@@ -16,7 +17,7 @@ def register_admin(admin_data: AdminCreate, db: Session = Depends(get_db)):
     """
     return AdminAuthService.register_admin(db=db, admin_data=admin_data)
 
-@router.post("/login")
+@router.post("/login", dependencies=[rate_limit(LOGIN_LIMIT)])
 def login_admin(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Admin login — only superusers.
@@ -1,12 +1,8 @@
 # app/api/v1/routes/admin_dashboard_ops.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.api.dependencies.db import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from app.api.dependencies.auth import get_current_user
 from app.models.users import User
-from app.models.subscription import Subscription
-from app.models.payment import Payment
-from app.models.support_ticket import SupportTicket
+from app.services.dashboard_stats_service import DashboardStatsService
 
 router = APIRouter(prefix="/admin", tags=["Admin Dashboard Ops"])
 
@@ -29,31 +25,15 @@ def get_admin_info(current_user: User = Depends(get_current_user)):
 # Dashboard stats
 # -----------------------------
 @router.get("/dashboard-stats")
-def dashboard_stats(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def dashboard_stats(background_tasks: BackgroundTasks, current_user: User = Depends(get_current_user)):
     # Only superusers can access
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Total Users
-    total_users = db.query(User).count()
+    # Cached snapshot; a stale one is served while it is recomputed after the response
+    counters, needs_refresh = DashboardStatsService.get()
+    if needs_refresh:
+        background_tasks.add_task(DashboardStatsService.refresh_if_unlocked)
 
-    # Pending Tickets
-    pending_tickets = db.query(SupportTicket).filter(SupportTicket.status == "Open").count()
-
-    # Revenue (sum of all non-refunded payments)
-    revenue = db.query(Payment).filter(Payment.refunded == False).with_entities(
-        Payment.amount
-    ).all()
-    total_revenue = sum([r[0] for r in revenue]) if revenue else 0
-
-    # Financial Score (% of non-churned subscriptions)
-    total_subs = db.query(Subscription).count()
-    non_churned_subs = db.query(Subscription).filter(Subscription.churned == False).count()
-    financial_score = int((non_churned_subs / total_subs) * 100) if total_subs > 0 else 0
-
-    return {
-        "total_users": total_users,
-        "pending_tickets": pending_tickets,
-        "total_revenue": total_revenue,
-        "financial_score": financial_score,
-    }
+    # financial_score = % of non-churned subscriptions
+    return DashboardStatsService.to_response(counters)
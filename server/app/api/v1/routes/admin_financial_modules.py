@@ -1,15 +1,17 @@
 # app/api/v1/routes/admin_financial_modules.py
 from fastapi import APIRouter, Depends, HTTPException, status, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from datetime import datetime
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_db, get_read_db
 from app.api.dependencies.auth import get_current_user
 from app.models.financial import FinancialModule, Section, QuizQuestion
 from app.models.users import User
 from app.schemas.financial import FinancialModuleCreate, FinancialModuleUpdate
 from app.core.decorators.handle_exceptions import handle_exceptions
+from app.services.financial_catalog import module_catalog, own_modules_version
+from app.services.module_service import ModuleService
 
 router = APIRouter(prefix="/admin/financial-modules", tags=["Admin Financial Modules"])
 
@@ -61,10 +63,12 @@ def ensure_admin(user: User):
 # -----------------------
 @router.get("/", response_model=List[dict])
 @handle_exceptions
-def admin_list_modules(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def admin_list_modules(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     ensure_admin(current_user)
     # Return all modules, global (user_id=None) + user-specific if needed
-    modules = db.query(FinancialModule).all()
+    modules = db.query(FinancialModule).options(
+        selectinload(FinancialModule.sections), selectinload(FinancialModule.quiz)
+    ).order_by(FinancialModule.id).all()
     return [module_to_out(m) for m in modules]
 
 
@@ -112,6 +116,7 @@ def admin_create_module(
 
     db.commit()
     db.refresh(module)
+    module_catalog.invalidate()
     return module_to_out(module)
 
 
@@ -132,38 +137,15 @@ def admin_update_module(
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
 
-    module.title = module_in.title
-
-    # Delete old sections and quizzes
-    db.query(Section).filter(Section.module_id == module.id).delete()
-    db.query(QuizQuestion).filter(QuizQuestion.module_id == module.id).delete()
-
-    # Add updated sections
-    for s in module_in.sections or []:
-        section = Section(
-            module_id=module.id,
-            title=s.title,
-            content=s.content,
-            last_updated=s.last_updated or datetime.utcnow(),
-            reviewed_by=s.reviewed_by,
-            region=s.region,
-            tags=",".join(s.tags or []),
-            download_url=getattr(s, "download_url", None)
-        )
-        db.add(section)
-
-    # Add updated quiz
-    for q in module_in.quiz or []:
-        quiz = QuizQuestion(
-            module_id=module.id,
-            question=q.question,
-            options=",".join(q.options or []),
-            answer=q.answer
-        )
-        db.add(quiz)
+    # Apply only what changed; unchanged sections and questions keep their ids
+    ModuleService.apply_update(db, module, module_in)
 
     db.commit()
     db.refresh(module)
+    if module.user_id is None:
+        module_catalog.invalidate()
+    else:
+        own_modules_version(module.user_id).bump()
     return module_to_out(module)
 
 
@@ -179,6 +161,11 @@ def admin_delete_module(module_id: int, db: Session = Depends(get_db), current_u
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
 
+    owner_id = module.user_id
     db.delete(module)
     db.commit()
+    if owner_id is None:
+        module_catalog.invalidate()
+    else:
+        own_modules_version(owner_id).bump()
     return {"detail": "Deleted"}
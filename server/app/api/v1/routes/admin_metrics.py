@@ -0,0 +1,93 @@
+# app/api/v1/routes/admin_metrics.py
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.dependencies.auth import get_current_user
+from app.core.metrics import metrics
+from app.core.principal_cache import Principal, principal_cache
+from app.core.redis import redis_health
+from app.core.scheduler import jobs_stats
+from app.db.pool_metrics import pool_stats
+from app.db.session import read_router
+from app.services.financial_catalog import module_catalog
+from app.services.fx_service import fx_rates
+from app.services.tax_resource_catalog import tax_resources_cache
+
+router = APIRouter(prefix="/admin/metrics", tags=["Admin Metrics"])
+
+
+def require_superuser(current_user: Principal = Depends(get_current_user)):
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return current_user
+
+
+# -----------------------------
+# All in-process metrics (this worker only)
+# -----------------------------
+@router.get("/")
+def list_metrics(admin: Principal = Depends(require_superuser)):
+    return metrics.snapshot()
+
+
+# -----------------------------
+# Principal cache
+# -----------------------------
+@router.get("/principal-cache")
+def principal_cache_stats(admin: Principal = Depends(require_superuser)):
+    return principal_cache.stats()
+
+
+# -----------------------------
+# Redis pool
+# -----------------------------
+@router.get("/redis")
+async def redis_pool_stats(admin: Principal = Depends(require_superuser)):
+    return await redis_health()
+
+
+# -----------------------------
+# Database connection pools
+# -----------------------------
+@router.get("/db-pool")
+def db_pool_stats(admin: Principal = Depends(require_superuser)):
+    return pool_stats()
+
+
+# -----------------------------
+# Read replicas
+# -----------------------------
+@router.get("/db-replicas")
+def db_replica_stats(admin: Principal = Depends(require_superuser)):
+    return read_router.stats()
+
+
+# -----------------------------
+# Background jobs (this worker only)
+# -----------------------------
+@router.get("/scheduler")
+def scheduler_stats(admin: Principal = Depends(require_superuser)):
+    return jobs_stats()
+
+
+# -----------------------------
+# Financial module catalog cache (this worker only)
+# -----------------------------
+@router.get("/module-catalog")
+def module_catalog_stats(admin: Principal = Depends(require_superuser)):
+    return module_catalog.stats()
+
+
+# -----------------------------
+# Tax resources cache (this worker only)
+# -----------------------------
+@router.get("/tax-resources-cache")
+def tax_resources_cache_stats(admin: Principal = Depends(require_superuser)):
+    return tax_resources_cache.stats()
+
+
+# -----------------------------
+# FX rate cache (this worker only)
+# -----------------------------
+@router.get("/fx")
+def fx_stats(admin: Principal = Depends(require_superuser)):
+    return fx_rates.stats()
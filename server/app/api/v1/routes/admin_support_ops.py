@@ -1,11 +1,12 @@
 # app/api/v1/routes/admin_support_ops.py
-from fastapi import APIRouter, Depends, Body, HTTPException, status
+from fastapi import APIRouter, Depends, Body, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_db, get_read_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.models.users import User
 from app.models.subscription import Subscription
 from app.models.payment import Payment
@@ -16,6 +17,10 @@ from app.schemas.support_ticket import SupportTicketOut, SupportTicketUpdate
 
 router = APIRouter(prefix="/admin/support", tags=["Admin Support & Operations"])
 
+subscription_keyset = Keyset(Subscription.started_at, Subscription.id)
+payment_keyset = Keyset(Payment.created_at, Payment.id)
+ticket_keyset = Keyset(SupportTicket.created_on, SupportTicket.id)
+
 # Helper: check admin/finance roles
 def ensure_admin_roles(user: User, allowed_roles: List[str]):
     user_role = getattr(user, "role", None)  # Option 2: fallback if role exists
@@ -28,7 +33,9 @@ def ensure_admin_roles(user: User, allowed_roles: List[str]):
 # -----------------------------
 @router.get("/subscriptions", response_model=List[SubscriptionOut])
 def list_subscriptions(
-    db: Session = Depends(get_db), 
+    response: Response,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db), 
     current_user: User = Depends(get_current_user)
 ):
     # Option 2: role-less check using superuser or permission flags
@@ -36,8 +43,8 @@ def list_subscriptions(
         # Or add other permission checks if you have a 'permissions' field
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    subscriptions = db.query(Subscription).all()
-    return subscriptions
+    subscriptions = subscription_keyset.apply(db.query(Subscription), page).all()
+    return subscription_keyset.page(subscriptions, page, response)
 
 @router.patch("/subscriptions/{subscription_id}", response_model=SubscriptionOut)
 def update_subscription(
@@ -68,9 +75,9 @@ def update_subscription(
 # Payments
 # -----------------------------
 @router.get("/payments", response_model=List[PaymentOut])
-def list_payments(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def list_payments(response: Response, page: PageParams = Depends(), db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     ensure_admin_roles(current_user, ["accountant", "finance"])
-    payments = db.query(Payment).all()
+    payments = payment_keyset.page(payment_keyset.apply(db.query(Payment), page).all(), page, response)
     return [
         PaymentOut(
             id=p.id,
@@ -109,9 +116,9 @@ def refund_payment(payment_id: int, db: Session = Depends(get_db), current_user:
 # Support Tickets
 # -----------------------------
 @router.get("/tickets", response_model=List[SupportTicketOut])
-def list_tickets(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def list_tickets(response: Response, page: PageParams = Depends(), db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     ensure_admin_roles(current_user, ["support"])
-    tickets = db.query(SupportTicket).all()
+    tickets = ticket_keyset.page(ticket_keyset.apply(db.query(SupportTicket), page).all(), page, response)
     return [
         SupportTicketOut(
             id=t.id,
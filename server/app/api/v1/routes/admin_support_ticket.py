@@ -1,20 +1,23 @@
 # A:\f1nance\server\app\api\v1\routes\admin_support_ticket.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_db, get_read_db
 from app.api.dependencies.auth import get_current_user  # admin user dependency
+from app.core.pagination import Keyset, PageParams
 from app.models.support_ticket import SupportTicket
 from app.schemas.support_ticket import SupportTicketOut
 from app.schemas.support_ticket import SupportTicketUpdate
 
 router = APIRouter(prefix="/admin/support-tickets", tags=["Admin Support Tickets"])
 
+ticket_keyset = Keyset(SupportTicket.created_on, SupportTicket.id)
+
 @router.get("/", response_model=List[SupportTicketOut])
-def list_tickets(db: Session = Depends(get_db), admin=Depends(get_current_user)):
-    return db.query(SupportTicket).order_by(SupportTicket.created_on.desc()).all()
+def list_tickets(response: Response, page: PageParams = Depends(), db: Session = Depends(get_read_db), admin=Depends(get_current_user)):
+    return ticket_keyset.page(ticket_keyset.apply(db.query(SupportTicket), page).all(), page, response)
 
 @router.put("/{ticket_id}/", response_model=SupportTicketOut)
 def update_ticket_status(
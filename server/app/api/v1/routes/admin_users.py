@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, Body, HTTPException, status
+from fastapi import APIRouter, Depends, Body, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.models.users import User
 from app.schemas.users import UserOut
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_db, get_read_db
 from app.api.dependencies.auth import get_current_user
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
+from app.core.pagination import Keyset, PageParams
 
 router = APIRouter(prefix="/admin/users", tags=["Admin Users"])
 
+user_keyset = Keyset(User.id, descending=False)
+
 
 # ---------------------------
 # Dependency: admin-only
@@ -27,8 +31,8 @@ def require_admin(current_user: User = Depends(get_current_user)):
 # GET all users
 # ---------------------------
 @router.get("/", response_model=List[UserOut])
-def list_users(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    return db.query(User).all()
+def list_users(response: Response, page: PageParams = Depends(), db: Session = Depends(get_read_db), admin: User = Depends(require_admin)):
+    return user_keyset.page(user_keyset.apply(db.query(User), page).all(), page, response)
 
 
 # ---------------------------
@@ -97,6 +101,7 @@ def update_user(
 
     db.commit()
     db.refresh(user)
+    principal_cache.invalidate(user.id)
     return user
 
 
@@ -114,4 +119,5 @@ def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
     db.delete(user)
     db.commit()
+    principal_cache.invalidate(user_id)
     return {"ok": True}
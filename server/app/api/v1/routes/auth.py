@@ -5,8 +5,13 @@ from sqlalchemy.orm import Session
 from app.schemas.auth import Token, UserCreate, UserResponse
 from app.services.auth_service import AuthService
 from app.api.dependencies.db import get_db
-from app.api.dependencies.auth import get_current_user
-from app.core.decorators.rate_limiter import rate_limit
+from app.api.dependencies.auth import get_current_user, get_current_db_user
+from app.core.rate_limiter import (
+    rate_limit,
+    LOGIN_LIMIT,
+    REGISTER_LIMIT,
+    RESEND_VERIFICATION_LIMIT,
+)
 from app.core.decorators.require_auth import require_auth
 from app.core.decorators.handle_exceptions import handle_exceptions
 
@@ -14,7 +19,10 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post(
-    "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[rate_limit(REGISTER_LIMIT)],
 )
 @handle_exceptions
 def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
@@ -24,7 +32,7 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     return AuthService.register_user(db=db, user_data=user_data)
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[rate_limit(LOGIN_LIMIT)])
 @handle_exceptions
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
@@ -39,7 +47,7 @@ def login(
 
 @router.get("/me", response_model=UserResponse)
 @handle_exceptions
-def read_current_user(current_user = Depends(get_current_user)):
+def read_current_user(current_user = Depends(get_current_db_user)):
     """
     Retrieve the currently authenticated user.
     """
@@ -58,7 +66,7 @@ def read_current_user(current_user = Depends(get_current_user)):
 def verify_email(
     token: str = Query(..., description="Email verification token"),
     db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_db_user),
 ):
     """
     Verify user's email.
@@ -66,8 +74,11 @@ def verify_email(
     return AuthService.verify_email(db=db, user=current_user, token=token)
 
 
-@router.post("/resend-verification", status_code=status.HTTP_200_OK)
-@rate_limit(limit_seconds=120, prefix="resend_verification")
+@router.post(
+    "/resend-verification",
+    status_code=status.HTTP_200_OK,
+    dependencies=[rate_limit(RESEND_VERIFICATION_LIMIT)],
+)
 @handle_exceptions
 def resend_verification(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
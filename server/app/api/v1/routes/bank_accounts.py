@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
 from app.models.users import User
 from app.models.bank_accounts import BankAccount
@@ -11,20 +12,29 @@ from app.schemas.bank_accounts import BankAccountCreate, BankAccountOut
 
 router = APIRouter(prefix="/bank-accounts", tags=["Bank Accounts"])
 
+
+async def get_user_account(db: AsyncSession, account_id: int, user_id: int) -> BankAccount:
+    account = await db.scalar(
+        select(BankAccount).where(BankAccount.id == account_id, BankAccount.user_id == user_id)
+    )
+    if not account:
+        raise HTTPException(status_code=404, detail="Bank account not found")
+    return account
+
 # GET all bank accounts for current user
 @router.get("/", response_model=List[BankAccountOut])
-def list_bank_accounts(
-    db: Session = Depends(get_db),
+async def list_bank_accounts(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    accounts = db.query(BankAccount).filter(BankAccount.user_id == current_user.id).all()
-    return accounts
+    accounts = await db.scalars(select(BankAccount).where(BankAccount.user_id == current_user.id))
+    return accounts.all()
 
 # POST add new bank account
 @router.post("/", response_model=BankAccountOut)
-def add_bank_account(
+async def add_bank_account(
     bank: BankAccountCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     account = BankAccount(
@@ -36,21 +46,19 @@ def add_bank_account(
         last_sync=datetime.utcnow()
     )
     db.add(account)
-    db.commit()
-    db.refresh(account)
+    await db.commit()
+    await db.refresh(account)
     return account
 
 # Sync a single bank account
 @router.post("/{account_id}/sync/", response_model=dict)
-def sync_bank_account(account_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    account = db.query(BankAccount).filter(BankAccount.id == account_id, BankAccount.user_id == current_user.id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Bank account not found")
-    
+async def sync_bank_account(account_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    account = await get_user_account(db, account_id, current_user.id)
+
     # Example sync logic — replace with real integration later
     account.last_sync = datetime.utcnow()
-    db.commit()
-    db.refresh(account)
+    await db.commit()
+    await db.refresh(account)
 
     return {
         "id": account.id,
@@ -64,16 +72,11 @@ def sync_bank_account(account_id: int, db: Session = Depends(get_db), current_us
 
 # DELETE bank account
 @router.delete("/{account_id}/", status_code=204)
-def delete_bank_account(
+async def delete_bank_account(
     account_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    account = db.query(BankAccount).filter(
-        BankAccount.id == account_id,
-        BankAccount.user_id == current_user.id
-    ).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Bank account not found")
-    db.delete(account)
-    db.commit()
+    account = await get_user_account(db, account_id, current_user.id)
+    await db.delete(account)
+    await db.commit()
@@ -1,16 +1,22 @@
 # server/app/api/v1/routes/currency_tracing.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from datetime import datetime
-import httpx
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+import re
+from typing import List, Dict, Any, Literal, Optional
 
-from app.api.dependencies.db import get_db
 from app.api.dependencies.auth import get_current_user
-from app.models.users import User
+from app.api.dependencies.db import get_async_db
+from app.core.principal_cache import Principal
+from app.core.rate_limiter import rate_limit, CURRENCY_TRACING_LIMIT
+from app.schemas.currency_tracing import RateHistoryOut
+from app.services.currency_trace_service import CurrencyTraceService, TIER_MAX_SPAN, covers, pick_resolution
+from app.services.fx_service import FxUnavailable, fx_rates
 
 router = APIRouter(prefix="/currency-tracing", tags=["Currency Tracing"])
 
+CURRENCY_CODE = re.compile(r"^[A-Z]{3}$")
+
 # Example structure for records returned to frontend
 def format_record(base: str, target: str, rate: float) -> Dict[str, Any]:
     return {
@@ -20,38 +26,73 @@ def format_record(base: str, target: str, rate: float) -> Dict[str, Any]:
         "date": datetime.utcnow(),
     }
 
-@router.get("/", response_model=List[Dict[str, Any]])
+@router.get("/", response_model=List[Dict[str, Any]], dependencies=[rate_limit(CURRENCY_TRACING_LIMIT)])
 async def get_currency_tracing(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
     base: str = "USD",
     targets: str = "EUR,KES,GBP"
 ):
     """
-    Fetch real-time exchange rates for the given base currency
-    and return records for frontend display.
+    Exchange rates for the given base currency as records for frontend
+    display. Served from the shared FX rate cache, not a live call per request.
+    The pairs are recorded as the user's traces, which the sampler follows.
     """
-    target_list = [t.strip().upper() for t in targets.split(",")]
-
-    # Call exchangerate.host API
-    url = f"https://api.exchangerate.host/latest"
-    params = {"base": base, "symbols": ",".join(target_list)}
+    base = base.strip().upper()
+    target_list = [t.strip().upper() for t in targets.split(",") if t.strip()]
+    if not CURRENCY_CODE.match(base) or not all(CURRENCY_CODE.match(t) for t in target_list):
+        raise HTTPException(status_code=400, detail="Currencies must be 3-letter ISO codes")
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=f"Failed to fetch exchange rates: {e}")
-
-    if "rates" not in data:
-        raise HTTPException(status_code=502, detail="Invalid response from exchange rate API")
+        rates = await fx_rates.rates(base, target_list)
+    except FxUnavailable as e:
+        raise HTTPException(status_code=502, detail=str(e))
 
     # Build records dynamically
     records = [
-        format_record(base, target, data["rates"].get(target, 0))
+        format_record(base, target, rates[target] or 0)
         for target in target_list
     ]
 
+    traced = {target: record for target, record in zip(target_list, records) if rates[target] and target != base}
+    await CurrencyTraceService.record(db, current_user.id, base, traced, datetime.utcnow())
     return records
+
+# -------------------
+# Rate history for a traced pair
+# -------------------
+@router.get("/history", response_model=RateHistoryOut, dependencies=[rate_limit(CURRENCY_TRACING_LIMIT)])
+async def get_currency_history(
+    base: str = Query(..., pattern=r"^[A-Za-z]{3}$"),
+    quote: str = Query(..., pattern=r"^[A-Za-z]{3}$"),
+    start: Optional[datetime] = Query(None, description="Defaults to 30 days before end"),
+    end: Optional[datetime] = Query(None, description="Exclusive; defaults to now"),
+    resolution: Optional[Literal["raw", "hour", "day"]] = Query(
+        None, description="Defaults to the finest tier that covers the range"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    OHLC points for a pair the user traces, read from one resolution tier:
+    minutes for up to 2 days, hours for up to 60 days, days beyond that.
+    """
+    base, quote = base.upper(), quote.upper()
+    now = datetime.utcnow()
+    end = end or now
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if resolution and not covers(resolution, start, end):
+        # Otherwise the point limit would silently cut the range short
+        raise HTTPException(
+            status_code=400,
+            detail=f"resolution={resolution} covers at most {TIER_MAX_SPAN[resolution].days} days; "
+                   "use a coarser resolution or omit it",
+        )
+    if not await CurrencyTraceService.is_traced(db, current_user.id, base, quote):
+        raise HTTPException(status_code=404, detail="Not tracing this currency pair")
+
+    resolution = resolution or pick_resolution(start, end, now)
+    points = await CurrencyTraceService.history(db, base, quote, start, end, resolution)
+    return {"base": base, "quote": quote, "resolution": resolution, "start": start, "end": end, "points": points}
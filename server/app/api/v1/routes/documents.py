@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response
 from sqlalchemy.orm import Session
 from pathlib import Path
 import shutil, os
@@ -11,13 +11,17 @@ from app.api.dependencies.auth import get_current_user
 from app.models.users import User
 from app.models.documents import UserDocument
 from app.core.config import settings
+from app.core.rate_limiter import rate_limit, DOCUMENT_UPLOAD_LIMIT
+from app.core.pagination import Keyset, PageParams
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+document_keyset = Keyset(UserDocument.uploaded_at, UserDocument.id)
+
 UPLOAD_DIR = Path(getattr(settings, "UPLOAD_DIR", "uploads"))
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-@router.post("/upload", response_model=dict)
+@router.post("/upload", response_model=dict, dependencies=[rate_limit(DOCUMENT_UPLOAD_LIMIT)])
 async def upload_document(
     file: UploadFile = File(...),
     doc_type: str = Form(...),
@@ -62,10 +66,13 @@ async def upload_document(
 
 @router.get("/", response_model=List[dict])
 def list_user_documents(
+    response: Response,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    documents = db.query(UserDocument).filter(UserDocument.user_id == current_user.id).all()
+    query = document_keyset.apply(db.query(UserDocument).filter(UserDocument.user_id == current_user.id), page)
+    documents = document_keyset.page(query.all(), page, response)
     return [
         {
             "id": doc.id,
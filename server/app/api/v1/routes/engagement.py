@@ -1,60 +1,96 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Response
+from sqlalchemy import false, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from typing import List, Literal, Optional
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.models.users import User
 from app.models.engagement import UserEngagement
 from app.schemas.engagement import EngagementOut
 
 router = APIRouter(prefix="/engagements", tags=["Engagements"])
 
+# Soonest deadline first; engagements without one come last
+engagement_keyset = Keyset(UserEngagement.critical_date, UserEngagement.id, descending=False)
+
+
+async def get_user_engagement(db: AsyncSession, engagement_id: int, user_id: int) -> UserEngagement:
+    engagement = await db.scalar(
+        select(UserEngagement).where(
+            UserEngagement.id == engagement_id,
+            UserEngagement.user_id == user_id
+        )
+    )
+    if not engagement:
+        raise HTTPException(status_code=404, detail="Engagement not found")
+    return engagement
+
+
+def status_filter(status: str, now: datetime, within_days: int):
+    """WHERE criteria for the ?status= filter on the engagements list."""
+    not_snoozed = or_(UserEngagement.snoozed_until.is_(None), UserEngagement.snoozed_until <= now)
+    if status == "done":
+        return [UserEngagement.is_done == true()]
+    if status == "open":
+        return [UserEngagement.is_done == false(), not_snoozed]
+    if status == "snoozed":
+        return [UserEngagement.is_done == false(), UserEngagement.snoozed_until > now]
+    if status == "overdue":
+        return [UserEngagement.is_done == false(), UserEngagement.critical_date < now]
+    # upcoming
+    return [
+        UserEngagement.is_done == false(),
+        not_snoozed,
+        UserEngagement.critical_date >= now,
+        UserEngagement.critical_date <= now + timedelta(days=within_days),
+    ]
+
 # GET /api/v1/engagements
 @router.get("/", response_model=List[EngagementOut])
-def get_engagements(
-    db: Session = Depends(get_db),
+async def get_engagements(
+    response: Response,
+    page: PageParams = Depends(),
+    status: Optional[Literal["open", "done", "snoozed", "overdue", "upcoming"]] = Query(None),
+    within_days: int = Query(7, ge=1, le=365, description="Window for status=upcoming"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    engagements = db.query(UserEngagement).filter(UserEngagement.user_id == current_user.id).all()
-    return engagements  # Pydantic schema handles JSON serialization
+    stmt = select(UserEngagement).where(UserEngagement.user_id == current_user.id)
+    if status:
+        stmt = stmt.where(*status_filter(status, datetime.utcnow(), within_days))
+    stmt = engagement_keyset.apply(stmt, page)
+    engagements = await db.scalars(stmt)
+    return engagement_keyset.page(engagements.all(), page, response)  # Pydantic schema handles JSON serialization
 
 # POST /api/v1/engagements/{id}/done
 @router.post("/{engagement_id}/done", response_model=EngagementOut)
-def mark_done(
+async def mark_done(
     engagement_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    engagement = db.query(UserEngagement).filter(
-        UserEngagement.id == engagement_id,
-        UserEngagement.user_id == current_user.id
-    ).first()
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
+    engagement = await get_user_engagement(db, engagement_id, current_user.id)
 
     engagement.is_done = True
-    db.commit()
-    db.refresh(engagement)
+    await db.commit()
+    await db.refresh(engagement)
     return engagement
 
 # POST /api/v1/engagements/{id}/snooze
 @router.post("/{engagement_id}/snooze", response_model=EngagementOut)
-def snooze_engagement(
+async def snooze_engagement(
     engagement_id: int,
     snoozed_until: datetime = Body(..., embed=True),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    engagement = db.query(UserEngagement).filter(
-        UserEngagement.id == engagement_id,
-        UserEngagement.user_id == current_user.id
-    ).first()
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
+    engagement = await get_user_engagement(db, engagement_id, current_user.id)
 
     engagement.snoozed_until = snoozed_until
-    db.commit()
-    db.refresh(engagement)
-    return engagement
\ No newline at end of file
+    engagement.reminded_at = None  # remind again once the snooze is over
+    await db.commit()
+    await db.refresh(engagement)
+    return engagement
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pathlib import Path
+from typing import Optional
+import os
+
+from app.api.dependencies.auth import get_current_user
+from app.core.config import settings
+from app.models.users import User
+from app.schemas.fx import CURRENCY_PATTERN
+from app.services.import_service import DEFAULT_CURRENCY, ExpenseImportService, ImportJobStore, IMPORT_FORMATS
+
+router = APIRouter(prefix="/expenses/import", tags=["Expense Import"])
+
+IMPORT_DIR = Path(getattr(settings, "UPLOAD_DIR", "uploads")) / "imports"
+os.makedirs(IMPORT_DIR, exist_ok=True)
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def detect_format(filename: str, fmt: Optional[str]) -> str:
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        suffix = Path(filename or "").suffix.lower().lstrip(".")
+        fmt = "ofx" if suffix in ("ofx", "qfx") else suffix
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported file; upload a .csv or .ofx/.qfx statement")
+    return fmt
+
+
+# -------------------
+# Start an import job
+# -------------------
+@router.post("/", status_code=status.HTTP_202_ACCEPTED)
+async def import_expenses(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    currency: str = Form(DEFAULT_CURRENCY, pattern=CURRENCY_PATTERN, description="For rows the statement gives no currency for"),
+    current_user: User = Depends(get_current_user),
+):
+    fmt = detect_format(file.filename, format)
+    job_id = await run_in_threadpool(ImportJobStore.create, current_user.id, file.filename or "", fmt)
+
+    # Spool to disk so the background job can parse incrementally after the request ends
+    path = IMPORT_DIR / f"{job_id}.{fmt}"
+    with open(path, "wb") as out:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            out.write(chunk)
+
+    background_tasks.add_task(ExpenseImportService.run, job_id, current_user.id, str(path), fmt, currency)
+    return {"job_id": job_id, "status": "queued"}
+
+
+# -------------------
+# Import progress and per-row errors
+# -------------------
+@router.get("/{job_id}")
+def get_import_job(job_id: str, current_user: User = Depends(get_current_user)):
+    job = ImportJobStore.get(job_id)
+    if not job or job["user_id"] != current_user.id:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
@@ -1,64 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.models.users import User
 from app.models.expenses import Expense
-from app.schemas.expenses import ExpenseCreate, ExpenseUpdate, ExpenseOut
+from app.schemas.expenses import ExpenseCreate, ExpenseUpdate, ExpenseOut, ExpenseBatch, ExpenseBatchOut
+from app.services.batch_service import BatchService
 from datetime import datetime
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
+expense_keyset = Keyset(Expense.date, Expense.id)
+EXPENSE_BATCH_FIELDS = ("category", "amount", "currency", "description", "date")
+
+
+async def get_user_expense(db: AsyncSession, expense_id: int, user_id: int) -> Expense:
+    expense = await db.scalar(
+        select(Expense).where(Expense.id == expense_id, Expense.user_id == user_id)
+    )
+    if not expense:
+        raise HTTPException(status_code=404, detail="Expense not found")
+    return expense
+
 # -------------------
 # List expenses
 # -------------------
 @router.get("/", response_model=List[ExpenseOut])
-def list_expenses(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    expenses = db.query(Expense).filter(Expense.user_id == current_user.id).all()
-    return expenses
+async def list_expenses(response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    stmt = expense_keyset.apply(select(Expense).where(Expense.user_id == current_user.id), page)
+    expenses = await db.scalars(stmt)
+    return expense_keyset.page(expenses.all(), page, response)
 
 # -------------------
 # Create expense
 # -------------------
 @router.post("/", response_model=ExpenseOut)
-def create_expense(expense_in: ExpenseCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_expense(expense_in: ExpenseCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     expense = Expense(
         user_id=current_user.id,
         category=expense_in.category,
         amount=expense_in.amount,
+        currency=expense_in.currency,
         description=expense_in.description,
         date=expense_in.date or datetime.utcnow()
     )
     db.add(expense)
-    db.commit()
-    db.refresh(expense)
+    await db.commit()
+    await db.refresh(expense)
     return expense
 
+# -------------------
+# Batch create / update / delete
+# -------------------
+@router.post("/batch", response_model=ExpenseBatchOut)
+async def batch_expenses(batch: ExpenseBatch, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    results = await BatchService.apply(db, Expense, current_user.id, batch, EXPENSE_BATCH_FIELDS)
+    return {"results": results}
+
 # -------------------
 # Update expense
 # -------------------
 @router.put("/{expense_id}/", response_model=ExpenseOut)
-def update_expense(expense_id: int, expense_in: ExpenseUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    expense = db.query(Expense).filter(Expense.id == expense_id, Expense.user_id == current_user.id).first()
-    if not expense:
-        raise HTTPException(status_code=404, detail="Expense not found")
-    
+async def update_expense(expense_id: int, expense_in: ExpenseUpdate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    expense = await get_user_expense(db, expense_id, current_user.id)
+
     for field, value in expense_in.dict(exclude_unset=True).items():
         setattr(expense, field, value)
-    
-    db.commit()
-    db.refresh(expense)
+
+    await db.commit()
+    await db.refresh(expense)
     return expense
 
 # -------------------
 # Delete expense
 # -------------------
 @router.delete("/{expense_id}/", status_code=status.HTTP_204_NO_CONTENT)
-def delete_expense(expense_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    expense = db.query(Expense).filter(Expense.id == expense_id, Expense.user_id == current_user.id).first()
-    if not expense:
-        raise HTTPException(status_code=404, detail="Expense not found")
-    db.delete(expense)
-    db.commit()
+async def delete_expense(expense_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    expense = await get_user_expense(db, expense_id, current_user.id)
+    await db.delete(expense)
+    await db.commit()
     return {"detail": "Expense deleted successfully"}
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Optional
+
+from app.api.dependencies.auth import get_current_user
+from app.models.users import User
+from app.services.export_service import ExportService, EXPORT_DATASETS, EXPORT_FORMATS
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+# -------------------
+# Stream a user's financial history
+# -------------------
+@router.get("/{dataset}", response_class=StreamingResponse)
+def export_history(
+    dataset: str,
+    format: str = Query("csv", description="csv | ndjson"),
+    start: Optional[datetime] = Query(None, description="Inclusive lower bound on the record date"),
+    end: Optional[datetime] = Query(None, description="Exclusive upper bound on the record date"),
+    gzip: bool = Query(False, description="Compress the file on the fly (.gz download)"),
+    current_user: User = Depends(get_current_user),
+):
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail=f"Unknown dataset; expected one of {', '.join(EXPORT_DATASETS)}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format; expected one of {', '.join(EXPORT_FORMATS)}")
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    filename = f"{dataset}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        ExportService.stream(dataset, current_user.id, format, gzip, start, end),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
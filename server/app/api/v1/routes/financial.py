@@ -1,61 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
-from sqlalchemy import or_
+import json
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_db, get_read_db
 from app.api.dependencies.auth import get_current_user
 from app.models.users import User
 from app.models.financial import FinancialModule, Section, QuizQuestion
-from app.schemas.financial import FinancialModuleCreate, FinancialModuleUpdate
+from app.schemas.financial import FinancialModuleCreate, FinancialModuleUpdate, SectionSearchHit
+from app.core.http_cache import etag_for, json_response, not_modified, not_modified_response, validator_headers
+from app.services.financial_catalog import load_modules, module_catalog, module_to_out, own_modules_version
+from app.services.module_service import ModuleService
+from app.services.section_search import SectionSearchService, normalize_tags
 
 router = APIRouter(prefix="/financial-modules", tags=["Financial Modules"])
 
 # -------------------
-# Helpers to convert DB objects to frontend-friendly dicts
+# List Modules
 # -------------------
-def section_to_out(section: Section):
-    return {
-        "id": section.id,
-        "title": section.title,
-        "content": section.content,
-        "lastUpdated": section.last_updated.isoformat() if section.last_updated else None,
-        "reviewedBy": section.reviewed_by or "",
-        "region": section.region,
-        "tags": section.tags.split(",") if section.tags else [],
-        "downloadUrl": section.download_url  # <-- add this
-
-    }
-
-def quiz_to_out(quiz: QuizQuestion):
-    return {
-        "id": quiz.id,
-        "moduleId": quiz.module_id,
-        "sectionId": getattr(quiz, "section_id", None),  # include if sections are needed
-        "question": quiz.question,
-        "options": quiz.options.split(",") if quiz.options else [],
-        "answer": quiz.answer
-    }
-
-def module_to_out(module: FinancialModule):
-    return {
-        "id": module.id,
-        "user_id": module.user_id,
-        "title": module.title,
-        "sections": [section_to_out(s) for s in module.sections],
-        "quiz": [quiz_to_out(q) for q in module.quiz]
-    }
+@router.get("/", response_model=List[dict])
+def list_modules(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    cache_control = "private, no-cache"
+
+    # Both versions known: a revalidation is answered without touching the DB
+    catalog_validators = module_catalog.validators()
+    own_version = own_modules_version(current_user.id).current()
+    if catalog_validators and own_version:
+        etag = etag_for(catalog_validators[0], own_version.tag)
+        last_modified = max(catalog_validators[1], own_version.modified)
+        if not_modified(request, etag, last_modified):
+            return not_modified_response(validator_headers(etag, last_modified, cache_control))
+
+    # Global catalog comes pre-serialized from the cache; only the user's own modules are loaded per request
+    catalog = module_catalog.get(db)
+    own = json.dumps(
+        [module_to_out(m) for m in load_modules(db, FinancialModule.user_id == current_user.id)],
+        separators=(",", ":"),
+    )[1:-1]
+
+    if catalog.last_modified is not None and own_version:
+        etag = etag_for(catalog.etag, own_version.tag)
+        last_modified = max(catalog.last_modified, own_version.modified)
+    else:
+        etag, last_modified = etag_for(catalog.etag, own), None
+    headers = validator_headers(etag, last_modified, cache_control)
+    if not_modified(request, etag, last_modified):
+        return not_modified_response(headers)
+
+    body = "[" + ",".join(part for part in (catalog.body, own) if part) + "]"
+    return json_response(body, headers)
 
 # -------------------
-# List Modules
+# Search Sections
 # -------------------
-@router.get("/", response_model=List[dict])
-def list_modules(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    modules = db.query(FinancialModule).filter(
-    or_(FinancialModule.user_id == current_user.id, FinancialModule.user_id == None)
-    ).all()
-    return [module_to_out(m) for m in modules]
+@router.get("/search", response_model=List[SectionSearchHit])
+def search_sections(
+    q: Optional[str] = Query(None, max_length=200, description='Web-search syntax: words, "phrases", -excluded, or'),
+    tags: Optional[List[str]] = Query(None, description="Sections must carry every tag; repeat or comma-separate"),
+    region: Optional[str] = Query(None, max_length=50),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    q = (q or "").strip() or None
+    tags = normalize_tags(tags)
+    if not q and not tags:
+        raise HTTPException(status_code=400, detail="Provide a search query or at least one tag")
+    return SectionSearchService.search(db, current_user.id, q, tags, region, limit, offset)
 
 # -------------------
 # Create Module
@@ -92,6 +105,7 @@ def create_module(module_in: FinancialModuleCreate, db: Session = Depends(get_db
 
     db.commit()
     db.refresh(module)
+    module_catalog.invalidate()  # created as a global module
     return module_to_out(module)
 
 # -------------------
@@ -103,35 +117,12 @@ def update_module(module_id: int, module_in: FinancialModuleUpdate, db: Session
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
 
-    module.title = module_in.title
-
-    # Delete all sections and quizzes for a simple overwrite
-    db.query(Section).filter(Section.module_id == module.id).delete()
-    db.query(QuizQuestion).filter(QuizQuestion.module_id == module.id).delete()
-
-    for s in module_in.sections or []:
-        section = Section(
-            module_id=module.id,
-            title=s.title,
-            content=s.content,
-            last_updated=s.last_updated or datetime.utcnow(),
-            reviewed_by=s.reviewed_by,
-            region=s.region,
-            tags=",".join(s.tags)
-        )
-        db.add(section)
-
-    for q in module_in.quiz or []:
-        quiz = QuizQuestion(
-            module_id=module.id,
-            question=q.question,
-            options=",".join(q.options),
-            answer=q.answer
-        )
-        db.add(quiz)
+    # Apply only what changed; unchanged sections and questions keep their ids
+    ModuleService.apply_update(db, module, module_in)
 
     db.commit()
     db.refresh(module)
+    own_modules_version(current_user.id).bump()
     return module_to_out(module)
 
 # -------------------
@@ -144,4 +135,5 @@ def delete_module(module_id: int, db: Session = Depends(get_db), current_user: U
         raise HTTPException(status_code=404, detail="Module not found")
     db.delete(module)
     db.commit()
+    own_modules_version(current_user.id).bump()
     return {"detail": "Module deleted successfully"}
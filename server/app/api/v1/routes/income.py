@@ -1,63 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.models.users import User
 from app.models.income import Income
-from app.schemas.income import IncomeCreate, IncomeUpdate, IncomeOut
+from app.schemas.income import IncomeCreate, IncomeUpdate, IncomeOut, IncomeBatch, IncomeBatchOut
+from app.services.batch_service import BatchService
 from datetime import datetime
 
 router = APIRouter(prefix="/income", tags=["Income"])
 
+income_keyset = Keyset(Income.date, Income.id)
+INCOME_BATCH_FIELDS = ("amount", "currency", "description", "date")
+
+
+async def get_user_income(db: AsyncSession, income_id: int, user_id: int) -> Income:
+    income = await db.scalar(
+        select(Income).where(Income.id == income_id, Income.user_id == user_id)
+    )
+    if not income:
+        raise HTTPException(status_code=404, detail="Income not found")
+    return income
+
 # -------------------
 # List incomes
 # -------------------
 @router.get("/", response_model=List[IncomeOut])
-def list_incomes(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    incomes = db.query(Income).filter(Income.user_id == current_user.id).all()
-    return incomes
+async def list_incomes(response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    stmt = income_keyset.apply(select(Income).where(Income.user_id == current_user.id), page)
+    incomes = await db.scalars(stmt)
+    return income_keyset.page(incomes.all(), page, response)
 
 # -------------------
 # Create income
 # -------------------
 @router.post("/", response_model=IncomeOut)
-def create_income(income_in: IncomeCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_income(income_in: IncomeCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     income = Income(
         user_id=current_user.id,
         amount=income_in.amount,
+        currency=income_in.currency,
         description=income_in.description,
         date=income_in.date or datetime.utcnow()
     )
     db.add(income)
-    db.commit()
-    db.refresh(income)
+    await db.commit()
+    await db.refresh(income)
     return income
 
+# -------------------
+# Batch create / update / delete
+# -------------------
+@router.post("/batch", response_model=IncomeBatchOut)
+async def batch_income(batch: IncomeBatch, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    results = await BatchService.apply(db, Income, current_user.id, batch, INCOME_BATCH_FIELDS)
+    return {"results": results}
+
 # -------------------
 # Update income
 # -------------------
 @router.put("/{income_id}/", response_model=IncomeOut)
-def update_income(income_id: int, income_in: IncomeUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    income = db.query(Income).filter(Income.id == income_id, Income.user_id == current_user.id).first()
-    if not income:
-        raise HTTPException(status_code=404, detail="Income not found")
-    
+async def update_income(income_id: int, income_in: IncomeUpdate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    income = await get_user_income(db, income_id, current_user.id)
+
     for field, value in income_in.dict(exclude_unset=True).items():
         setattr(income, field, value)
-    
-    db.commit()
-    db.refresh(income)
+
+    await db.commit()
+    await db.refresh(income)
     return income
 
 # -------------------
 # Delete income
 # -------------------
 @router.delete("/{income_id}/", status_code=status.HTTP_204_NO_CONTENT)
-def delete_income(income_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    income = db.query(Income).filter(Income.id == income_id, Income.user_id == current_user.id).first()
-    if not income:
-        raise HTTPException(status_code=404, detail="Income not found")
-    db.delete(income)
-    db.commit()
+async def delete_income(income_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    income = await get_user_income(db, income_id, current_user.id)
+    await db.delete(income)
+    await db.commit()
     return {"detail": "Income deleted successfully"}
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List
+
+from app.api.dependencies.db import get_async_db
+from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
+from app.models.users import User
+from app.models.notification import Notification
+from app.schemas.notification import NotificationOut
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"])
+
+notification_keyset = Keyset(Notification.created_at, Notification.id)
+
+# GET /api/v1/notifications
+@router.get("/", response_model=List[NotificationOut])
+async def list_notifications(
+    response: Response,
+    page: PageParams = Depends(),
+    unread: bool = Query(False, description="Only notifications not marked read"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    stmt = select(Notification).where(Notification.user_id == current_user.id)
+    if unread:
+        stmt = stmt.where(Notification.read_at.is_(None))
+    notifications = await db.scalars(notification_keyset.apply(stmt, page))
+    return notification_keyset.page(notifications.all(), page, response)
+
+# POST /api/v1/notifications/{id}/read
+@router.post("/{notification_id}/read", response_model=NotificationOut)
+async def mark_read(
+    notification_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    notification = await db.scalar(
+        select(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == current_user.id
+        )
+    )
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+
+    if notification.read_at is None:
+        notification.read_at = datetime.utcnow()
+        await db.commit()
+        await db.refresh(notification)
+    return notification
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime, timedelta
+from app.api.dependencies.db import get_async_db
+from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
+from app.models.users import User
+from app.models.payments import PaymentRecurrence
+from app.schemas.payments import RecurrenceCreate, RecurrenceUpdate, RecurrenceOut, OccurrenceOut
+from app.services.recurrence_service import RecurrenceService, OCCURRENCE_MAX_WINDOW_DAYS, occurrence_at
+
+router = APIRouter(prefix="/payments", tags=["Recurring Payments"])
+
+recurrence_keyset = Keyset(PaymentRecurrence.id, descending=False)
+
+
+async def get_user_recurrence(db: AsyncSession, recurrence_id: int, user_id: int) -> PaymentRecurrence:
+    rule = await db.scalar(
+        select(PaymentRecurrence).where(
+            PaymentRecurrence.id == recurrence_id,
+            PaymentRecurrence.user_id == user_id
+        )
+    )
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring payment not found")
+    return rule
+
+# -------------------
+# List recurring payments
+# -------------------
+@router.get("/recurrences/", response_model=List[RecurrenceOut])
+async def list_recurrences(response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    stmt = recurrence_keyset.apply(
+        select(PaymentRecurrence).where(PaymentRecurrence.user_id == current_user.id), page
+    )
+    return recurrence_keyset.page((await db.scalars(stmt)).all(), page, response)
+
+# -------------------
+# Create recurring payment
+# -------------------
+@router.post("/recurrences/", response_model=RecurrenceOut)
+async def create_recurrence(rule_in: RecurrenceCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    if rule_in.until and rule_in.until < rule_in.starts_at:
+        raise HTTPException(status_code=400, detail="until must not be before starts_at")
+
+    # Occurrences are created by the payment_recurrences job; until then they
+    # show up in /payments/occurrences expanded from the rule
+    rule = PaymentRecurrence(user_id=current_user.id, next_index=0, **rule_in.dict())
+    rule.next_occurrence_at = occurrence_at(rule, 0)
+    db.add(rule)
+    await db.commit()
+    await db.refresh(rule)
+    return rule
+
+# -------------------
+# Update recurring payment
+# -------------------
+@router.put("/recurrences/{recurrence_id}/", response_model=RecurrenceOut)
+async def update_recurrence(recurrence_id: int, rule_in: RecurrenceUpdate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    rule = await get_user_recurrence(db, recurrence_id, current_user.id)
+
+    for field, value in rule_in.dict(exclude_unset=True).items():
+        setattr(rule, field, value)
+    if rule.until and rule.until < rule.starts_at:
+        raise HTTPException(status_code=400, detail="until must not be before starts_at")
+
+    # Upcoming occurrences regenerate from the edited rule; past ones are kept
+    now = datetime.utcnow()
+    await RecurrenceService.drop_future(db, rule.id, now)
+    RecurrenceService.reset(rule, now)
+    await db.commit()
+    await db.refresh(rule)
+    return rule
+
+# -------------------
+# Delete recurring payment
+# -------------------
+@router.delete("/recurrences/{recurrence_id}/", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurrence(recurrence_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    rule = await get_user_recurrence(db, recurrence_id, current_user.id)
+    # Past occurrences stay as ordinary scheduled payments
+    await RecurrenceService.drop_future(db, rule.id, datetime.utcnow())
+    await db.delete(rule)
+    await db.commit()
+    return {"detail": "Recurring payment deleted successfully"}
+
+# -------------------
+# Payments calendar (one-off and recurring) for a window
+# -------------------
+@router.get("/occurrences", response_model=List[OccurrenceOut])
+async def list_occurrences(
+    start: Optional[datetime] = Query(None, description="Inclusive; defaults to now"),
+    end: Optional[datetime] = Query(None, description="Exclusive; defaults to one year after start"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    start = start or datetime.utcnow()
+    end = end or start + timedelta(days=365)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if end - start > timedelta(days=OCCURRENCE_MAX_WINDOW_DAYS):
+        raise HTTPException(status_code=400, detail=f"Window is limited to {OCCURRENCE_MAX_WINDOW_DAYS} days")
+    return await RecurrenceService.list_occurrences(db, current_user.id, start, end)
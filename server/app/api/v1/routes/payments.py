@@ -1,39 +1,57 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.models.users import User
 from app.models.payments import ScheduledPayment, PaymentStatus
 from app.schemas.payments import PaymentCreate, PaymentUpdate, PaymentOut
+from app.services.scheduled_payment_service import effective_status
 
 router = APIRouter(prefix="/payments", tags=["Scheduled Payments"])
 
+# Upcoming payments first
+payment_keyset = Keyset(ScheduledPayment.scheduled_date, ScheduledPayment.id, descending=False)
+
+
+async def get_user_payment(db: AsyncSession, payment_id: int, user_id: int) -> ScheduledPayment:
+    payment = await db.scalar(
+        select(ScheduledPayment).where(
+            ScheduledPayment.id == payment_id,
+            ScheduledPayment.user_id == user_id
+        )
+    )
+    if not payment:
+        raise HTTPException(status_code=404, detail="Scheduled payment not found")
+    return payment
+
 # -------------------
 # List scheduled payments
 # -------------------
 @router.get("/", response_model=List[PaymentOut])
-def list_scheduled_payments(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    payments = db.query(ScheduledPayment).filter(ScheduledPayment.user_id == current_user.id).all()
-    
-    # Automatically mark overdue payments as due
-    today = datetime.utcnow()
-    updated = False
-    for p in payments:
-        if p.status == PaymentStatus.pending and p.scheduled_date < today:
-            p.status = PaymentStatus.due
-            updated = True
-    if updated:
-        db.commit()
-    
-    return payments
+async def list_scheduled_payments(response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    stmt = payment_keyset.apply(
+        select(ScheduledPayment).where(ScheduledPayment.user_id == current_user.id), page
+    )
+    payments = payment_keyset.page((await db.scalars(stmt)).all(), page, response)
+
+    # Read-only: the payments_due job persists pending -> due; until it gets
+    # to a row, report the status it is about to have
+    now = datetime.utcnow()
+    return [
+        PaymentOut.from_orm(p).copy(update={"status": PaymentStatus.due})
+        if effective_status(p, now) != p.status else p
+        for p in payments
+    ]
 
 # -------------------
 # Create scheduled payment
 # -------------------
 @router.post("/", response_model=PaymentOut)
-def create_scheduled_payment(payment_in: PaymentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_scheduled_payment(payment_in: PaymentCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     # Determine initial status
     status = PaymentStatus.pending
     if payment_in.scheduled_date < datetime.utcnow():
@@ -47,52 +65,37 @@ def create_scheduled_payment(payment_in: PaymentCreate, db: Session = Depends(ge
         status=status
     )
     db.add(payment)
-    db.commit()
-    db.refresh(payment)
+    await db.commit()
+    await db.refresh(payment)
     return payment
 
 # -------------------
 # Update scheduled payment
 # -------------------
 @router.put("/{payment_id}/", response_model=PaymentOut)
-def update_scheduled_payment(payment_id: int, payment_in: PaymentUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    payment = db.query(ScheduledPayment).filter(
-        ScheduledPayment.id == payment_id, 
-        ScheduledPayment.user_id == current_user.id
-    ).first()
-    if not payment:
-        raise HTTPException(status_code=404, detail="Scheduled payment not found")
-    
+async def update_scheduled_payment(payment_id: int, payment_in: PaymentUpdate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    payment = await get_user_payment(db, payment_id, current_user.id)
+
     for field, value in payment_in.dict(exclude_unset=True).items():
         setattr(payment, field, value)
-    
-    db.commit()
-    db.refresh(payment)
+
+    await db.commit()
+    await db.refresh(payment)
     return payment
 @router.put("/{payment_id}/mark-done", response_model=PaymentOut)
-def mark_scheduled_payment_done(payment_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    payment = db.query(ScheduledPayment).filter(
-        ScheduledPayment.id == payment_id,
-        ScheduledPayment.user_id == current_user.id
-    ).first()
-    if not payment:
-        raise HTTPException(status_code=404, detail="Scheduled payment not found")
-    
+async def mark_scheduled_payment_done(payment_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    payment = await get_user_payment(db, payment_id, current_user.id)
+
     payment.status = PaymentStatus.done
-    db.commit()
-    db.refresh(payment)
+    await db.commit()
+    await db.refresh(payment)
     return payment
 # -------------------
 # Delete scheduled payment
 # -------------------
 @router.delete("/{payment_id}/", status_code=status.HTTP_204_NO_CONTENT)
-def delete_scheduled_payment(payment_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    payment = db.query(ScheduledPayment).filter(
-        ScheduledPayment.id == payment_id, 
-        ScheduledPayment.user_id == current_user.id
-    ).first()
-    if not payment:
-        raise HTTPException(status_code=404, detail="Scheduled payment not found")
-    db.delete(payment)
-    db.commit()
+async def delete_scheduled_payment(payment_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    payment = await get_user_payment(db, payment_id, current_user.id)
+    await db.delete(payment)
+    await db.commit()
     return {"detail": "Scheduled payment deleted successfully"}
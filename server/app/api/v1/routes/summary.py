@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+from typing import Optional
+from app.api.dependencies.db import get_async_db
+from app.api.dependencies.auth import get_current_user
+from app.models.users import User
+from app.schemas.fx import CURRENCY_PATTERN, ConvertedSummaryOut
+from app.schemas.summary import SummaryOut
+from app.services.conversion_service import ConversionService
+from app.services.rollup_service import RollupService, SUMMARY_MAX_MONTHS, add_months, month_start, months_between
+
+router = APIRouter(prefix="/summary", tags=["Summary"])
+
+
+def month_range(start: Optional[date], end: Optional[date]):
+    end = month_start(end or datetime.utcnow().date())
+    start = month_start(start) if start else add_months(end, -11)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if months_between(start, end) >= SUMMARY_MAX_MONTHS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {SUMMARY_MAX_MONTHS} months")
+    return start, end
+
+
+# -------------------
+# Per-currency spending summary from the monthly rollup
+# -------------------
+@router.get("/", response_model=SummaryOut)
+async def get_summary(
+    start: Optional[date] = Query(None, description="First month (any day in it); defaults to 11 months before end"),
+    end: Optional[date] = Query(None, description="Last month (any day in it); defaults to the current month"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    start, end = month_range(start, end)
+    return await RollupService.summary(db, current_user.id, start, end)
+
+# -------------------
+# Totals converted to one reporting currency
+# -------------------
+@router.get("/converted", response_model=ConvertedSummaryOut)
+async def get_converted_summary(
+    currency: str = Query("USD", pattern=CURRENCY_PATTERN, description="Reporting currency"),
+    start: Optional[date] = Query(None, description="First month (any day in it); defaults to 11 months before end"),
+    end: Optional[date] = Query(None, description="Last month (any day in it); defaults to the current month"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    start, end = month_range(start, end)
+    result = await ConversionService.summary(db, current_user.id, currency, start, end)
+    if result is None:
+        raise HTTPException(status_code=400, detail=f"No exchange rate history for {currency}")
+    return result
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
 from datetime import datetime
 
-from app.api.dependencies.db import get_db
+from app.api.dependencies.db import get_async_db
 from app.api.dependencies.auth import get_current_user
+from app.core.pagination import Keyset, PageParams
 from app.schemas.support_ticket import (
     SupportTicketCreate,
     SupportTicketUpdate,
@@ -14,18 +17,38 @@ from app.models.support_ticket import SupportTicket
 
 router = APIRouter(prefix="/support-tickets", tags=["Support Tickets"])
 
+ticket_keyset = Keyset(SupportTicket.created_on, SupportTicket.id)
+
+
+def user_tickets(user_id: int):
+    # `user_name` reads the relationship, which can't lazy-load on an async session
+    return (
+        select(SupportTicket)
+        .options(selectinload(SupportTicket.user))
+        .where(SupportTicket.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def get_user_ticket(db: AsyncSession, ticket_id: int, user_id: int) -> SupportTicket:
+    ticket = await db.scalar(user_tickets(user_id).where(SupportTicket.id == ticket_id))
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    return ticket
+
 # -------------------
 # List all tickets for the current user
 # -------------------
 @router.get("/", response_model=List[SupportTicketOut])
-def list_tickets(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    return db.query(SupportTicket).filter(SupportTicket.user_id == user.id).order_by(SupportTicket.created_on.desc()).all()
+async def list_tickets(response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user)):
+    tickets = await db.scalars(ticket_keyset.apply(user_tickets(user.id), page))
+    return ticket_keyset.page(tickets.all(), page, response)
 
 # -------------------
 # Create a ticket
 # -------------------
 @router.post("/", response_model=SupportTicketOut)
-def create_ticket(ticket_in: SupportTicketCreate, db: Session = Depends(get_db), user=Depends(get_current_user)):
+async def create_ticket(ticket_in: SupportTicketCreate, db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user)):
     ticket = SupportTicket(
         subject=ticket_in.subject,
         description=ticket_in.description,
@@ -33,36 +56,30 @@ def create_ticket(ticket_in: SupportTicketCreate, db: Session = Depends(get_db),
         user_id=user.id
     )
     db.add(ticket)
-    db.commit()
-    db.refresh(ticket)
-    return ticket
+    await db.commit()
+    return await get_user_ticket(db, ticket.id, user.id)
 
 # -------------------
 # Update a ticket
 # -------------------
 @router.put("/{ticket_id}/", response_model=SupportTicketOut)
-def update_ticket(ticket_id: int, ticket_in: SupportTicketUpdate, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    ticket = db.query(SupportTicket).filter(SupportTicket.id == ticket_id, SupportTicket.user_id == user.id).first()
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found")
+async def update_ticket(ticket_id: int, ticket_in: SupportTicketUpdate, db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user)):
+    ticket = await get_user_ticket(db, ticket_id, user.id)
 
     for field, value in ticket_in.dict(exclude_unset=True).items():
         setattr(ticket, field, value)
 
     ticket.last_updated = datetime.utcnow()
-    db.commit()
-    db.refresh(ticket)
-    return ticket
+    await db.commit()
+    return await get_user_ticket(db, ticket.id, user.id)
 
 # -------------------
 # Delete a ticket
 # -------------------
 @router.delete("/{ticket_id}/", status_code=status.HTTP_204_NO_CONTENT)
-def delete_ticket(ticket_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    ticket = db.query(SupportTicket).filter(SupportTicket.id == ticket_id, SupportTicket.user_id == user.id).first()
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found")
+async def delete_ticket(ticket_id: int, db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user)):
+    ticket = await get_user_ticket(db, ticket_id, user.id)
 
-    db.delete(ticket)
-    db.commit()
+    await db.delete(ticket)
+    await db.commit()
     return {"detail": "Ticket deleted"}
@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.api.dependencies.db import get_db
 from app.api.dependencies.auth import get_current_user
+from app.core.config import settings
+from app.core.http_cache import json_response, not_modified, not_modified_response, validator_headers
 from app.schemas.tax_resource import (
     TaxResourceCreate,
     TaxResourceUpdate,
     TaxResourceOut
 )
 from app.models.tax_resource import TaxResource
+from app.services.tax_resource_catalog import tax_resources_cache
 
 router = APIRouter(prefix="/tax-resources", tags=["Tax Resources"])
 
@@ -17,8 +20,22 @@ router = APIRouter(prefix="/tax-resources", tags=["Tax Resources"])
 # List all resources
 # -------------------
 @router.get("/", response_model=List[TaxResourceOut])
-def list_resources(db: Session = Depends(get_db)):
-    return db.query(TaxResource).order_by(TaxResource.created_at.desc()).all()
+def list_resources(request: Request, db: Session = Depends(get_db)):
+    # Same for every caller, so shared caches (CDN, nginx) may store it too
+    cache_control = (
+        f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_SECONDS}"
+    )
+
+    validators = tax_resources_cache.validators()
+    if validators and not_modified(request, *validators):
+        return not_modified_response(validator_headers(*validators, cache_control))
+
+    cached = tax_resources_cache.get(db)
+    headers = validator_headers(cached.etag, cached.last_modified, cache_control)
+    if not_modified(request, cached.etag, cached.last_modified):
+        return not_modified_response(headers)
+    return json_response(cached.body, headers)
 
 
 # -------------------
@@ -38,6 +55,7 @@ def create_resource(resource_in: TaxResourceCreate, db: Session = Depends(get_db
     db.add(resource)
     db.commit()
     db.refresh(resource)
+    tax_resources_cache.invalidate()
     return resource
 
 
@@ -55,6 +73,7 @@ def update_resource(resource_id: int, resource_in: TaxResourceUpdate, db: Sessio
 
     db.commit()
     db.refresh(resource)
+    tax_resources_cache.invalidate()
     return resource
 
 
@@ -69,4 +88,5 @@ def delete_resource(resource_id: int, db: Session = Depends(get_db)):
 
     db.delete(resource)
     db.commit()
+    tax_resources_cache.invalidate()
     return {"detail": "Resource deleted"}
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.schemas.auth import UpdateUserProfileRequest, UserResponse
 from app.api.dependencies.db import get_db
-from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.auth import get_current_db_user
 from app.core.decorators.require_auth import require_auth
 from app.core.decorators.handle_exceptions import handle_exceptions
 from app.services.auth_service import AuthService
@@ -17,7 +17,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 def update_current_user(
     data: UpdateUserProfileRequest = Body(...),
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_db_user),
 ):
     """
     Update fields of the currently authenticated user.
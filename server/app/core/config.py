@@ -40,6 +40,25 @@ class Settings(BaseSettings):
         """Async SQLAlchemy connection string (if using async ORM)."""
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    # Connection pool (applies to each engine, per worker process)
+    DB_POOL_SIZE: int = Field(5, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(10, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT_SECONDS: float = Field(30.0, env="DB_POOL_TIMEOUT_SECONDS")  # wait for a free connection
+    DB_POOL_RECYCLE_SECONDS: int = Field(1800, env="DB_POOL_RECYCLE_SECONDS")  # -1 disables
+    DB_POOL_PRE_PING: bool = Field(True, env="DB_POOL_PRE_PING")  # ping on checkout vs. reconnect on failure
+    DB_POOL_USE_LIFO: bool = Field(False, env="DB_POOL_USE_LIFO")  # LIFO lets idle connections age out
+
+    # Read replicas (comma-separated SQLAlchemy URLs; empty = all reads hit the primary)
+    DB_REPLICA_URLS: str = Field("", env="DB_REPLICA_URLS")
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: int = Field(
+        10, env="DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS"
+    )
+    READ_YOUR_WRITES_SECONDS: int = Field(5, env="READ_YOUR_WRITES_SECONDS")  # pin writers to the primary
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+
     # -----------------------------
     # Security / Authentication
     # -----------------------------
@@ -47,6 +66,15 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
 
+    # Password hashing (runs in a dedicated process pool)
+    PASSWORD_HASH_SCHEME: str = Field("bcrypt", env="PASSWORD_HASH_SCHEME")  # bcrypt | argon2 (needs argon2-cffi)
+    BCRYPT_ROUNDS: int = Field(12, env="BCRYPT_ROUNDS")
+    ARGON2_TIME_COST: int = Field(3, env="ARGON2_TIME_COST")
+    ARGON2_MEMORY_COST: int = Field(65536, env="ARGON2_MEMORY_COST")  # KiB
+    ARGON2_PARALLELISM: int = Field(1, env="ARGON2_PARALLELISM")
+    PASSWORD_HASH_WORKERS: int = Field(2, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_MAX_PENDING: int = Field(64, env="PASSWORD_HASH_MAX_PENDING")
+
     # -----------------------------
     # Email Verification
     # -----------------------------
@@ -66,6 +94,79 @@ class Settings(BaseSettings):
     # Redis / Caching / Task Queue
     # -----------------------------
     REDIS_URL: str = Field("redis://localhost:6379/0", env="REDIS_URL")
+    REDIS_MAX_CONNECTIONS: int = Field(50, env="REDIS_MAX_CONNECTIONS")  # per worker
+    REDIS_POOL_TIMEOUT_SECONDS: float = Field(2.0, env="REDIS_POOL_TIMEOUT_SECONDS")
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = Field(2.0, env="REDIS_SOCKET_TIMEOUT_SECONDS")
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = Field(30, env="REDIS_HEALTH_CHECK_INTERVAL_SECONDS")
+
+    # Principal cache (authenticated user snapshots)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(10000, env="PRINCIPAL_CACHE_MAX_ENTRIES")
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = Field(
+        15, env="PRINCIPAL_CACHE_LOCAL_TTL_SECONDS"
+    )  # in-process copy; bounds staleness across workers
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(300, env="PRINCIPAL_CACHE_TTL_SECONDS")  # Redis copy
+    PRINCIPAL_CACHE_REDIS_TIMEOUT_MS: int = Field(
+        50, env="PRINCIPAL_CACHE_REDIS_TIMEOUT_MS"
+    )  # slower than this counts as a miss
+
+    # Reference-data caches (module catalog, tax resources; pre-serialized per version)
+    CATALOG_LOCAL_TTL_SECONDS: int = Field(5, env="CATALOG_LOCAL_TTL_SECONDS")  # recheck the version this often
+    CATALOG_TTL_SECONDS: int = Field(86400, env="CATALOG_TTL_SECONDS")  # Redis copy of each version
+    HTTP_CACHE_REDIS_TIMEOUT_MS: int = Field(
+        50, env="HTTP_CACHE_REDIS_TIMEOUT_MS"
+    )  # version reads slower than this fall back to the database
+
+    # Cache-Control for public reference data; shared caches may serve a copy
+    # up to MAX_AGE old, and up to STALE more while they revalidate
+    PUBLIC_CACHE_MAX_AGE_SECONDS: int = Field(60, env="PUBLIC_CACHE_MAX_AGE_SECONDS")
+    PUBLIC_CACHE_STALE_SECONDS: int = Field(300, env="PUBLIC_CACHE_STALE_SECONDS")
+
+    # Shared outbound HTTP client (third-party APIs), per worker
+    HTTP_CLIENT_MAX_CONNECTIONS: int = Field(20, env="HTTP_CLIENT_MAX_CONNECTIONS")
+    HTTP_CLIENT_MAX_KEEPALIVE: int = Field(10, env="HTTP_CLIENT_MAX_KEEPALIVE")
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = Field(10.0, env="HTTP_CLIENT_TIMEOUT_SECONDS")
+
+    # Exchange rates: one table against the pivot currency, fresh for TTL,
+    # then served for STALE more while it refreshes in the background
+    FX_PROVIDER: str = Field("exchangerate_host", env="FX_PROVIDER")  # exchangerate_host | fake
+    FX_API_URL: str = Field("https://api.exchangerate.host/latest", env="FX_API_URL")
+    FX_API_KEY: str = Field("", env="FX_API_KEY")
+    FX_PIVOT_CURRENCY: str = Field("USD", env="FX_PIVOT_CURRENCY")
+    FX_TTL_SECONDS: int = Field(300, env="FX_TTL_SECONDS")
+    FX_STALE_SECONDS: int = Field(3600, env="FX_STALE_SECONDS")
+    FX_HISTORY_INTERVAL_SECONDS: int = Field(3600, env="FX_HISTORY_INTERVAL_SECONDS")  # snapshot into fx_rates
+    FX_CONVERSION_CACHE_TTL_SECONDS: int = Field(3600, env="FX_CONVERSION_CACHE_TTL_SECONDS")
+
+    # Currency trace series: traced pairs sampled into raw points, compacted
+    # into hourly and daily OHLC buckets, each tier kept for its retention
+    FX_TRACE_SAMPLE_SECONDS: int = Field(60, env="FX_TRACE_SAMPLE_SECONDS")
+    FX_TRACE_COMPACT_SECONDS: int = Field(300, env="FX_TRACE_COMPACT_SECONDS")
+    FX_TRACE_ACTIVE_DAYS: int = Field(30, env="FX_TRACE_ACTIVE_DAYS")  # sample pairs traced this recently
+    FX_TRACE_TOUCH_SECONDS: int = Field(3600, env="FX_TRACE_TOUCH_SECONDS")  # rewrite a trace at most this often
+    FX_TRACE_RAW_RETENTION_DAYS: int = Field(7, env="FX_TRACE_RAW_RETENTION_DAYS")
+    FX_TRACE_HOURLY_RETENTION_DAYS: int = Field(180, env="FX_TRACE_HOURLY_RETENTION_DAYS")
+    FX_TRACE_DAILY_RETENTION_DAYS: int = Field(1825, env="FX_TRACE_DAILY_RETENTION_DAYS")
+
+    # Admin dashboard stats snapshot (kept current by incremental counters;
+    # recomputed in the background once older than the fresh window)
+    DASHBOARD_STATS_FRESH_SECONDS: int = Field(60, env="DASHBOARD_STATS_FRESH_SECONDS")
+    DASHBOARD_STATS_MAX_STALE_SECONDS: int = Field(900, env="DASHBOARD_STATS_MAX_STALE_SECONDS")
+
+    # Background jobs (each tick runs in at most one worker, under a Redis lock)
+    SCHEDULER_ENABLED: bool = Field(True, env="SCHEDULER_ENABLED")
+    PAYMENT_DUE_INTERVAL_SECONDS: int = Field(60, env="PAYMENT_DUE_INTERVAL_SECONDS")
+    PAYMENT_DUE_BATCH_SIZE: int = Field(1000, env="PAYMENT_DUE_BATCH_SIZE")
+    RECURRENCE_MATERIALIZE_INTERVAL_SECONDS: int = Field(300, env="RECURRENCE_MATERIALIZE_INTERVAL_SECONDS")
+    RECURRENCE_HORIZON_DAYS: int = Field(31, env="RECURRENCE_HORIZON_DAYS")  # materialize this far ahead
+    RECURRENCE_BATCH_SIZE: int = Field(1000, env="RECURRENCE_BATCH_SIZE")
+    REMINDER_SWEEP_INTERVAL_SECONDS: int = Field(60, env="REMINDER_SWEEP_INTERVAL_SECONDS")
+    REMINDER_LEAD_HOURS: int = Field(72, env="REMINDER_LEAD_HOURS")  # remind this long before a deadline
+    REMINDER_LOOKBACK_DAYS: int = Field(7, env="REMINDER_LOOKBACK_DAYS")  # still remind overdue ones this recent
+    REMINDER_BATCH_SIZE: int = Field(500, env="REMINDER_BATCH_SIZE")
+
+    # Rate limiting (falls back to per-process buckets when Redis is slow/down)
+    RATE_LIMIT_ENABLED: bool = Field(True, env="RATE_LIMIT_ENABLED")
+    RATE_LIMIT_REDIS_TIMEOUT_MS: int = Field(50, env="RATE_LIMIT_REDIS_TIMEOUT_MS")
 
     # -----------------------------
     # Email / Notifications
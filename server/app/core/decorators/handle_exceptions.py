@@ -8,46 +8,61 @@ from starlette import status
 from pydantic import ValidationError
 
 
+def error_response(name: str, e: Exception) -> JSONResponse:
+    """Standard JSON body for unexpected errors."""
+    error_trace = "".join(traceback.format_exception(e))
+    print(f"[ERROR] {name}: {str(e)}\n{error_trace}")
+
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "success": False,
+            "error": {
+                "type": e.__class__.__name__,
+                "message": str(e)
+            }
+        }
+    )
+
+
+def _normalize(func, e: Exception):
+    if isinstance(e, HTTPException):
+        raise e  # Let FastAPI handle HTTP exceptions
+    if isinstance(e, ValidationError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    # Capture unexpected errors
+    return error_response(func.__name__, e)
+
+
 def handle_exceptions(func):
     """
     Decorator to catch and standardize unhandled exceptions
     into JSON responses across routes and services.
+
+    The wrapper keeps the sync/async nature of `func`: sync handlers stay
+    sync so FastAPI still dispatches them to the threadpool instead of
+    running their blocking calls on the event loop.
     """
-    is_coroutine = asyncio.iscoroutinefunction(func)
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            if is_coroutine:
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
-            return result
-        except HTTPException:
-            raise  # Let FastAPI handle HTTP exceptions
-        except ValidationError as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=str(e)
-            )
-        except Exception as e:
-            # Capture unexpected errors
-            error_trace = traceback.format_exc()
-            print(f"[ERROR] {func.__name__}: {str(e)}\n{error_trace}")
-
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "success": False,
-                    "error": {
-                        "type": e.__class__.__name__,
-                        "message": str(e)
-                    }
-                }
-            )
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return _normalize(func, e)
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return _normalize(func, e)
 
     # Update the signature to match the original function
     sig = inspect.signature(func)
     wrapper.__signature__ = sig
-    
-    return wrapper
\ No newline at end of file
+
+    return wrapper
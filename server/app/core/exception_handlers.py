@@ -0,0 +1,28 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette import status
+from pydantic import ValidationError
+
+from app.core.decorators.handle_exceptions import error_response
+
+
+# -----------------------------
+# App-level exception handlers
+# -----------------------------
+# Same response shapes as `handle_exceptions`, applied to every route
+# without wrapping the handler itself.
+
+async def validation_exception_handler(request: Request, exc: ValidationError):
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc)},
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return error_response(f"{request.method} {request.url.path}", exc)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(ValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -0,0 +1,229 @@
+import hashlib
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import redis
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import redis_client
+
+# Version counters are read on every request, so a hung Redis must fail fast
+# rather than block a threadpool worker until the OS gives up on the socket
+_version_client = redis.from_url(
+    settings.REDIS_URL,
+    socket_timeout=settings.HTTP_CACHE_REDIS_TIMEOUT_MS / 1000,
+    socket_connect_timeout=settings.HTTP_CACHE_REDIS_TIMEOUT_MS / 1000,
+    decode_responses=True,
+)
+
+
+# -----------------------------
+# Validators and conditional responses
+# -----------------------------
+def etag_for(*parts: str) -> str:
+    return '"' + hashlib.sha1("\x1f".join(parts).encode()).hexdigest() + '"'
+
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+def not_modified(request: Request, etag: Optional[str], last_modified: Optional[float]) -> bool:
+    """
+    Whether the client's copy is current. If-None-Match wins over
+    If-Modified-Since when both are sent (RFC 9110 13.2.2); weak tags compare
+    equal to strong ones, as they should for GET.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since  # HTTP dates have whole seconds
+    return False
+
+
+def validator_headers(etag: Optional[str], last_modified: Optional[float], cache_control: str) -> dict:
+    headers = {"Cache-Control": cache_control}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified_response(headers: dict) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def json_response(body: str, headers: dict) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# -----------------------------
+# Version counters bumped by writes
+# -----------------------------
+class Version(NamedTuple):
+    tag: str  # changes on every bump, never repeats after a Redis flush
+    modified: float  # unix time of the last bump
+
+
+class VersionCounter:
+    """
+    A version number and last-modified time in a Redis hash, bumped by the
+    routes that write the data it describes. Readers derive ETag and
+    Last-Modified from it without touching the database. The modified time
+    is part of the tag, so a counter that restarts from zero (Redis flushed)
+    doesn't hand out tags clients already hold for other content.
+    """
+
+    def __init__(self, key: str, local_ttl: float = 0):
+        self.key = key
+        self.local_ttl = local_ttl
+        self._local: Optional[Tuple[float, Version]] = None  # (checked_at, version)
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[Version]:
+        """The current version, or None if Redis is unreachable or slower than HTTP_CACHE_REDIS_TIMEOUT_MS."""
+        now = time.monotonic()
+        with self._lock:
+            local = self._local
+        if local and now - local[0] < self.local_ttl:
+            return local[1]
+        try:
+            number, modified = _version_client.hmget(self.key, "version", "modified")
+            if modified is None:
+                # First reader after a deploy or flush: start the clock now
+                pipe = _version_client.pipeline()
+                pipe.hsetnx(self.key, "version", 0)
+                pipe.hsetnx(self.key, "modified", time.time())
+                pipe.hmget(self.key, "version", "modified")
+                number, modified = pipe.execute()[-1]
+        except redis.RedisError:
+            return None
+        version = Version(tag=f"{number}:{modified}", modified=float(modified))
+        with self._lock:
+            self._local = (now, version)
+        return version
+
+    def bump(self) -> None:
+        with self._lock:
+            self._local = None
+        try:
+            pipe = _version_client.pipeline()
+            pipe.hincrby(self.key, "version", 1)
+            pipe.hset(self.key, "modified", time.time())
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"[HttpCache] Could not bump {self.key}: {e}")
+
+
+# -----------------------------
+# Pre-serialized bodies per version
+# -----------------------------
+class CachedBody(NamedTuple):
+    body: str
+    etag: str
+    last_modified: Optional[float]
+
+
+class VersionedBodyCache:
+    """
+    Shared data that is the same for every caller (reference tables, the
+    global module catalog), serialized once per version.
+
+    The body is stored in Redis under its version, so a rebuild in one
+    worker serves every other worker, and each worker also keeps the last
+    copy in memory, re-reading the version only every `local_ttl` seconds.
+    `validators()` answers conditional requests from the version alone. If
+    Redis is down the body is rebuilt from the database and the ETag falls
+    back to a hash of the content.
+    """
+
+    def __init__(self, name: str, build: Callable[[Session], str], local_ttl: float, redis_ttl: int):
+        self.name = name
+        self.build = build
+        self.redis_ttl = redis_ttl
+        self.version = VersionCounter(f"http_cache:{name}:version", local_ttl)
+        self._local: Optional[Tuple[str, CachedBody]] = None  # (version tag, body)
+        self._lock = threading.Lock()
+
+        self.local_hits = metrics.counter(f"{name}.local_hits")
+        self.redis_hits = metrics.counter(f"{name}.redis_hits")
+        self.rebuilds = metrics.counter(f"{name}.rebuilds")
+        self.invalidations = metrics.counter(f"{name}.invalidations")
+
+    def _body_key(self, tag: str) -> str:
+        return f"http_cache:{self.name}:body:{tag}"
+
+    def validators(self) -> Optional[Tuple[str, float]]:
+        """(etag, last_modified) of the current version without building it; None if Redis is down."""
+        version = self.version.current()
+        if version is None:
+            return None
+        return etag_for(self.name, version.tag), version.modified
+
+    def _rebuild(self, db: Session) -> str:
+        self.rebuilds.inc()
+        return self.build(db)
+
+    def get(self, db: Session) -> CachedBody:
+        version = self.version.current()
+        if version is None:
+            body = self._rebuild(db)
+            return CachedBody(body, etag_for(self.name, body), None)
+
+        with self._lock:
+            local = self._local
+        if local and local[0] == version.tag:
+            self.local_hits.inc()
+            return local[1]
+
+        key = self._body_key(version.tag)
+        try:
+            body = redis_client.get(key)
+        except redis.RedisError:
+            body = None
+        if body is not None:
+            self.redis_hits.inc()
+        else:
+            body = self._rebuild(db)
+            try:
+                redis_client.set(key, body, ex=self.redis_ttl)
+            except redis.RedisError:
+                pass
+
+        cached = CachedBody(body, etag_for(self.name, version.tag), version.modified)
+        with self._lock:
+            self._local = (version.tag, cached)
+        return cached
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._local = None
+        self.version.bump()
+        self.invalidations.inc()
+
+    def stats(self) -> dict:
+        with self._lock:
+            version = self._local[0] if self._local else None
+        return {
+            "local_version": version,
+            "local_hits": self.local_hits.value,
+            "redis_hits": self.redis_hits.value,
+            "rebuilds": self.rebuilds.value,
+            "invalidations": self.invalidations.value,
+        }
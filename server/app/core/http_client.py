@@ -0,0 +1,44 @@
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+# -----------------------------
+# Shared outbound HTTP client
+# -----------------------------
+# One pooled client per worker process, so calls to third-party APIs reuse
+# TCP/TLS connections instead of handshaking on every request.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+        ),
+    )
+
+
+def init_http_client() -> None:
+    """Called from the app lifespan."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The app-wide client; created lazily outside the FastAPI lifespan."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
@@ -0,0 +1,145 @@
+import threading
+from collections import deque
+from typing import Dict
+
+
+class Counter:
+    """Monotonic, thread-safe counter."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self):
+        return self._value
+
+
+class Gauge:
+    """Thread-safe up/down value that also remembers its high-water mark."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._peak = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+            self._peak = max(self._peak, self._value)
+
+    def dec(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: int) -> None:
+        with self._lock:
+            self._value = value
+            self._peak = max(self._peak, value)
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self):
+        return {"value": self._value, "peak": self._peak}
+
+
+class Histogram:
+    """
+    Count/sum plus percentiles over a bounded reservoir of recent samples.
+    Cheap enough to call on every Redis command or pool checkout.
+    """
+
+    def __init__(self, name: str, description: str = "", reservoir_size: int = 2048):
+        self.name = name
+        self.description = description
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._samples = deque(maxlen=reservoir_size)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+            self._samples.append(value)
+
+    def snapshot(self):
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, maximum = self._count, self._sum, self._max
+
+        def pct(p: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 3)
+
+        return {
+            "count": count,
+            "avg": round(total / count, 3) if count else 0.0,
+            "p50": pct(0.50),
+            "p95": pct(0.95),
+            "p99": pct(0.99),
+            "max": round(maximum, 3),
+        }
+
+
+class MetricsRegistry:
+    """
+    In-process registry of named metrics.
+    Each uvicorn worker keeps its own registry; values are per-process.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Counter(name, description)
+                self._metrics[name] = metric
+            return metric
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Gauge(name, description)
+                self._metrics[name] = metric
+            return metric
+
+    def histogram(self, name: str, description: str = "") -> Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(name, description)
+                self._metrics[name] = metric
+            return metric
+
+    def snapshot(self, prefix: str = "") -> dict:
+        with self._lock:
+            metrics = list(self._metrics.items())
+        return {
+            name: metric.snapshot()
+            for name, metric in sorted(metrics)
+            if name.startswith(prefix)
+        }
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,110 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import DateTime, and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """`?limit=&cursor=` query parameters; use as `page: PageParams = Depends()`."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list):
+            raise ValueError
+        return values
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class Keyset:
+    """
+    Keyset pagination over `(sort_column, id_column)`.
+
+    Works with both `select()` statements and legacy `Query` objects. The
+    predicate is written as `sort <= v AND (sort < v OR id < last_id)` rather
+    than a row comparison so the leading `sort` bound is usable as an index
+    condition on the existing `(user_id, <date>)` indexes; pages cost the same
+    however deep they are. NULL sort keys follow Postgres ordering (first when
+    descending, last when ascending).
+    """
+
+    def __init__(self, sort_column, id_column=None, descending: bool = True):
+        self.sort_column = sort_column
+        self.id_column = id_column if id_column is not None else sort_column
+        self.descending = descending
+        self._single_key = self.id_column is sort_column
+        self._is_datetime = isinstance(sort_column.type, DateTime)
+
+    def _after(self, sort_value: Any, last_id: Any):
+        sort, ident = self.sort_column, self.id_column
+        if self._single_key:
+            return ident < last_id if self.descending else ident > last_id
+
+        if self.descending:
+            if sort_value is None:
+                return or_(and_(sort.is_(None), ident < last_id), sort.isnot(None))
+            return and_(sort <= sort_value, or_(sort < sort_value, ident < last_id))
+
+        if sort_value is None:
+            return and_(sort.is_(None), ident > last_id)
+        return or_(and_(sort >= sort_value, or_(sort > sort_value, ident > last_id)), sort.is_(None))
+
+    def _decode(self, cursor: str):
+        values = decode_cursor(cursor)
+        if len(values) != (1 if self._single_key else 2):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if self._single_key:
+            return None, values[0]
+        sort_value, last_id = values
+        if self._is_datetime and sort_value is not None:
+            try:
+                sort_value = datetime.fromisoformat(sort_value)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        return sort_value, last_id
+
+    def apply(self, stmt, page: PageParams):
+        """Add the keyset filter, stable ordering and a `limit + 1` probe row."""
+        if page.cursor:
+            stmt = stmt.where(self._after(*self._decode(page.cursor)))
+        if self._single_key:
+            order = [self.id_column.desc() if self.descending else self.id_column.asc()]
+        elif self.descending:
+            order = [self.sort_column.desc(), self.id_column.desc()]
+        else:
+            order = [self.sort_column.asc(), self.id_column.asc()]
+        return stmt.order_by(*order).limit(page.limit + 1)
+
+    def page(self, rows: List[Any], page: PageParams, response: Response) -> List[Any]:
+        """Trim the probe row and advertise the next cursor, if any."""
+        rows = list(rows)
+        if len(rows) > page.limit:
+            rows = rows[: page.limit]
+            last = rows[-1]
+            last_id = getattr(last, self.id_column.key)
+            values = [last_id] if self._single_key else [getattr(last, self.sort_column.key), last_id]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(values)
+        return rows
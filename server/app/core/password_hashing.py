@@ -0,0 +1,153 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue stays full for longer than the queue timeout."""
+
+
+# -----------------------------
+# Worker-side helpers
+# -----------------------------
+# These run inside the pool processes. Params are a plain tuple so they pickle
+# cheaply; each process builds its CryptContext once per params.
+
+_contexts: dict = {}
+
+
+def build_context(params: tuple) -> CryptContext:
+    scheme, bcrypt_rounds, argon2_time_cost, argon2_memory_cost, argon2_parallelism = params
+
+    schemes = ["argon2", "bcrypt"] if scheme == "argon2" else ["bcrypt"]
+    options = {
+        "bcrypt__default_rounds": bcrypt_rounds,
+        # Hashes made with any other cost are flagged for rehash on login
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "bcrypt__max_rounds": bcrypt_rounds,
+    }
+    if scheme == "argon2":
+        options.update(
+            argon2__type="ID",
+            argon2__time_cost=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+def _context(params: tuple) -> CryptContext:
+    ctx = _contexts.get(params)
+    if ctx is None:
+        ctx = _contexts[params] = build_context(params)
+    return ctx
+
+
+def _hash(params: tuple, password: str) -> str:
+    return _context(params).hash(password)
+
+
+def _verify(params: tuple, password: str, hashed: str) -> bool:
+    return _context(params).verify(password, hashed)
+
+
+def _verify_and_update(params: tuple, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return _context(params).verify_and_update(password, hashed)
+
+
+# -----------------------------
+# Hasher
+# -----------------------------
+class PasswordHasher:
+    """
+    Runs password hashing in a bounded process pool so bcrypt/argon2 never
+    burn CPU on the event loop or pin a request thread for the full cost.
+
+    At most `max_pending` operations are queued or running; callers wait up
+    to `queue_timeout` seconds for a slot and then get `PasswordHasherBusy`.
+    """
+
+    def __init__(
+        self,
+        scheme: str = "bcrypt",
+        bcrypt_rounds: int = 12,
+        argon2_time_cost: int = 3,
+        argon2_memory_cost: int = 65536,
+        argon2_parallelism: int = 1,
+        workers: int = 2,
+        max_pending: int = 64,
+        queue_timeout: float = 5.0,
+    ):
+        if scheme not in ("bcrypt", "argon2"):
+            raise ValueError(f"Unsupported password hash scheme: {scheme}")
+        self.params = (scheme, bcrypt_rounds, argon2_time_cost, argon2_memory_cost, argon2_parallelism)
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created lazily so importing the app never forks; "spawn" avoids
+        # forking a process that already runs an event loop and threads.
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _dispatch(self, fn, *args) -> Future:
+        try:
+            future = self._get_executor().submit(fn, self.params, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PasswordHasherBusy("Password hashing queue is full")
+        return self._dispatch(fn, *args)
+
+    async def _asubmit(self, fn, *args):
+        deadline = time.monotonic() + self.queue_timeout
+        while not self._slots.acquire(blocking=False):
+            if time.monotonic() > deadline:
+                raise PasswordHasherBusy("Password hashing queue is full")
+            await asyncio.sleep(0.01)
+        return await asyncio.wrap_future(self._dispatch(fn, *args))
+
+    # Sync API: for handlers already running in the threadpool
+    def hash(self, password: str) -> str:
+        return self._submit(_hash, password).result()
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._submit(_verify, password, hashed).result()
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Verify, and return a fresh hash when `hashed` uses outdated parameters."""
+        return self._submit(_verify_and_update, password, hashed).result()
+
+    # Async API: for coroutine handlers
+    async def ahash(self, password: str) -> str:
+        return await self._asubmit(_hash, password)
+
+    async def averify(self, password: str, hashed: str) -> bool:
+        return await self._asubmit(_verify, password, hashed)
+
+    async def averify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        return await self._asubmit(_verify_and_update, password, hashed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import redis_client, get_redis
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Slim, immutable snapshot of an authenticated user.
+    Handlers that only need identity/permission flags should use this
+    instead of loading the full `User` row.
+    """
+
+    id: int
+    email: str
+    username: str
+    full_name: Optional[str]
+    is_active: bool
+    is_verified: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=bool(user.is_active),
+            is_verified=bool(user.is_verified),
+            is_superuser=bool(user.is_superuser),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Principal":
+        return cls(**json.loads(raw))
+
+
+class PrincipalCache:
+    """
+    Two-level principal cache: a bounded in-process LRU in front of Redis.
+    `aget`/`aset` serve the request path; `invalidate` is sync, for code that
+    runs in the threadpool (sync handlers and services).
+
+    The local tier has a short TTL so that invalidations issued by another
+    worker (which only reach Redis) become visible quickly. Redis errors are
+    swallowed: the cache is an optimisation, the database stays authoritative.
+    On the async path a Redis call slower than `redis_timeout` seconds counts
+    as a miss, so an unreachable Redis costs each request milliseconds rather
+    than a socket timeout.
+    """
+
+    KEY_PREFIX = "principal"
+
+    def __init__(self, max_entries: int, local_ttl: int, redis_ttl: int, redis_timeout: float):
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.redis_timeout = redis_timeout
+        self._entries: "OrderedDict[int, tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.local_hits = metrics.counter("principal_cache.local_hits")
+        self.redis_hits = metrics.counter("principal_cache.redis_hits")
+        self.misses = metrics.counter("principal_cache.misses")
+        self.invalidations = metrics.counter("principal_cache.invalidations")
+        self.redis_timeouts = metrics.counter("principal_cache.redis_timeouts")
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    def _get_local(self, user_id: int) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def _set_local(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + self.local_ttl, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def aget(self, user_id: int) -> Optional[Principal]:
+        """Async lookup for the request path; never blocks the event loop."""
+        principal = self._get_local(user_id)
+        if principal is not None:
+            self.local_hits.inc()
+            return principal
+
+        try:
+            raw = await asyncio.wait_for(get_redis().get(self._key(user_id)), timeout=self.redis_timeout)
+        except asyncio.TimeoutError:
+            self.redis_timeouts.inc()
+            raw = None
+        except (redis.RedisError, OSError):
+            raw = None
+        if raw:
+            principal = Principal.from_json(raw)
+            self._set_local(principal)
+            self.redis_hits.inc()
+            return principal
+
+        self.misses.inc()
+        return None
+
+    async def aset(self, principal: Principal) -> None:
+        self._set_local(principal)
+        try:
+            await asyncio.wait_for(
+                get_redis().setex(self._key(principal.id), self.redis_ttl, principal.to_json()),
+                timeout=self.redis_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.redis_timeouts.inc()
+        except (redis.RedisError, OSError):
+            pass
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+        try:
+            redis_client.delete(self._key(user_id))
+        except redis.RedisError:
+            pass
+        self.invalidations.inc()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "local_hits": self.local_hits.value,
+            "redis_hits": self.redis_hits.value,
+            "misses": self.misses.value,
+            "invalidations": self.invalidations.value,
+            "redis_timeouts": self.redis_timeouts.value,
+        }
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    redis_timeout=settings.PRINCIPAL_CACHE_REDIS_TIMEOUT_MS / 1000,
+)
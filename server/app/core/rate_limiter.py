@@ -0,0 +1,268 @@
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import redis
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import LuaScript
+from app.core.security import decode_access_token
+
+
+# -----------------------------
+# Policies
+# -----------------------------
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    `limit` requests per `period` seconds.
+
+    token_bucket: refills at limit/period tokens per second and holds up to
+    `burst` tokens (defaults to `limit`).
+    sliding_window: weighted two-window counter, no bursts above `limit`.
+
+    scope: "ip", "user" or "user_or_ip" (user id from the bearer token when
+    present, client IP otherwise).
+    """
+
+    name: str
+    limit: int
+    period: float
+    algorithm: str = "token_bucket"
+    burst: Optional[int] = None
+    scope: str = "user_or_ip"
+
+    @property
+    def capacity(self) -> int:
+        return self.burst or self.limit
+
+    @property
+    def header(self) -> str:
+        return f"{self.limit};w={int(self.period)}"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int  # seconds until the quota is fully restored
+    retry_after: int  # seconds until the next request may pass (0 if allowed)
+
+
+# -----------------------------
+# Atomic Redis scripts
+# -----------------------------
+# Both scripts read the clock from Redis (TIME) so app servers with skewed
+# clocks share one view of time, and each runs as a single round trip.
+
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])          -- tokens per ms
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + 1000)
+local reset = math.ceil((capacity - tokens) / rate)
+return {allowed, math.floor(tokens), retry_after, reset}
+"""
+
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])        -- ms
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local cur_start = now - (now % window)
+local prev_start = cur_start - window
+local cur = tonumber(redis.call('HGET', KEYS[1], cur_start) or '0')
+local prev = tonumber(redis.call('HGET', KEYS[1], prev_start) or '0')
+local elapsed = now - cur_start
+local estimated = prev * ((window - elapsed) / window) + cur
+
+local allowed = 0
+local retry_after = 0
+if estimated + cost <= limit then
+    cur = redis.call('HINCRBY', KEYS[1], cur_start, cost)
+    estimated = estimated + cost
+    allowed = 1
+    redis.call('HDEL', KEYS[1], prev_start - window)
+    redis.call('PEXPIRE', KEYS[1], window * 2)
+elseif cur + cost > limit or prev == 0 then
+    retry_after = window - elapsed
+else
+    -- wait until the previous window's weight has decayed enough
+    local weight = (limit - cur - cost) / prev
+    retry_after = math.ceil(window * (1 - weight) - elapsed)
+end
+
+return {allowed, math.max(0, math.floor(limit - estimated)), math.max(0, retry_after), window - elapsed}
+"""
+
+
+# -----------------------------
+# In-process fallback
+# -----------------------------
+class LocalTokenBuckets:
+    """
+    Per-process token buckets used while Redis is slow or unavailable.
+    Limits become per-worker rather than global, which is acceptable for a
+    degraded mode. Bounded so key cardinality cannot grow without limit.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key: str, policy: RateLimitPolicy, cost: int = 1) -> RateLimitDecision:
+        capacity = policy.capacity
+        rate = policy.limit / policy.period  # tokens per second
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - ts) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=policy.limit,
+            remaining=int(tokens),
+            reset=math.ceil((capacity - tokens) / rate),
+            retry_after=0 if allowed else math.ceil((cost - tokens) / rate),
+        )
+
+
+# -----------------------------
+# Limiter
+# -----------------------------
+class RateLimiter:
+    KEY_PREFIX = "rl"
+
+    def __init__(self, redis_timeout: float):
+        self.redis_timeout = redis_timeout
+        self.fallback = LocalTokenBuckets()
+        self._token_bucket = LuaScript(TOKEN_BUCKET_LUA)
+        self._sliding_window = LuaScript(SLIDING_WINDOW_LUA)
+
+        self.allowed = metrics.counter("rate_limit.allowed")
+        self.rejected = metrics.counter("rate_limit.rejected")
+        self.fallbacks = metrics.counter("rate_limit.fallbacks")
+
+    async def _check_redis(self, key: str, policy: RateLimitPolicy, cost: int) -> RateLimitDecision:
+        if policy.algorithm == "sliding_window":
+            result = await self._sliding_window(
+                keys=[key], args=[policy.limit, int(policy.period * 1000), cost]
+            )
+        else:
+            result = await self._token_bucket(
+                keys=[key], args=[policy.capacity, policy.limit / (policy.period * 1000), cost]
+            )
+        allowed, remaining, retry_after_ms, reset_ms = (int(v) for v in result)
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            limit=policy.limit,
+            remaining=remaining,
+            reset=math.ceil(reset_ms / 1000),
+            retry_after=math.ceil(retry_after_ms / 1000),
+        )
+
+    async def check(self, key: str, policy: RateLimitPolicy, cost: int = 1) -> RateLimitDecision:
+        try:
+            decision = await asyncio.wait_for(
+                self._check_redis(key, policy, cost), timeout=self.redis_timeout
+            )
+        except (redis.RedisError, asyncio.TimeoutError, OSError):
+            self.fallbacks.inc()
+            decision = self.fallback.check(key, policy, cost)
+
+        (self.allowed if decision.allowed else self.rejected).inc()
+        return decision
+
+
+limiter = RateLimiter(redis_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000)
+
+
+def _identity(request: Request, scope: str) -> str:
+    if scope != "ip":
+        auth = request.headers.get("Authorization", "")
+        if auth.lower().startswith("bearer "):
+            user_id = decode_access_token(auth[7:])
+            if user_id:
+                return f"user:{user_id}"
+    client_ip = request.client.host if request.client else "unknown"
+    return f"ip:{client_ip}"
+
+
+def rate_limit(policy: RateLimitPolicy):
+    """
+    Rate limiting dependency. Attach it to a route with
+    `dependencies=[rate_limit(POLICY)]`.
+
+    Sets `RateLimit-Limit`, `RateLimit-Remaining`, `RateLimit-Reset` and
+    `RateLimit-Policy` on every response; 429 responses also carry `Retry-After`.
+    """
+
+    async def rate_limit_dependency(request: Request, response: Response):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        route = request.scope.get("route")
+        path = getattr(route, "path", request.url.path)
+        key = f"{limiter.KEY_PREFIX}:{policy.name}:{request.method}:{path}:{_identity(request, policy.scope)}"
+
+        decision = await limiter.check(key, policy)
+        headers = {
+            "RateLimit-Limit": str(decision.limit),
+            "RateLimit-Remaining": str(decision.remaining),
+            "RateLimit-Reset": str(decision.reset),
+            "RateLimit-Policy": policy.header,
+        }
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many requests. Try again in {decision.retry_after} seconds.",
+                headers={**headers, "Retry-After": str(decision.retry_after)},
+            )
+        response.headers.update(headers)
+
+    return Depends(rate_limit_dependency)
+
+
+# -----------------------------
+# Quotas for expensive endpoints
+# -----------------------------
+LOGIN_LIMIT = RateLimitPolicy("login", limit=5, period=60, burst=10, scope="ip")
+REGISTER_LIMIT = RateLimitPolicy("register", limit=5, period=3600, algorithm="sliding_window", scope="ip")
+RESEND_VERIFICATION_LIMIT = RateLimitPolicy("resend_verification", limit=1, period=120, scope="user")
+CURRENCY_TRACING_LIMIT = RateLimitPolicy("currency_tracing", limit=30, period=60, algorithm="sliding_window")
+DOCUMENT_UPLOAD_LIMIT = RateLimitPolicy("document_upload", limit=20, period=3600, burst=5, scope="user")
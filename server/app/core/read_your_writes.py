@@ -0,0 +1,45 @@
+import redis
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.redis import get_redis, redis_client
+from app.core.security import decode_access_token
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _pin_key(user_id) -> str:
+    return f"rw_pin:{user_id}"
+
+
+def bearer_user_id(request: Request):
+    """User id (`sub`) from the bearer token, without touching the database."""
+    auth = request.headers.get("authorization", "")
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return decode_access_token(token)
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """
+    After a successful write, pin the writer to the primary for
+    READ_YOUR_WRITES_SECONDS so replica lag can't hide their own change.
+    """
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        user_id = bearer_user_id(request)
+        if user_id is not None:
+            try:
+                await get_redis().set(_pin_key(user_id), 1, ex=settings.READ_YOUR_WRITES_SECONDS)
+            except redis.RedisError as e:
+                print(f"[Redis] Failed to pin user {user_id} to primary: {e}")
+    return response
+
+
+def has_recent_write(user_id) -> bool:
+    """Sync check used by get_read_db; fails towards the primary when Redis is down."""
+    try:
+        return bool(redis_client.exists(_pin_key(user_id)))
+    except redis.RedisError:
+        return True
@@ -1,4 +1,141 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
 import redis
+import redis.asyncio
+from redis.exceptions import NoScriptError
+
 from app.core.config import settings
+from app.core.metrics import metrics
 
+# Sync client: only for code that already runs in the threadpool
+# (sync route handlers, services, background jobs). Coroutines use get_redis().
 redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+# -----------------------------
+# Shared asyncio pool
+# -----------------------------
+command_latency = metrics.histogram("redis.command_ms")
+pipeline_latency = metrics.histogram("redis.pipeline_ms")
+command_errors = metrics.counter("redis.errors")
+
+
+class InstrumentedRedis(redis.asyncio.Redis):
+    """Async client that records per-command latency."""
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        except redis.RedisError:
+            command_errors.inc()
+            raise
+        finally:
+            command_latency.observe((time.perf_counter() - start) * 1000)
+
+
+_client: Optional[InstrumentedRedis] = None
+
+
+def _create_client() -> InstrumentedRedis:
+    pool = redis.asyncio.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,  # wait for a free connection
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        decode_responses=True,
+    )
+    return InstrumentedRedis(connection_pool=pool)
+
+
+async def init_redis_pool() -> None:
+    """Called from the app lifespan; one pool per worker process."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+    try:
+        await _client.ping()
+    except redis.RedisError as e:
+        # Consumers degrade gracefully; don't block startup on Redis
+        print(f"[Redis] Initial ping failed: {e}")
+
+
+async def close_redis_pool() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_redis() -> InstrumentedRedis:
+    """
+    The app-wide async client. Created lazily for scripts and workers that
+    run outside the FastAPI lifespan.
+    """
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
+
+
+@asynccontextmanager
+async def pipeline(transaction: bool = False):
+    """
+    Batch several commands into one round trip:
+
+        async with pipeline() as pipe:
+            pipe.incr("a")
+            pipe.expire("a", 60)
+        results = pipe.results
+    """
+    async with get_redis().pipeline(transaction=transaction) as pipe:
+        yield pipe
+        start = time.perf_counter()
+        try:
+            pipe.results = await pipe.execute()
+        finally:
+            pipeline_latency.observe((time.perf_counter() - start) * 1000)
+
+
+class LuaScript:
+    """EVALSHA with EVAL fallback, independent of the client instance."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.sha = None
+
+    async def __call__(self, keys: list, args: list):
+        client = get_redis()
+        if self.sha is None:
+            self.sha = await client.script_load(self.source)
+        try:
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            # Script cache was flushed (restart/failover)
+            self.sha = await client.script_load(self.source)
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+
+
+async def redis_health() -> dict:
+    client = get_redis()
+    pool = client.connection_pool
+    start = time.perf_counter()
+    try:
+        await client.ping()
+        ok = True
+    except redis.RedisError:
+        ok = False
+    return {
+        "ok": ok,
+        "ping_ms": round((time.perf_counter() - start) * 1000, 3),
+        "max_connections": pool.max_connections,
+        "in_use_connections": len(getattr(pool, "_in_use_connections", ())),
+        "idle_connections": len(getattr(pool, "_available_connections", ())),
+        "command_ms": command_latency.snapshot(),
+        "pipeline_ms": pipeline_latency.snapshot(),
+        "errors": command_errors.value,
+    }
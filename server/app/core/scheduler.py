@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+import redis
+from redis.exceptions import LockError
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import get_redis
+
+
+class PeriodicJob:
+    """
+    Runs an async `func` every `interval` seconds from every worker process.
+    Each tick first takes a Redis lock (non-blocking), so across all workers
+    at most one copy of the job runs at a time and the others just skip the
+    tick. If Redis is unreachable the tick is skipped too: these jobs are
+    catch-up work, and the next tick picks up whatever was missed.
+    """
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[object]], interval: float, lock_timeout: Optional[float] = None):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        # Lock expires on its own if a worker dies mid-run
+        self.lock_timeout = lock_timeout or max(interval * 2, 30)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+        self.runs = metrics.counter(f"scheduler.{name}.runs")
+        self.skipped = metrics.counter(f"scheduler.{name}.skipped")
+        self.failures = metrics.counter(f"scheduler.{name}.failures")
+        self.duration = metrics.histogram(f"scheduler.{name}.ms")
+
+    async def run_once(self) -> bool:
+        """One locked run; False if another worker holds the lock."""
+        lock = get_redis().lock(f"lock:scheduler:{self.name}", timeout=self.lock_timeout, blocking=False)
+        try:
+            if not await lock.acquire():
+                self.skipped.inc()
+                return False
+        except redis.RedisError as e:
+            print(f"[Scheduler] {self.name}: could not take lock: {e}")
+            self.skipped.inc()
+            return False
+
+        start = time.perf_counter()
+        try:
+            result = await self.func()
+            self.runs.inc()
+            if result:
+                print(f"[Scheduler] {self.name}: {result}")
+            return True
+        except Exception as e:
+            self.failures.inc()
+            print(f"[Scheduler] {self.name} failed: {e}")
+            return True
+        finally:
+            self.duration.observe((time.perf_counter() - start) * 1000)
+            try:
+                await lock.release()
+            except (LockError, redis.RedisError):
+                pass  # expired or Redis went away; it times out on its own
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            await self.run_once()
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._loop(), name=f"scheduler:{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=self.lock_timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        self._task = None
+
+
+jobs: List[PeriodicJob] = []
+
+
+def register_job(name: str, interval: float, lock_timeout: Optional[float] = None):
+    """Decorator: run the coroutine function periodically once the app starts."""
+
+    def decorator(func):
+        jobs.append(PeriodicJob(name, func, interval, lock_timeout))
+        return func
+
+    return decorator
+
+
+def start_jobs() -> None:
+    """Called from the app lifespan."""
+    if not settings.SCHEDULER_ENABLED:
+        return
+    for job in jobs:
+        job.start()
+
+
+async def stop_jobs() -> None:
+    for job in jobs:
+        await job.stop()
+
+
+def jobs_stats() -> dict:
+    return {
+        job.name: {
+            "interval_seconds": job.interval,
+            "running": job._task is not None,
+            "runs": job.runs.value,
+            "skipped": job.skipped.value,
+            "failures": job.failures.value,
+            "ms": job.duration.snapshot(),
+        }
+        for job in jobs
+    }
@@ -0,0 +1,139 @@
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+# Engines registered through instrument_engine(), keyed by their pool name
+_engines: Dict[str, Engine] = {}
+
+
+def pool_options(name: str) -> dict:
+    """create_engine() pool kwargs from settings; each engine gets its own pool per worker."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        # Survives engine.dispose()/pool.recreate(), so the timed pools can find their metrics
+        "pool_logging_name": name,
+    }
+
+
+def _acquire_metrics(pool):
+    name = pool._orig_logging_name or "default"
+    return (
+        metrics.histogram(f"db.{name}.pool.wait_ms"),
+        metrics.counter(f"db.{name}.pool.timeouts"),
+    )
+
+
+def _timed_do_get(pool, do_get):
+    wait_ms, timeouts = _acquire_metrics(pool)
+    start = time.perf_counter()
+    try:
+        return do_get()
+    except exc.TimeoutError:
+        timeouts.inc()
+        raise
+    finally:
+        wait_ms.observe((time.perf_counter() - start) * 1000)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to acquire a connection."""
+
+    def _do_get(self):
+        return _timed_do_get(self, super()._do_get)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async-engine counterpart of TimedQueuePool."""
+
+    def _do_get(self):
+        return _timed_do_get(self, super()._do_get)
+
+
+# -----------------------------
+# Pool & query events
+# -----------------------------
+def instrument_engine(engine, name: str) -> None:
+    """
+    Attach pool events (checkout/checkin, connect/close churn, invalidations)
+    and cursor timing to `engine`. Accepts sync or async engines.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    _engines[name] = sync_engine
+
+    checked_out = metrics.gauge(f"db.{name}.pool.checked_out")
+    overflow = metrics.gauge(f"db.{name}.pool.overflow")
+    connects = metrics.counter(f"db.{name}.pool.connects")
+    closes = metrics.counter(f"db.{name}.pool.closes")
+    invalidations = metrics.counter(f"db.{name}.pool.invalidations")
+    lifetime_s = metrics.histogram(f"db.{name}.pool.connection_lifetime_s")
+    query_ms = metrics.histogram(f"db.{name}.query_ms")
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connects.inc()
+        connection_record.info["opened_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "close")
+    def on_close(dbapi_connection, connection_record):
+        closes.inc()
+        opened_at = connection_record.info.get("opened_at")
+        if opened_at is not None:
+            lifetime_s.observe(time.monotonic() - opened_at)
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+        pool = sync_engine.pool
+        if hasattr(pool, "overflow"):
+            overflow.set(max(pool.overflow(), 0))
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc()
+
+    # The start time lives on the execution context, which is discarded
+    # whether the statement succeeds or fails, so nothing leaks on errors
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started_at", None)
+        if started is not None:
+            query_ms.observe((time.perf_counter() - started) * 1000)
+
+
+def pool_stats() -> dict:
+    """Live pool state plus the recorded metrics for every instrumented engine."""
+    stats = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        live = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            live.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                timeout_seconds=pool.timeout(),
+            )
+        stats[name] = {"pool": live, "metrics": metrics.snapshot(f"db.{name}.")}
+    return stats
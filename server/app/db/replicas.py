@@ -0,0 +1,105 @@
+import itertools
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics
+
+
+class ReadOnlySession(Session):
+    """Session for replica reads; refuses to flush so writes can't leak onto a replica."""
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Attempted to write through a read-only session")
+        super().flush(objects)
+
+
+class ReplicaRouter:
+    """
+    Round-robin over healthy replica engines, falling back to the primary.
+
+    Health is a `SELECT 1` per replica, re-run at most every
+    `health_check_interval` seconds by whichever request notices it is due;
+    other requests keep using the last known state meanwhile. A replica whose
+    connection is invalidated mid-request is marked down until the next check.
+    """
+
+    def __init__(self, primary: Engine, replicas: List[Engine], health_check_interval: float = 10.0):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.health_check_interval = health_check_interval
+        self._healthy = {id(engine): True for engine in self.replicas}
+        self._checked_at = 0.0
+        self._check_lock = threading.Lock()
+        self._counter = itertools.count()
+
+        self._picks = metrics.counter("db.replicas.picks")
+        self._fallbacks = metrics.counter("db.replicas.fallbacks")
+        self._failures = metrics.counter("db.replicas.health_check_failures")
+
+    # -----------------------------
+    # Health
+    # -----------------------------
+    def _ping(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except exc.SQLAlchemyError as e:
+            self._failures.inc()
+            print(f"[DB] Replica {engine.url.render_as_string(hide_password=True)} unhealthy: {e}")
+            return False
+
+    def check_health(self, force: bool = False) -> None:
+        if not self.replicas:
+            return
+        if not force and time.monotonic() - self._checked_at < self.health_check_interval:
+            return
+        if not self._check_lock.acquire(blocking=False):
+            return  # another thread is already checking
+        try:
+            for engine in self.replicas:
+                self._healthy[id(engine)] = self._ping(engine)
+            self._checked_at = time.monotonic()
+        finally:
+            self._check_lock.release()
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        if id(engine) in self._healthy:
+            self._healthy[id(engine)] = False
+
+    def healthy_replicas(self) -> List[Engine]:
+        return [engine for engine in self.replicas if self._healthy[id(engine)]]
+
+    # -----------------------------
+    # Routing
+    # -----------------------------
+    def pick(self) -> Engine:
+        self.check_health()
+        healthy = self.healthy_replicas()
+        if not healthy:
+            if self.replicas:
+                self._fallbacks.inc()
+            return self.primary
+        self._picks.inc()
+        return healthy[next(self._counter) % len(healthy)]
+
+    def session(self, bind: Optional[Engine] = None) -> ReadOnlySession:
+        return ReadOnlySession(bind=bind or self.pick(), autoflush=False)
+
+    def stats(self) -> dict:
+        return {
+            "replicas": [
+                {
+                    "url": engine.url.render_as_string(hide_password=True),
+                    "healthy": self._healthy[id(engine)],
+                }
+                for engine in self.replicas
+            ],
+            "metrics": metrics.snapshot("db.replicas."),
+        }
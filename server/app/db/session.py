@@ -1,6 +1,14 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.pool_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+    pool_options,
+)
+from app.db.replicas import ReplicaRouter
 
 
 # -----------------------------
@@ -8,12 +16,54 @@ from app.core.config import settings
 # -----------------------------
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
+    poolclass=TimedQueuePool,
     echo=settings.is_development(),  # Show SQL in dev mode
+    **pool_options("primary"),
 )
+instrument_engine(engine, "primary")
 
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
+
+
+# -----------------------------
+# Read replicas
+# -----------------------------
+def create_replica_engine(url: str, name: str):
+    if url.startswith("sqlite"):
+        # Local stand-in for a replica; SQLite has its own pooling rules
+        return create_engine(url)
+    replica = create_engine(url, poolclass=TimedQueuePool, **pool_options(name))
+    instrument_engine(replica, name)
+    return replica
+
+
+read_router = ReplicaRouter(
+    engine,
+    [create_replica_engine(url, f"replica{i}") for i, url in enumerate(settings.replica_urls)],
+    health_check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+)
+
+
+# -----------------------------
+# Async Engine & Session (asyncpg)
+# -----------------------------
+# Sync and async stacks share the same models and coexist while routers
+# are migrated; async routers don't consume threadpool slots.
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    echo=settings.is_development(),
+    **pool_options("primary_async"),
+)
+instrument_engine(async_engine, "primary_async")
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,  # ORM objects stay readable after commit without lazy IO
+)
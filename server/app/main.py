@@ -1,9 +1,19 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.db.session import engine
-from app.models import base
+from app.core.exception_handlers import register_exception_handlers
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.read_your_writes import read_your_writes_middleware
+from app.core.security import password_hasher
+from app.core.redis import init_redis_pool, close_redis_pool
+from app.core.http_client import init_http_client, close_http_client
+from app.core.scheduler import start_jobs, stop_jobs
+from app.services import reminder_service  # noqa: F401 - registers the engagement_reminders job
+from app.services import fx_history  # noqa: F401 - registers the fx_history job
+from app.db.session import engine, async_engine
 
 # Routers
 from app.api.v1.routes import auth
@@ -14,6 +24,7 @@ from app.api.v1.routes import expenses
 from app.api.v1.routes import income
 from app.api.v1.routes import currency_tracing
 from app.api.v1.routes import engagement
+from app.api.v1.routes import notifications
 from app.api.v1.routes import financial
 from app.api.v1.routes import tax_resources
 from app.api.v1.routes import support_ticket  # user support tickets
@@ -23,13 +34,36 @@ from app.api.v1.routes import admin_financial_modules
 from app.api.v1.routes import admin_support_ops
 from app.api.v1.routes import admin_dashboard_ops
 from app.api.v1.routes import payments
+from app.api.v1.routes import payment_recurrences
 from app.api.v1.routes import subscription  # <- import subscription router
 from app.api.v1.routes import admin_users
+from app.api.v1.routes import admin_metrics
+from app.api.v1.routes import export
+from app.api.v1.routes import expense_import
+from app.api.v1.routes import summary
+
+# Schema is managed by Alembic (`alembic upgrade head`), not created at import
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_redis_pool()
+    init_http_client()
+    start_jobs()
+    yield
+    await stop_jobs()
+    await close_http_client()
+    await close_redis_pool()
+    password_hasher.shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+
 
-# Create all database tables
-base.Base.metadata.create_all(bind=engine)
+app = FastAPI(title=settings.PROJECT_NAME, version="1.0.0", lifespan=lifespan)
+register_exception_handlers(app)
 
-app = FastAPI(title=settings.PROJECT_NAME, version="1.0.0")
+# Pin recent writers to the primary for replica-backed reads
+app.middleware("http")(read_your_writes_middleware)
 
 # CORS middleware
 app.add_middleware(
@@ -38,6 +72,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -46,10 +81,14 @@ app.include_router(admin_auth.router, prefix="/api/v1", tags=["admin_auth"])
 app.include_router(user.router, prefix="/api/v1", tags=["users"])
 app.include_router(documents.router, prefix="/api/v1", tags=["documents"])
 app.include_router(bank_accounts.router, prefix="/api/v1", tags=["bank_accounts"])
+app.include_router(expense_import.router, prefix="/api/v1", tags=["expense_import"])
 app.include_router(expenses.router, prefix="/api/v1", tags=["expenses"])
 app.include_router(income.router, prefix="/api/v1", tags=["income"])
+app.include_router(export.router, prefix="/api/v1", tags=["export"])
+app.include_router(summary.router, prefix="/api/v1", tags=["summary"])
 app.include_router(currency_tracing.router, prefix="/api/v1", tags=["currency"])
 app.include_router(engagement.router, prefix="/api/v1", tags=["engagement"])
+app.include_router(notifications.router, prefix="/api/v1", tags=["notifications"])
 app.include_router(financial.router, prefix="/api/v1", tags=["financial_modules"])
 app.include_router(tax_resources.router, prefix="/api/v1", tags=["tax_resources"])
 app.include_router(support_ticket.router, prefix="/api/v1", tags=["support_tickets"])  # user tickets
@@ -57,11 +96,9 @@ app.include_router(admin_support_ticket.router, prefix="/api/v1", tags=["admin_s
 app.include_router(admin_financial_modules.router, prefix="/api/v1", tags=["admin_financial_modules"])
 app.include_router(admin_support_ops.router, prefix="/api/v1", tags=["admin_support_ops"])
 app.include_router(admin_dashboard_ops.router, prefix="/api/v1", tags=["admin_dashboard_ops"])
+app.include_router(payment_recurrences.router, prefix="/api/v1", tags=["payment_recurrences"])
 app.include_router(payments.router, prefix="/api/v1", tags=["payments"])
 app.include_router(subscription.router, prefix="/api/v1", tags=["subscriptions"])
 app.include_router(admin_users.router, prefix="/api/v1", tags=["admin_users"])
+app.include_router(admin_metrics.router, prefix="/api/v1", tags=["admin_metrics"])
 
-
-@app.on_event("shutdown")
-def shutdown_event():
-    engine.dispose()
@@ -1,7 +1,21 @@
 # app/models/__init__.py
 
 # Import all models so SQLAlchemy knows about all mappers
+# (and Alembic sees every table on Base.metadata)
 from .users import User
 from .documents import UserDocument
 from .bank_accounts import BankAccount
-# from .audit_logs import UserAuditLog  # Uncomment if using audit logs
+from .audit import UserAuditLog
+from .currency_tracing import CurrencyTrace
+from .engagement import UserEngagement
+from .expenses import Expense
+from .financial import FinancialModule, Section, SectionTag, QuizQuestion
+from .fx_rate import FxRate, FxRatePoint
+from .income import Income
+from .notification import Notification
+from .payment import Payment
+from .payments import PaymentRecurrence, ScheduledPayment
+from .rollups import MonthlyRollup
+from .subscription import Subscription
+from .support_ticket import SupportTicket
+from .tax_resource import TaxResource
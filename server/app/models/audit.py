@@ -1,11 +1,14 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 
 class UserAuditLog(Base):
     __tablename__ = "user_audit_logs"
+    __table_args__ = (
+        Index("ix_user_audit_logs_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,11 +1,14 @@
 # app/models/bank_accounts.py
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from datetime import datetime
 from app.models.base import Base
 from sqlalchemy.orm import relationship
 
 class BankAccount(Base):
     __tablename__ = "bank_accounts"
+    __table_args__ = (
+        Index("ix_bank_accounts_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
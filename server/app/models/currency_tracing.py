@@ -1,11 +1,21 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 
 class CurrencyTrace(Base):
+    """
+    A pair the user traces, upserted on every lookup with the latest rate.
+    The sampler records rates for recently traced pairs into `fx_rate_points`
+    (see app/services/currency_trace_service.py).
+    """
     __tablename__ = "currency_tracing"
+    __table_args__ = (
+        Index("ix_currency_tracing_user_id_created_at", "user_id", "created_at"),
+        Index("ux_currency_tracing_user_pair", "user_id", "base", "quote", unique=True),
+        Index("ix_currency_tracing_last_traced_at", "last_traced_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -14,7 +24,10 @@ class CurrencyTrace(Base):
     description = Column(String(500), nullable=False)
     status = Column(String(50), nullable=False)  # traced | warning | verified
     date = Column(String(50), nullable=False)
+    base = Column(String(3), nullable=True)
+    quote = Column(String(3), nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+    last_traced_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="currency_traces")
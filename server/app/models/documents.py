@@ -1,10 +1,13 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class UserDocument(Base):
     __tablename__ = "user_documents"
+    __table_args__ = (
+        Index("ix_user_documents_user_id_uploaded_at", "user_id", "uploaded_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
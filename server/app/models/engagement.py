@@ -1,11 +1,23 @@
 # server/app/models/engagement.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class UserEngagement(Base):
     __tablename__ = "user_engagements"
+    __table_args__ = (
+        Index("ix_user_engagements_user_id_critical_date", "user_id", "critical_date"),
+        # Reminder sweep: open deadlines not yet reminded, in deadline order;
+        # snoozed_until rides along so snoozed rows are filtered from the index
+        Index(
+            "ix_user_engagements_open_deadlines",
+            "critical_date",
+            "id",
+            postgresql_where=text("is_done = false AND reminded_at IS NULL AND critical_date IS NOT NULL"),
+            postgresql_include=["snoozed_until"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -15,5 +27,6 @@ class UserEngagement(Base):
     critical_date = Column(DateTime, nullable=True)  # for deadlines
     snoozed_until = Column(DateTime, nullable=True)
     is_done = Column(Boolean, default=False)
+    reminded_at = Column(DateTime, nullable=True)  # cleared when the deadline or snooze changes
 
     user = relationship("User", back_populates="engagements")
@@ -1,15 +1,19 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_user_id_date", "user_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     category = Column(String(100), nullable=False)
     amount = Column(Float, nullable=False)
+    currency = Column(String(3), nullable=False, default="USD", server_default="USD")  # ISO 4217
     description = Column(String(255), default="")
     date = Column(DateTime, default=datetime.utcnow)
 
@@ -1,10 +1,11 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class FinancialModule(Base):
     __tablename__ = "financial_modules"
+    __table_args__ = (Index("ix_financial_modules_user_id", "user_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -16,7 +17,17 @@ class FinancialModule(Base):
 
 
 class Section(Base):
+    """
+    A module section. On Postgres the table also has a generated
+    `search_vector` tsvector column (title, tags and content, GIN-indexed;
+    see migration 0007_section_search). It is left unmapped so the model
+    still works on other databases; `SectionSearchService` queries it.
+    """
     __tablename__ = "sections"
+    __table_args__ = (
+        Index("ix_sections_module_id", "module_id"),
+        Index("ix_sections_region", "region"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     module_id = Column(Integer, ForeignKey("financial_modules.id"), nullable=False)
@@ -31,8 +42,22 @@ class Section(Base):
     module = relationship("FinancialModule", back_populates="sections")
 
 
+class SectionTag(Base):
+    """
+    One row per (normalized tag, section): `Section.tags` lower-cased and
+    trimmed. Kept in step with `sections` by a trigger (migration
+    0007_section_search); the primary key serves tag lookups.
+    """
+    __tablename__ = "section_tags"
+    __table_args__ = (Index("ix_section_tags_section_id", "section_id"),)
+
+    tag = Column(String(100), primary_key=True)
+    section_id = Column(Integer, ForeignKey("sections.id", ondelete="CASCADE"), primary_key=True)
+
+
 class QuizQuestion(Base):
     __tablename__ = "quiz_questions"
+    __table_args__ = (Index("ix_quiz_questions_module_id", "module_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     module_id = Column(Integer, ForeignKey("financial_modules.id"), nullable=False)
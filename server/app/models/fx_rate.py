@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index
+from app.models.base import Base
+
+class FxRate(Base):
+    """
+    Daily exchange rate history: units of `quote` per one unit of `base`.
+    The primary key doubles as the as-of index: the rate in force on a day
+    is the last row at or before it for (base, quote). Rows are recorded
+    against FX_PIVOT_CURRENCY by the fx_history job; other pairs are derived.
+    """
+    __tablename__ = "fx_rates"
+
+    base = Column(String(3), primary_key=True)
+    quote = Column(String(3), primary_key=True)
+    date = Column(Date, primary_key=True)
+    rate = Column(Float, nullable=False)
+
+
+class FxRatePoint(Base):
+    """
+    Intraday rate series for traced pairs in three resolution tiers:
+    `raw` samples (open = high = low = close), and `hour` and `day` OHLC
+    buckets compacted from the tier below. Each tier has its own retention.
+    """
+    __tablename__ = "fx_rate_points"
+    __table_args__ = (Index("ix_fx_rate_points_resolution_bucket", "resolution", "bucket_start"),)
+
+    base = Column(String(3), primary_key=True)
+    quote = Column(String(3), primary_key=True)
+    resolution = Column(String(4), primary_key=True)  # raw | hour | day
+    bucket_start = Column(DateTime, primary_key=True)
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    samples = Column(Integer, nullable=False, default=1)
@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from app.models.base import Base
+
+class Notification(Base):
+    """
+    In-app notification outbox. `dedupe_key` is unique, so producers enqueue
+    with ON CONFLICT DO NOTHING and a retried or concurrent run can't send the
+    same reminder twice.
+    """
+    __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    type = Column(String(20), nullable=False, default="default")  # payment | alert | success | default
+    title = Column(String(255), nullable=False)
+    message = Column(String(1000), nullable=False, default="")
+    dedupe_key = Column(String(200), nullable=False, unique=True)
+    engagement_id = Column(Integer, ForeignKey("user_engagements.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    read_at = Column(DateTime, nullable=True)
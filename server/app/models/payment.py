@@ -1,10 +1,20 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_user_id_created_at", "user_id", "created_at"),
+        Index("ix_payments_created_at", "created_at"),
+        Index(
+            "ix_payments_not_refunded_created_at",
+            "created_at",
+            postgresql_where=text("refunded = false"),
+            postgresql_include=["amount"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 import enum
@@ -9,13 +9,64 @@ class PaymentStatus(str, enum.Enum):
     done = "done"
     due = "due"
 
+class RecurrenceFrequency(str, enum.Enum):
+    daily = "daily"
+    weekly = "weekly"
+    monthly = "monthly"
+    yearly = "yearly"
+
 class ScheduledPayment(Base):
     __tablename__ = "scheduled_payments"  # NEW table
+    __table_args__ = (
+        Index("ix_scheduled_payments_user_id_scheduled_date_status", "user_id", "scheduled_date", "status"),
+        Index(
+            "ix_scheduled_payments_pending_scheduled_date",
+            "scheduled_date",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # One row per occurrence, so re-running the materializer is harmless
+        Index("ux_scheduled_payments_recurrence_occurrence", "recurrence_id", "scheduled_date", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     amount = Column(Float, nullable=False)
     description = Column(String(255), default="")
     scheduled_date = Column(DateTime, nullable=False)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.pending)
+    recurrence_id = Column(Integer, ForeignKey("payment_recurrences.id", ondelete="SET NULL"), nullable=True)
+
+    user = relationship("User", back_populates="scheduled_payments")
+
+class PaymentRecurrence(Base):
+    """
+    A repeating payment (rent, installments, bills), stored once. Occurrence n
+    falls at `starts_at` plus n * `interval` units of `frequency` (monthly and
+    yearly clamp to the last day of short months); the rule ends after `count`
+    occurrences or after `until`, whichever comes first.
 
-    user = relationship("User", back_populates="scheduled_payments")
\ No newline at end of file
+    Occurrences before `next_occurrence_at` have been materialized as
+    ScheduledPayment rows by the background job; later ones are expanded on
+    demand when listing.
+    """
+    __tablename__ = "payment_recurrences"
+    __table_args__ = (
+        Index("ix_payment_recurrences_user_id", "user_id"),
+        # Drives the materializer: rules whose next occurrence falls inside the horizon
+        Index(
+            "ix_payment_recurrences_next_occurrence_at",
+            "next_occurrence_at",
+            postgresql_where=text("next_occurrence_at IS NOT NULL"),
+        ),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Float, nullable=False)
+    description = Column(String(255), default="")
+    frequency = Column(Enum(RecurrenceFrequency), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    starts_at = Column(DateTime, nullable=False)
+    until = Column(DateTime, nullable=True)
+    count = Column(Integer, nullable=True)
+    next_index = Column(Integer, nullable=False, default=0)  # first occurrence not yet materialized
+    next_occurrence_at = Column(DateTime, nullable=True)  # NULL once the rule is exhausted
+    created_at = Column(DateTime, default=datetime.utcnow)
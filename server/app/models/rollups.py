@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Date
+from app.models.base import Base
+
+class MonthlyRollup(Base):
+    """
+    Per-user, per-month, per-currency, per-category totals of expenses and
+    income. Maintained by database triggers on `expenses` and `income` (see
+    migrations 0004_monthly_rollups and 0010_rollup_currency);
+    `RollupService.rebuild` recomputes it from scratch.
+    """
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)  # first day of the month
+    kind = Column(String(10), primary_key=True)  # expense | income
+    currency = Column(String(3), primary_key=True)  # ISO 4217, as on the source rows
+    category = Column(String(100), primary_key=True)  # "" for income
+    total = Column(Float, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,11 +1,16 @@
 # app/models/subscription.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        Index("ix_subscriptions_user_id", "user_id"),
+        Index("ix_subscriptions_started_at", "started_at"),
+        Index("ix_subscriptions_not_churned", "started_at", postgresql_where=text("churned = false")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
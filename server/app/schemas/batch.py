@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class BatchOpResult(BaseModel):
+    op: str  # create | update | delete
+    index: int  # position within that operation's list in the request
+    id: Optional[int] = None
+    status: str  # created | updated | deleted | not_found
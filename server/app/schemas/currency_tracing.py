@@ -1,11 +1,22 @@
 from pydantic import BaseModel
+from datetime import datetime
+from typing import List
 
-class CurrencyTraceOut(BaseModel):
-    id: int
-    title: str
-    description: str
-    status: str
-    date: str
+class RatePointOut(BaseModel):
+    bucket_start: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    samples: int
 
     class Config:
         orm_mode = True
+
+class RateHistoryOut(BaseModel):
+    base: str
+    quote: str
+    resolution: str  # raw | hour | day
+    start: datetime
+    end: datetime
+    points: List[RatePointOut]
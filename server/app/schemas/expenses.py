@@ -1,16 +1,20 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from app.schemas.batch import BatchOpResult
+from app.schemas.fx import CURRENCY_PATTERN
 
 class ExpenseCreate(BaseModel):
     category: str
     amount: float
+    currency: str = Field("USD", pattern=CURRENCY_PATTERN)
     description: Optional[str] = ""
     date: Optional[datetime] = None
 
 class ExpenseUpdate(BaseModel):
     category: Optional[str]
     amount: Optional[float]
+    currency: str = Field(None, pattern=CURRENCY_PATTERN)  # may be left out, not null: the column is NOT NULL
     description: Optional[str]
     date: Optional[datetime]
 
@@ -19,8 +23,28 @@ class ExpenseOut(BaseModel):
     user_id: int
     category: str
     amount: float
+    currency: str
     description: str
     date: datetime
 
     class Config:
         orm_mode = True
+
+class ExpenseBatchUpdate(BaseModel):
+    id: int
+    category: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = Field(None, pattern=CURRENCY_PATTERN)
+    description: Optional[str] = None
+    date: Optional[datetime] = None
+
+class ExpenseBatch(BaseModel):
+    create: List[ExpenseCreate] = []
+    update: List[ExpenseBatchUpdate] = []
+    delete: List[int] = []
+
+class ExpenseBatchResult(BatchOpResult):
+    item: Optional[ExpenseOut] = None
+
+class ExpenseBatchOut(BaseModel):
+    results: List[ExpenseBatchResult]
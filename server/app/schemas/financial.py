@@ -18,7 +18,7 @@ class SectionCreate(SectionBase):
     pass
 
 class SectionUpdate(SectionBase):
-    pass
+    id: Optional[int] = None  # existing section to update; omit to add a new one
 
 class SectionOut(SectionBase):
     id: int
@@ -39,7 +39,7 @@ class QuizQuestionCreate(QuizQuestionBase):
     pass
 
 class QuizQuestionUpdate(QuizQuestionBase):
-    pass
+    id: Optional[int] = None  # existing question to update; omit to add a new one
 
 class QuizQuestionOut(QuizQuestionBase):
     id: int
@@ -71,3 +71,17 @@ class FinancialModuleOut(FinancialModuleBase):
 
     class Config:
         orm_mode = True
+
+
+# -------------------
+# Search
+# -------------------
+class SectionSearchHit(BaseModel):
+    section_id: int
+    module_id: int
+    module_title: str
+    title: str
+    region: Optional[str] = None
+    tags: List[str] = []
+    snippet: str  # matches wrapped in <mark></mark>
+    rank: float
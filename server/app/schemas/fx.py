@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, List
+
+CURRENCY_PATTERN = r"^[A-Z]{3}$"  # ISO 4217
+
+class ConvertedMonth(BaseModel):
+    month: date
+    expenses: float
+    income: float
+    net: float
+
+class ConvertedSummaryOut(BaseModel):
+    currency: str
+    start: date
+    end: date
+    total_expenses: float
+    total_income: float
+    net: float
+    months: List[ConvertedMonth]
+    source_currencies: Dict[str, int]  # rows per original currency
+    unconverted: Dict[str, int] = {}  # rows in currencies with no rate history, left out of the totals
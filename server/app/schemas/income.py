@@ -1,14 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from app.schemas.batch import BatchOpResult
+from app.schemas.fx import CURRENCY_PATTERN
 
 class IncomeCreate(BaseModel):
     amount: float
+    currency: str = Field("USD", pattern=CURRENCY_PATTERN)
     description: Optional[str] = ""
     date: Optional[datetime] = None
 
 class IncomeUpdate(BaseModel):
     amount: Optional[float]
+    currency: str = Field(None, pattern=CURRENCY_PATTERN)  # may be left out, not null: the column is NOT NULL
     description: Optional[str]
     date: Optional[datetime]
 
@@ -16,8 +20,27 @@ class IncomeOut(BaseModel):
     id: int
     user_id: int
     amount: float
+    currency: str
     description: str
     date: datetime
 
     class Config:
         orm_mode = True
+
+class IncomeBatchUpdate(BaseModel):
+    id: int
+    amount: Optional[float] = None
+    currency: Optional[str] = Field(None, pattern=CURRENCY_PATTERN)
+    description: Optional[str] = None
+    date: Optional[datetime] = None
+
+class IncomeBatch(BaseModel):
+    create: List[IncomeCreate] = []
+    update: List[IncomeBatchUpdate] = []
+    delete: List[int] = []
+
+class IncomeBatchResult(BatchOpResult):
+    item: Optional[IncomeOut] = None
+
+class IncomeBatchOut(BaseModel):
+    results: List[IncomeBatchResult]
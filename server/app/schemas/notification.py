@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class NotificationOut(BaseModel):
+    id: int
+    type: str
+    title: str
+    message: str
+    engagement_id: Optional[int]
+    created_at: datetime
+    read_at: Optional[datetime]
+
+    class Config:
+        orm_mode = True
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
-from app.models.payments import PaymentStatus
+from app.models.payments import PaymentStatus, RecurrenceFrequency
 
 class PaymentCreate(BaseModel):
     amount: float
@@ -24,3 +24,42 @@ class PaymentOut(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class RecurrenceCreate(BaseModel):
+    amount: float
+    description: Optional[str] = ""
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1, le=365)  # every N days/weeks/months/years
+    starts_at: datetime  # first occurrence; also fixes day of month and time
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(None, ge=1, le=10000)
+
+class RecurrenceUpdate(BaseModel):
+    amount: Optional[float] = None
+    description: Optional[str] = None
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(None, ge=1, le=10000)
+
+class RecurrenceOut(BaseModel):
+    id: int
+    user_id: int
+    amount: float
+    description: str
+    frequency: RecurrenceFrequency
+    interval: int
+    starts_at: datetime
+    until: Optional[datetime]
+    count: Optional[int]
+    next_occurrence_at: Optional[datetime]
+
+    class Config:
+        orm_mode = True
+
+class OccurrenceOut(BaseModel):
+    payment_id: Optional[int] = None  # None until the materializer has created the row
+    recurrence_id: Optional[int] = None
+    amount: float
+    description: str
+    scheduled_date: datetime
+    status: PaymentStatus
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, List, Optional
+
+class CategoryTotal(BaseModel):
+    category: str
+    total: float
+    count: int
+    share: float  # fraction of all expenses in the range
+
+class MonthSummary(BaseModel):
+    month: date
+    expenses: float
+    income: float
+    net: float
+    expense_change: Optional[float] = None  # vs the previous month
+    income_change: Optional[float] = None
+    expense_change_pct: Optional[float] = None
+    income_change_pct: Optional[float] = None
+    categories: Dict[str, float] = {}
+
+class CurrencySummary(BaseModel):
+    currency: str
+    total_expenses: float
+    total_income: float
+    net: float
+    categories: List[CategoryTotal]
+    months: List[MonthSummary]
+
+class SummaryOut(BaseModel):
+    start: date
+    end: date
+    currencies: List[CurrencySummary]  # one entry per currency with rows in or just before the range
@@ -4,7 +4,7 @@ from datetime import timedelta
 
 from app.models.users import User
 from app.schemas.admin_auth import AdminCreate
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash, verify_and_update_password, create_access_token
 from app.core.config import settings
 
 class AdminAuthService:
@@ -38,11 +38,17 @@ class AdminAuthService:
     @staticmethod
     def login_admin(db: Session, email: str, password: str):
         user = db.query(User).filter(User.email == email, User.is_superuser == True).first()
-        if not user or not verify_password(password, user.hashed_password):
+        valid, new_hash = (False, None)
+        if user:
+            valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid admin email or password"
             )
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
         access_token = create_access_token(
             data={"sub": str(user.id)}, 
             expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
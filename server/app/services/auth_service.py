@@ -6,13 +6,14 @@ from app.models.users import User
 from app.models.audit import UserAuditLog
 from app.schemas.auth import UserCreate, Token, UpdateUserProfileRequest
 from app.core.security import (
-    verify_password,
+    verify_and_update_password,
     get_password_hash,
     create_access_token,
     verify_email_verification_token,
     create_email_verification_token,
 )
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 from app.services.email_service import EmailService
 
 
@@ -51,6 +52,9 @@ class AuthService:
 
             return user
 
+        except HTTPException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise HTTPException(
@@ -81,6 +85,7 @@ class AuthService:
         user.is_verified = True
         db.commit()
         db.refresh(user)
+        principal_cache.invalidate(user.id)
 
         return {"message": "Email verified successfully"}
 
@@ -88,12 +93,23 @@ class AuthService:
     def login_user(db: Session, email: str, password: str) -> Token:
         """Authenticate and return a JWT token for verified users."""
         user = db.query(User).filter(User.email == email).first()
-        if not user or not verify_password(password, user.hashed_password):
+        if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
             )
 
+        valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not valid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid email or password",
+            )
+        if new_hash:
+            # Hash parameters changed since this password was stored
+            user.hashed_password = new_hash
+            db.commit()
+
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"sub": str(user.id)}, expires_delta=access_token_expires
@@ -164,6 +180,7 @@ class AuthService:
             db.add(user)
             db.commit()
             db.refresh(user)
+            principal_cache.invalidate(user.id)
 
             # Log the changes in the audit log
             AuthService.log_profile_change(
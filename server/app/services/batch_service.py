@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import List, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, cast, column, delete, func, insert, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.conversion_service import touch_ledger
+
+# Upper bound on create + update + delete operations in one request
+BATCH_MAX_OPERATIONS = 1000
+
+# Statements here carry their own user_id criteria; nothing in the session needs syncing
+NO_SYNC = {"synchronize_session": False}
+
+
+class BatchService:
+    """
+    Applies a mixed list of create/update/delete operations for one user's rows
+    with one statement per operation type, all inside a single transaction.
+    """
+
+    @staticmethod
+    def check(batch) -> None:
+        total = len(batch.create) + len(batch.update) + len(batch.delete)
+        if total == 0:
+            raise HTTPException(status_code=400, detail="Batch is empty")
+        if total > BATCH_MAX_OPERATIONS:
+            raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_OPERATIONS} operations per batch")
+
+        ids = [op.id for op in batch.update] + list(batch.delete)
+        if len(ids) != len(set(ids)):
+            raise HTTPException(status_code=400, detail="Each id may appear in at most one update or delete")
+
+    @staticmethod
+    async def create(db: AsyncSession, model, user_id: int, ops: Sequence) -> List[dict]:
+        rows = []
+        for op in ops:
+            row = op.dict()
+            row["user_id"] = user_id
+            row["date"] = row.get("date") or datetime.utcnow()
+            rows.append(row)
+
+        # insert ... values (...), (...) returning *, in parameter order
+        created = await db.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True), rows
+        )
+        return [
+            {"op": "create", "index": i, "id": item.id, "status": "created", "item": item}
+            for i, item in enumerate(created.all())
+        ]
+
+    @staticmethod
+    def update_statement(model, user_id: int, ops: Sequence, fields: Sequence[str], dialect: str):
+        """
+        with changes (id, ...) as (values ...)
+        update t set f = coalesce(changes.f, t.f) from changes where t.id = changes.id and t.user_id = :user_id
+
+        A field left out of an operation (or sent as null) keeps its current
+        value. The CTE form runs on Postgres and SQLite (3.33+) alike.
+        """
+        changes = values(
+            column("id", Integer),
+            *[column(f, model.__table__.c[f].type) for f in fields],
+            name="changes",
+        ).data([(op.id, *[getattr(op, f) for f in fields]) for op in ops]).cte("changes")
+
+        def typed(f):
+            # Postgres types a VALUES column that is NULL in every row as text,
+            # which coalesce can't match with the target column. SQLite is
+            # dynamically typed, and its CAST AS DATETIME would turn the stored
+            # string into a number, so it gets the bare column.
+            if dialect == "postgresql":
+                return cast(changes.c[f], model.__table__.c[f].type)
+            return changes.c[f]
+
+        return (
+            update(model)
+            .where(model.id == changes.c.id, model.user_id == user_id)
+            .values({f: func.coalesce(typed(f), getattr(model, f)) for f in fields})
+            .returning(model)
+        )
+
+    @staticmethod
+    async def update(db: AsyncSession, model, user_id: int, ops: Sequence, fields: Sequence[str]) -> List[dict]:
+        stmt = BatchService.update_statement(model, user_id, ops, fields, db.get_bind().dialect.name)
+        updated = {item.id: item for item in (await db.scalars(stmt, execution_options=NO_SYNC)).all()}
+        return [
+            {
+                "op": "update",
+                "index": i,
+                "id": op.id,
+                "status": "updated" if op.id in updated else "not_found",
+                "item": updated.get(op.id),
+            }
+            for i, op in enumerate(ops)
+        ]
+
+    @staticmethod
+    async def delete(db: AsyncSession, model, user_id: int, ids: Sequence[int]) -> List[dict]:
+        stmt = (
+            delete(model)
+            .where(model.user_id == user_id, model.id.in_(ids))
+            .returning(model.id)
+        )
+        deleted = set((await db.scalars(stmt, execution_options=NO_SYNC)).all())
+        return [
+            {"op": "delete", "index": i, "id": id_, "status": "deleted" if id_ in deleted else "not_found"}
+            for i, id_ in enumerate(ids)
+        ]
+
+    @staticmethod
+    async def apply(db: AsyncSession, model, user_id: int, batch, fields: Sequence[str]) -> List[dict]:
+        """
+        Run every operation in `batch` for `user_id`. Ids that don't exist or
+        belong to another user come back as not_found; the rest commit together.
+        """
+        BatchService.check(batch)
+
+        results: List[dict] = []
+        try:
+            if batch.create:
+                results += await BatchService.create(db, model, user_id, batch.create)
+            if batch.update:
+                results += await BatchService.update(db, model, user_id, batch.update, fields)
+            if batch.delete:
+                results += await BatchService.delete(db, model, user_id, batch.delete)
+            touch_ledger(db.sync_session, user_id)  # bulk DML bypasses the flush hooks
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return results
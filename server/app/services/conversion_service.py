@@ -0,0 +1,194 @@
+import asyncio
+import json
+from datetime import date
+from itertools import chain
+from typing import Optional, Tuple
+
+import numpy as np
+import redis
+from sqlalchemy import event, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import get_redis, redis_client
+from app.models.expenses import Expense
+from app.models.income import Income
+from app.services.fx_history import HISTORY_VERSION_KEY, RateHistory
+from app.services.rollup_service import add_months, months_between
+
+# Bumped after every commit that changes a user's expenses or income
+LEDGER_VERSION_KEY = "fx:ledger:{user_id}"
+TOTALS_KEY = "fx:totals:{user_id}:{currency}:{start}:{end}:{ledger}:{history}"
+
+EXPENSE, INCOME = 0, 1
+
+
+def convert(amounts: np.ndarray, currencies: np.ndarray, days: np.ndarray, to_currency: str, history: RateHistory) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `amounts` (in `currencies`, on `days`) expressed in `to_currency` at the
+    rates in force on each day, plus a mask of the rows that could be
+    converted. One as-of gather per distinct currency, never one per row.
+    """
+    converted = np.zeros(len(amounts))
+    ok = np.zeros(len(amounts), dtype=bool)
+    target = history.as_of(to_currency, days)
+    for code in np.unique(currencies):
+        if not history.has(code):
+            continue
+        rows = currencies == code
+        # amount / (code per pivot) = pivot units; * (target per pivot) = target units
+        converted[rows] = amounts[rows] * target[rows] / history.as_of(code, days[rows])
+        ok[rows] = True
+    return converted, ok
+
+
+class ConversionService:
+    @staticmethod
+    async def _cache_key(user_id: int, currency: str, start: date, end: date) -> Optional[str]:
+        try:
+            ledger, history = await get_redis().mget(LEDGER_VERSION_KEY.format(user_id=user_id), HISTORY_VERSION_KEY)
+        except redis.RedisError:
+            return None
+        return TOTALS_KEY.format(
+            user_id=user_id, currency=currency, start=start, end=end, ledger=ledger or 0, history=history or 0
+        )
+
+    @staticmethod
+    async def summary(db: AsyncSession, user_id: int, currency: str, start: date, end: date) -> Optional[dict]:
+        """
+        The user's expenses and income for the months `start`..`end`
+        (inclusive), converted to `currency` at each row's as-of rate.
+        Cached per (user, currency, period) until the user's ledger or the
+        rate history changes. None if there is no rate history for `currency`.
+        """
+        key = await ConversionService._cache_key(user_id, currency, start, end)
+        if key:
+            try:
+                cached = await get_redis().get(key)
+            except redis.RedisError:
+                cached = None
+            if cached:
+                return json.loads(cached)
+
+        result = await ConversionService.compute(db, user_id, currency, start, end)
+        if key and result is not None:
+            try:
+                await get_redis().set(key, json.dumps(result), ex=settings.FX_CONVERSION_CACHE_TTL_SECONDS)
+            except redis.RedisError:
+                pass
+        return result
+
+    @staticmethod
+    async def compute(db: AsyncSession, user_id: int, currency: str, start: date, end: date) -> Optional[dict]:
+        until = add_months(end, 1)
+        rows = (await db.execute(union_all(
+            select(Expense.date, Expense.amount, Expense.currency, literal(EXPENSE).label("kind"))
+            .where(Expense.user_id == user_id, Expense.date >= start, Expense.date < until),
+            select(Income.date, Income.amount, Income.currency, literal(INCOME).label("kind"))
+            .where(Income.user_id == user_id, Income.date >= start, Income.date < until),
+        ))).all()
+
+        n = len(rows)
+        days = np.array([row.date for row in rows], dtype="datetime64[D]")
+        amounts = np.fromiter((row.amount for row in rows), dtype=np.float64, count=n)
+        codes = np.array([row.currency for row in rows], dtype="U3")
+        kinds = np.fromiter((row.kind for row in rows), dtype=np.int64, count=n)
+
+        source, counts = np.unique(codes, return_counts=True)
+        history = await RateHistory.load(db, settings.FX_PIVOT_CURRENCY, chain(source.tolist(), [currency]), until)
+        if not history.has(currency):
+            return None
+        converted, ok = convert(amounts, codes, days, currency, history)
+
+        # Bucket by (month offset, kind) in one bincount
+        months = months_between(start, end) + 1
+        offsets = (days.astype("datetime64[M]") - np.datetime64(start, "M")).astype(np.int64)
+        buckets = np.bincount(offsets[ok] * 2 + kinds[ok], weights=converted[ok], minlength=months * 2)
+        by_month = buckets.reshape(months, 2)
+
+        total_expenses = float(by_month[:, EXPENSE].sum())
+        total_income = float(by_month[:, INCOME].sum())
+        return {
+            "currency": currency,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "total_expenses": round(total_expenses, 2),
+            "total_income": round(total_income, 2),
+            "net": round(total_income - total_expenses, 2),
+            "months": [
+                {
+                    "month": add_months(start, i).isoformat(),
+                    "expenses": round(float(expenses), 2),
+                    "income": round(float(income), 2),
+                    "net": round(float(income - expenses), 2),
+                }
+                for i, (expenses, income) in enumerate(by_month)
+            ],
+            "source_currencies": {str(code): int(count) for code, count in zip(source, counts)},
+            "unconverted": {
+                str(code): int(count) for code, count in zip(source, counts) if not history.has(str(code))
+            },
+        }
+
+
+# -----------------------------
+# Ledger versions (session hooks)
+# -----------------------------
+LEDGER_USERS_KEY = "fx_ledger_users"
+_background_tasks = set()
+
+
+def touch_ledger(session: Session, user_id: int) -> None:
+    """Mark a user's ledger changed by a statement the ORM doesn't track (bulk DML)."""
+    session.info.setdefault(LEDGER_USERS_KEY, set()).add(user_id)
+
+
+async def _abump(user_ids) -> None:
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.incr(LEDGER_VERSION_KEY.format(user_id=user_id))
+        await pipe.execute()
+    except redis.RedisError as e:
+        print(f"[Conversion] Could not bump ledger versions: {e}")
+
+
+def _bump(user_ids) -> None:
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.incr(LEDGER_VERSION_KEY.format(user_id=user_id))
+        pipe.execute()
+    except redis.RedisError as e:
+        print(f"[Conversion] Could not bump ledger versions: {e}")
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_ledger_users(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (Expense, Income)):
+            touch_ledger(session, obj.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_ledger_versions(session):
+    user_ids = session.info.pop(LEDGER_USERS_KEY, None)
+    if not user_ids:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None:
+        _bump(user_ids)  # threadpool / scripts / import jobs
+    else:
+        # AsyncSession commit: don't block the event loop on Redis
+        task = loop.create_task(_abump(user_ids))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_ledger_users(session, previous_transaction):
+    session.info.pop(LEDGER_USERS_KEY, None)
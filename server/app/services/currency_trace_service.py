@@ -0,0 +1,231 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.scheduler import register_job
+from app.db.session import AsyncSessionLocal
+from app.models.currency_tracing import CurrencyTrace
+from app.models.fx_rate import FxRatePoint
+from app.services.fx_service import RateTable, fx_rates
+
+# (tier, tier it is compacted from, date_trunc unit), finest first
+COMPACTIONS = [("hour", "raw", "hour"), ("day", "hour", "day")]
+
+# Widest range a tier answers, so a chart never reads more than a few
+# thousand points: 2 days of minutes, 60 days of hours, then days
+TIER_MAX_SPAN = {"raw": timedelta(days=2), "hour": timedelta(days=60)}
+
+# Most points /history returns, whatever resolution is asked for
+HISTORY_MAX_POINTS = 5000
+
+
+def retention() -> Dict[str, timedelta]:
+    return {
+        "raw": timedelta(days=settings.FX_TRACE_RAW_RETENTION_DAYS),
+        "hour": timedelta(days=settings.FX_TRACE_HOURLY_RETENTION_DAYS),
+        "day": timedelta(days=settings.FX_TRACE_DAILY_RETENTION_DAYS),
+    }
+
+
+def pick_resolution(start: datetime, end: datetime, now: datetime) -> str:
+    """The finest tier that still holds `start` and keeps the range within its span."""
+    kept = retention()
+    for tier in ("raw", "hour"):
+        if end - start <= TIER_MAX_SPAN[tier] and start >= now - kept[tier]:
+            return tier
+    return "day"
+
+
+def covers(resolution: str, start: datetime, end: datetime) -> bool:
+    """Whether `resolution` can answer the whole range without running past HISTORY_MAX_POINTS."""
+    return resolution not in TIER_MAX_SPAN or end - start <= TIER_MAX_SPAN[resolution]
+
+
+def _compact_sql(tier: str, source: str, unit: str) -> str:
+    # Re-aggregates from the newest existing bucket, which may have been partial
+    return f"""
+        INSERT INTO fx_rate_points AS p (base, quote, resolution, bucket_start, open, high, low, close, samples)
+        SELECT base, quote, '{tier}', date_trunc('{unit}', bucket_start) AS bucket,
+               (array_agg(open ORDER BY bucket_start))[1],
+               max(high),
+               min(low),
+               (array_agg(close ORDER BY bucket_start DESC))[1],
+               sum(samples)
+        FROM fx_rate_points
+        WHERE resolution = '{source}' AND bucket_start >= :since
+        GROUP BY base, quote, bucket
+        ON CONFLICT (base, quote, resolution, bucket_start) DO UPDATE
+        SET open = EXCLUDED.open, high = EXCLUDED.high, low = EXCLUDED.low,
+            close = EXCLUDED.close, samples = EXCLUDED.samples
+    """
+
+
+class CurrencyTraceService:
+    @staticmethod
+    async def record(db: AsyncSession, user_id: int, base: str, records: Dict[str, dict], now: datetime) -> int:
+        """
+        Upsert the user's traced pairs (quote -> display record) with their
+        latest values. Pairs touched within FX_TRACE_TOUCH_SECONDS are left
+        alone, so repeated reads don't write; returns how many were written.
+        """
+        touched_since = now - timedelta(seconds=settings.FX_TRACE_TOUCH_SECONDS)
+        fresh = set((await db.scalars(
+            select(CurrencyTrace.quote).where(
+                CurrencyTrace.user_id == user_id,
+                CurrencyTrace.base == base,
+                CurrencyTrace.quote.in_(list(records)),
+                CurrencyTrace.last_traced_at >= touched_since,
+            )
+        )).all()) if records else set()
+        rows = [
+            {
+                "user_id": user_id,
+                "base": base,
+                "quote": quote,
+                "title": record["title"],
+                "description": record["description"],
+                "status": record["status"],
+                "date": record["date"].isoformat(),
+                "created_at": now,
+                "last_traced_at": now,
+            }
+            for quote, record in records.items()
+            if quote not in fresh
+        ]
+        if not rows:
+            return 0
+        stmt = pg_insert(CurrencyTrace).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "base", "quote"],
+                set_={
+                    "description": stmt.excluded.description,
+                    "status": stmt.excluded.status,
+                    "date": stmt.excluded.date,
+                    "last_traced_at": stmt.excluded.last_traced_at,
+                },
+                # A concurrent read may have touched it since the check above
+                where=CurrencyTrace.last_traced_at < touched_since,
+            )
+        )
+        await db.commit()
+        return len(rows)
+
+    @staticmethod
+    async def sample(db: AsyncSession, table: RateTable, now: datetime) -> int:
+        """
+        One raw point per pair anyone traced in the last FX_TRACE_ACTIVE_DAYS,
+        from `table`. Points are stamped with the table's fetch time, so
+        sampling the same table twice adds nothing.
+        """
+        pairs = (await db.execute(
+            select(CurrencyTrace.base, CurrencyTrace.quote)
+            .where(
+                CurrencyTrace.last_traced_at >= now - timedelta(days=settings.FX_TRACE_ACTIVE_DAYS),
+                CurrencyTrace.base.is_not(None),
+            )
+            .distinct()
+        )).all()
+        quotes_by_base = defaultdict(list)
+        for base, quote in pairs:
+            quotes_by_base[base].append(quote)
+
+        at = table.fetched_on.replace(microsecond=0)
+        rows = []
+        for base, quotes in quotes_by_base.items():
+            rates = table.cross(base, quotes)
+            rows += [
+                {"base": base, "quote": quote, "resolution": "raw", "bucket_start": at,
+                 "open": rate, "high": rate, "low": rate, "close": rate, "samples": 1}
+                for quote, rate in rates.items()
+                if rate
+            ]
+        if not rows:
+            return 0
+        result = await db.execute(pg_insert(FxRatePoint).values(rows).on_conflict_do_nothing())
+        await db.commit()
+        return result.rowcount
+
+    @staticmethod
+    async def compact(db: AsyncSession) -> Dict[str, int]:
+        """Roll raw points into hourly buckets and hourly into daily, finest first."""
+        written = {}
+        for tier, source, unit in COMPACTIONS:
+            since = await db.scalar(
+                select(func.max(FxRatePoint.bucket_start)).where(FxRatePoint.resolution == tier)
+            )
+            result = await db.execute(text(_compact_sql(tier, source, unit)), {"since": since or datetime.min})
+            written[tier] = result.rowcount
+        await db.commit()
+        return written
+
+    @staticmethod
+    async def prune(db: AsyncSession, now: datetime) -> int:
+        """Drop points past their tier's retention; runs after compact, so nothing is lost uncompacted."""
+        removed = 0
+        for tier, keep in retention().items():
+            result = await db.execute(
+                delete(FxRatePoint).where(FxRatePoint.resolution == tier, FxRatePoint.bucket_start < now - keep)
+            )
+            removed += result.rowcount
+        await db.commit()
+        return removed
+
+    @staticmethod
+    async def history(db: AsyncSession, base: str, quote: str, start: datetime, end: datetime, resolution: str) -> List[FxRatePoint]:
+        rows = await db.scalars(
+            select(FxRatePoint)
+            .where(
+                FxRatePoint.base == base,
+                FxRatePoint.quote == quote,
+                FxRatePoint.resolution == resolution,
+                FxRatePoint.bucket_start >= start,
+                FxRatePoint.bucket_start < end,
+            )
+            .order_by(FxRatePoint.bucket_start)
+            .limit(HISTORY_MAX_POINTS)
+        )
+        return rows.all()
+
+    @staticmethod
+    async def is_traced(db: AsyncSession, user_id: int, base: str, quote: str) -> bool:
+        return await db.scalar(
+            select(CurrencyTrace.id).where(
+                CurrencyTrace.user_id == user_id,
+                CurrencyTrace.base == base,
+                CurrencyTrace.quote == quote,
+            )
+        ) is not None
+
+
+# Fetch time of the last table this worker sampled
+_last_sampled_on: Optional[datetime] = None
+
+
+@register_job("currency_trace_sampler", interval=settings.FX_TRACE_SAMPLE_SECONDS)
+async def sample_traced_pairs():
+    global _last_sampled_on
+    # Also keeps the table refreshing while no one is reading rates
+    table = await fx_rates.table()
+    if table.fetched_on == _last_sampled_on or fx_rates.expired(table):
+        # Nothing new since the last tick, or only an old fallback while the upstream is down
+        return None
+    async with AsyncSessionLocal() as db:
+        sampled = await CurrencyTraceService.sample(db, table, datetime.utcnow())
+    _last_sampled_on = table.fetched_on
+    return f"{sampled} pair(s) sampled" if sampled else None
+
+
+@register_job("currency_trace_compactor", interval=settings.FX_TRACE_COMPACT_SECONDS)
+async def compact_trace_series():
+    async with AsyncSessionLocal() as db:
+        written = await CurrencyTraceService.compact(db)
+        removed = await CurrencyTraceService.prune(db, datetime.utcnow())
+    if removed or any(written.values()):
+        return f"compacted {written}, pruned {removed} point(s)"
+    return None
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+import redis
+from sqlalchemy import event, exc, false, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import LuaScript, redis_client
+from app.db.session import read_router
+from app.models.payment import Payment
+from app.models.subscription import Subscription
+from app.models.support_ticket import SupportTicket
+from app.models.users import User
+
+SNAPSHOT_KEY = "admin:dashboard_stats"
+REFRESH_LOCK_KEY = "admin:dashboard_stats:refresh"
+REFRESH_LOCK_SECONDS = 30
+
+COUNTERS = ("total_users", "pending_tickets", "total_revenue", "total_subscriptions", "active_subscriptions")
+
+# Only touch the snapshot if it exists, so a delta can never create a partial hash
+ADJUST_SOURCE = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+for i = 1, #ARGV, 2 do
+    redis.call('HINCRBYFLOAT', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+_adjust_sync = redis_client.register_script(ADJUST_SOURCE)
+_adjust_async = LuaScript(ADJUST_SOURCE)
+
+snapshot_hits = metrics.counter("dashboard_stats.hits")
+snapshot_stale = metrics.counter("dashboard_stats.stale")
+snapshot_misses = metrics.counter("dashboard_stats.misses")
+refresh_latency = metrics.histogram("dashboard_stats.refresh_ms")
+
+
+class DashboardStatsService:
+    """
+    Admin home page numbers, served from a Redis snapshot.
+
+    The snapshot is computed with a single aggregate query and then kept
+    current by counter deltas applied after each committed change to users,
+    tickets, payments or subscriptions (see the session hooks below). Older
+    than DASHBOARD_STATS_FRESH_SECONDS it is still served while one worker
+    recomputes it in the background, which also corrects any drift from writes
+    that bypass the ORM. Redis errors fall back to querying the database.
+    """
+
+    @staticmethod
+    def compute(db: Session) -> Dict[str, float]:
+        users = select(func.count()).select_from(User).scalar_subquery()
+        tickets = (
+            select(func.count().filter(SupportTicket.status == "Open"))
+            .select_from(SupportTicket)
+            .scalar_subquery()
+        )
+        revenue = select(
+            func.coalesce(func.sum(Payment.amount).filter(Payment.refunded == false()), 0)
+        ).scalar_subquery()
+        subs = select(func.count()).select_from(Subscription).scalar_subquery()
+        active = (
+            select(func.count().filter(Subscription.churned == false()))
+            .select_from(Subscription)
+            .scalar_subquery()
+        )
+        row = db.execute(select(users, tickets, revenue, subs, active)).one()
+        return dict(zip(COUNTERS, (float(v or 0) for v in row)))
+
+    @staticmethod
+    def refresh() -> Dict[str, float]:
+        start = time.perf_counter()
+        # Full-table aggregates belong on a replica. Writes it hasn't replayed
+        # yet can be missed, but only until the next refresh a minute later.
+        with read_router.session() as db:
+            try:
+                counters = DashboardStatsService.compute(db)
+            except exc.DBAPIError as e:
+                if e.connection_invalidated:
+                    read_router.mark_unhealthy(db.get_bind())
+                raise
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.delete(SNAPSHOT_KEY)
+            pipe.hset(SNAPSHOT_KEY, mapping={**counters, "computed_at": time.time()})
+            pipe.expire(SNAPSHOT_KEY, settings.DASHBOARD_STATS_MAX_STALE_SECONDS)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"[DashboardStats] Could not store snapshot: {e}")
+        refresh_latency.observe((time.perf_counter() - start) * 1000)
+        return counters
+
+    @staticmethod
+    def refresh_if_unlocked() -> None:
+        """Background refresh; only one worker recomputes a stale snapshot."""
+        try:
+            if not redis_client.set(REFRESH_LOCK_KEY, 1, nx=True, ex=REFRESH_LOCK_SECONDS):
+                return
+        except redis.RedisError:
+            return
+        try:
+            DashboardStatsService.refresh()
+        except Exception as e:
+            print(f"[DashboardStats] Background refresh failed: {e}")
+        finally:
+            try:
+                redis_client.delete(REFRESH_LOCK_KEY)
+            except redis.RedisError:
+                pass
+
+    @staticmethod
+    def get() -> tuple:
+        """(counters, needs_refresh)."""
+        try:
+            raw = redis_client.hgetall(SNAPSHOT_KEY)
+        except redis.RedisError:
+            raw = None
+        if not raw or "computed_at" not in raw:
+            snapshot_misses.inc()
+            return DashboardStatsService.refresh(), False
+
+        counters = {name: float(raw.get(name, 0)) for name in COUNTERS}
+        age = time.time() - float(raw["computed_at"])
+        if age > settings.DASHBOARD_STATS_FRESH_SECONDS:
+            snapshot_stale.inc()
+            return counters, True
+        snapshot_hits.inc()
+        return counters, False
+
+    @staticmethod
+    def to_response(counters: Dict[str, float]) -> dict:
+        total_subs = counters["total_subscriptions"]
+        return {
+            "total_users": int(counters["total_users"]),
+            "pending_tickets": int(counters["pending_tickets"]),
+            "total_revenue": round(counters["total_revenue"], 2),
+            "financial_score": int(counters["active_subscriptions"] / total_subs * 100) if total_subs > 0 else 0,
+        }
+
+    @staticmethod
+    def adjust(deltas: Dict[str, float]) -> None:
+        args = [x for name, value in deltas.items() for x in (name, value)]
+        try:
+            _adjust_sync(keys=[SNAPSHOT_KEY], args=args)
+        except redis.RedisError as e:
+            print(f"[DashboardStats] Could not apply counter deltas: {e}")
+
+    @staticmethod
+    async def aadjust(deltas: Dict[str, float]) -> None:
+        args = [x for name, value in deltas.items() for x in (name, value)]
+        try:
+            await _adjust_async([SNAPSHOT_KEY], args)
+        except redis.RedisError as e:
+            print(f"[DashboardStats] Could not apply counter deltas: {e}")
+
+
+# -----------------------------
+# Incremental counters (session hooks)
+# -----------------------------
+# What one row contributes to each counter, given a getter for its column values
+CONTRIBUTIONS: Dict[type, Callable[[Callable[[str], object]], Dict[str, float]]] = {
+    User: lambda v: {"total_users": 1},
+    SupportTicket: lambda v: {"pending_tickets": int(v("status") == "Open")},
+    Payment: lambda v: {"total_revenue": 0.0 if v("refunded") else float(v("amount") or 0)},
+    Subscription: lambda v: {"total_subscriptions": 1, "active_subscriptions": int(not v("churned"))},
+}
+
+PENDING_KEY = "dashboard_stats_deltas"
+_background_tasks = set()
+
+
+def _current_value(obj):
+    return lambda name: getattr(obj, name)
+
+
+def _previous_value(obj):
+    state = inspect(obj)
+
+    def value(name):
+        history = state.attrs[name].history
+        if history.deleted:
+            return history.deleted[0]
+        return getattr(obj, name)
+
+    return value
+
+
+def _accumulate(pending: Dict[str, float], contribution: Dict[str, float], sign: int) -> None:
+    for name, value in contribution.items():
+        if value:
+            pending[name] = pending.get(name, 0) + sign * value
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_deltas(session, flush_context):
+    for obj in session.new:
+        contribute = CONTRIBUTIONS.get(type(obj))
+        if contribute:
+            pending = session.info.setdefault(PENDING_KEY, {})
+            _accumulate(pending, contribute(_current_value(obj)), +1)
+    for obj in session.dirty:
+        contribute = CONTRIBUTIONS.get(type(obj))
+        if contribute and session.is_modified(obj, include_collections=False):
+            pending = session.info.setdefault(PENDING_KEY, {})
+            _accumulate(pending, contribute(_previous_value(obj)), -1)
+            _accumulate(pending, contribute(_current_value(obj)), +1)
+    for obj in session.deleted:
+        contribute = CONTRIBUTIONS.get(type(obj))
+        if contribute:
+            pending = session.info.setdefault(PENDING_KEY, {})
+            _accumulate(pending, contribute(_previous_value(obj)), -1)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_deltas(session):
+    pending: Optional[Dict[str, float]] = session.info.pop(PENDING_KEY, None)
+    deltas = {name: value for name, value in (pending or {}).items() if value}
+    if not deltas:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None:
+        DashboardStatsService.adjust(deltas)  # threadpool / scripts
+    else:
+        # AsyncSession commit: don't block the event loop on Redis
+        task = loop.create_task(DashboardStatsService.aadjust(deltas))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_deltas(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
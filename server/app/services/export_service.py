@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from sqlalchemy import literal, select, union_all
+
+from app.db.session import SessionLocal
+from app.models.expenses import Expense
+from app.models.income import Income
+from app.models.payments import ScheduledPayment
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+# Flush the text buffer to the client once it grows past this
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+EXPORT_DATASETS = ("expenses", "income", "payments", "all")
+EXPORT_FORMATS = ("csv", "ndjson")
+
+COLUMNS = ["record_type", "id", "date", "amount", "currency", "category", "description", "status"]
+
+
+def _expenses(user_id: int, start: Optional[datetime], end: Optional[datetime]):
+    stmt = select(
+        literal("expense").label("record_type"),
+        Expense.id,
+        Expense.date.label("date"),
+        Expense.amount,
+        Expense.currency,
+        Expense.category.label("category"),
+        Expense.description,
+        literal(None).label("status"),
+    ).where(Expense.user_id == user_id)
+    return _date_range(stmt, Expense.date, start, end)
+
+
+def _income(user_id: int, start: Optional[datetime], end: Optional[datetime]):
+    stmt = select(
+        literal("income").label("record_type"),
+        Income.id,
+        Income.date.label("date"),
+        Income.amount,
+        Income.currency,
+        literal(None).label("category"),
+        Income.description,
+        literal(None).label("status"),
+    ).where(Income.user_id == user_id)
+    return _date_range(stmt, Income.date, start, end)
+
+
+def _payments(user_id: int, start: Optional[datetime], end: Optional[datetime]):
+    stmt = select(
+        literal("scheduled_payment").label("record_type"),
+        ScheduledPayment.id,
+        ScheduledPayment.scheduled_date.label("date"),
+        ScheduledPayment.amount,
+        literal(None).label("currency"),
+        literal(None).label("category"),
+        ScheduledPayment.description,
+        ScheduledPayment.status.label("status"),
+    ).where(ScheduledPayment.user_id == user_id)
+    return _date_range(stmt, ScheduledPayment.scheduled_date, start, end)
+
+
+def _date_range(stmt, column, start, end):
+    if start is not None:
+        stmt = stmt.where(column >= start)
+    if end is not None:
+        stmt = stmt.where(column < end)
+    return stmt
+
+
+_QUERIES = {"expenses": [_expenses], "income": [_income], "payments": [_payments]}
+_QUERIES["all"] = _QUERIES["expenses"] + _QUERIES["income"] + _QUERIES["payments"]
+
+
+def _cell(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "value"):  # enums
+        return value.value
+    return value
+
+
+class ExportService:
+    @staticmethod
+    def build_query(dataset: str, user_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        parts: List = [build(user_id, start, end) for build in _QUERIES[dataset]]
+        if len(parts) == 1:
+            return parts[0].order_by("date", "id")  # walks the (user_id, date) index
+        return union_all(*parts).order_by("date", "record_type", "id")
+
+    @staticmethod
+    def iter_rows(dataset: str, user_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator:
+        """
+        Plain column tuples from a server-side cursor, EXPORT_BATCH_SIZE at a
+        time. Opens its own session because it outlives the request's
+        dependencies while the response streams.
+        """
+        stmt = ExportService.build_query(dataset, user_id, start, end)
+        with SessionLocal() as db:
+            result = db.execute(stmt, execution_options={"yield_per": EXPORT_BATCH_SIZE})
+            for row in result:
+                yield row
+
+    @staticmethod
+    def iter_text(rows: Iterator, fmt: str) -> Iterator[str]:
+        """Encode rows as CSV or NDJSON, yielding ~EXPORT_CHUNK_BYTES pieces."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if fmt == "csv" else None
+        if writer:
+            writer.writerow(COLUMNS)
+
+        for row in rows:
+            values = [_cell(v) for v in row]
+            if writer:
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(COLUMNS, values)), default=str))
+                buffer.write("\n")
+            if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def iter_bytes(chunks: Iterator[str], compress: bool) -> Iterator[bytes]:
+        """UTF-8 encode, optionally gzipping on the fly (one shared compressor, no buffering of the whole file)."""
+        if not compress:
+            for chunk in chunks:
+                yield chunk.encode()
+            return
+
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode())
+            if data:
+                yield data
+        yield compressor.flush()
+
+    @staticmethod
+    def stream(
+        dataset: str,
+        user_id: int,
+        fmt: str = "csv",
+        compress: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        rows = ExportService.iter_rows(dataset, user_id, start, end)
+        return ExportService.iter_bytes(ExportService.iter_text(rows, fmt), compress)
@@ -0,0 +1,75 @@
+import json
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.core.http_cache import VersionCounter, VersionedBodyCache
+from app.models.financial import FinancialModule, Section, QuizQuestion
+
+
+# -------------------
+# Helpers to convert DB objects to frontend-friendly dicts
+# -------------------
+def section_to_out(section: Section):
+    return {
+        "id": section.id,
+        "title": section.title,
+        "content": section.content,
+        "lastUpdated": section.last_updated.isoformat() if section.last_updated else None,
+        "reviewedBy": section.reviewed_by or "",
+        "region": section.region,
+        "tags": section.tags.split(",") if section.tags else [],
+        "downloadUrl": section.download_url
+    }
+
+def quiz_to_out(quiz: QuizQuestion):
+    return {
+        "id": quiz.id,
+        "moduleId": quiz.module_id,
+        "sectionId": getattr(quiz, "section_id", None),
+        "question": quiz.question,
+        "options": quiz.options.split(",") if quiz.options else [],
+        "answer": quiz.answer
+    }
+
+def module_to_out(module: FinancialModule):
+    return {
+        "id": module.id,
+        "user_id": module.user_id,
+        "title": module.title,
+        "sections": [section_to_out(s) for s in module.sections],
+        "quiz": [quiz_to_out(q) for q in module.quiz]
+    }
+
+
+def load_modules(db: Session, *criteria) -> List[FinancialModule]:
+    """Modules with sections and quiz loaded in two extra queries total, not two per module."""
+    stmt = (
+        select(FinancialModule)
+        .where(*criteria)
+        .options(selectinload(FinancialModule.sections), selectinload(FinancialModule.quiz))
+        .order_by(FinancialModule.id)
+    )
+    return db.scalars(stmt).all()
+
+
+def _build_catalog(db: Session) -> str:
+    modules = load_modules(db, FinancialModule.user_id.is_(None))
+    # Items only, no brackets, so responses can splice user modules in
+    return json.dumps([module_to_out(m) for m in modules], separators=(",", ":"))[1:-1]
+
+
+def own_modules_version(user_id: int) -> VersionCounter:
+    """Bumped whenever one of the user's own modules changes; no local copy, it's one HMGET."""
+    return VersionCounter(f"http_cache:financial_modules:user:{user_id}:version")
+
+
+# The global module catalog (user_id IS NULL), as comma-separated JSON items
+module_catalog = VersionedBodyCache(
+    "module_catalog",
+    _build_catalog,
+    local_ttl=settings.CATALOG_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.CATALOG_TTL_SECONDS,
+)
@@ -0,0 +1,107 @@
+from datetime import date
+from itertools import groupby
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import redis
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.scheduler import register_job
+from app.db.session import AsyncSessionLocal
+from app.models.fx_rate import FxRate
+from app.services.fx_service import RateTable, fx_rates
+
+# Bumped whenever recorded rates change, so cached conversions are recomputed
+HISTORY_VERSION_KEY = "fx:history:version"
+
+
+class RateHistory:
+    """
+    Recorded rates against the pivot currency as one sorted day array and
+    one rate array per currency, so the rates in force on many days come
+    from a single `searchsorted` instead of one lookup per day.
+    """
+
+    def __init__(self, pivot: str, series: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        self.pivot = pivot
+        self.series = series
+
+    @classmethod
+    async def load(cls, db: AsyncSession, pivot: str, currencies: Iterable[str], until: date) -> "RateHistory":
+        """History before `until` for `currencies`, read in (base, quote, date) key order."""
+        quotes = sorted(set(currencies) - {pivot})
+        rows = (await db.execute(
+            select(FxRate.quote, FxRate.date, FxRate.rate)
+            .where(FxRate.base == pivot, FxRate.quote.in_(quotes), FxRate.date < until)
+            .order_by(FxRate.quote, FxRate.date)
+        )).all() if quotes else []
+        series = {}
+        for quote, group in groupby(rows, key=lambda row: row.quote):
+            group = list(group)
+            series[quote] = (
+                np.array([row.date for row in group], dtype="datetime64[D]"),
+                np.fromiter((row.rate for row in group), dtype=np.float64, count=len(group)),
+            )
+        return cls(pivot, series)
+
+    def has(self, currency: str) -> bool:
+        return currency == self.pivot or currency in self.series
+
+    def as_of(self, currency: str, days: np.ndarray) -> np.ndarray:
+        """Units of `currency` per pivot unit in force on each of `days` (datetime64[D])."""
+        if currency == self.pivot:
+            return np.ones(len(days))
+        known_days, rates = self.series[currency]
+        index = np.searchsorted(known_days, days, side="right") - 1
+        # Days before the first recorded rate use the earliest one we have
+        return rates[np.clip(index, 0, None)]
+
+
+class FxHistoryService:
+    @staticmethod
+    async def record(db: AsyncSession, pivot: str, table: RateTable, day: date) -> int:
+        """
+        Store `table` as the rates for `day`; later snapshots of the same day
+        overwrite earlier ones. Returns the number of rates that changed.
+        """
+        rows = [
+            {"base": pivot, "quote": quote, "date": day, "rate": rate}
+            for quote, rate in table.rates.items()
+            if quote != pivot and rate > 0
+        ]
+        if not rows:
+            return 0
+        stmt = pg_insert(FxRate).values(rows)
+        result = await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["base", "quote", "date"],
+                set_={"rate": stmt.excluded.rate},
+                where=FxRate.rate != stmt.excluded.rate,
+            )
+        )
+        await db.commit()
+        # Unchanged rows are filtered by the WHERE, so rowcount is 0 when nothing moved
+        changed = result.rowcount
+        if changed > 0:
+            try:
+                await get_redis().incr(HISTORY_VERSION_KEY)
+            except redis.RedisError as e:
+                print(f"[FxHistory] Could not bump history version: {e}")
+        return changed
+
+
+@register_job("fx_history", interval=settings.FX_HISTORY_INTERVAL_SECONDS)
+async def record_fx_history():
+    table = await fx_rates.table()
+    if fx_rates.expired(table):
+        # The upstream is down and this is an old fallback table: don't record it as today's rates
+        print(f"[FxHistory] Skipping: rates fetched at {table.fetched_on:%Y-%m-%d %H:%M} are past their stale window")
+        return None
+    day = table.fetched_on.date()
+    async with AsyncSessionLocal() as db:
+        recorded = await FxHistoryService.record(db, fx_rates.pivot, table, day)
+    return f"{recorded} rate(s) recorded for {day}" if recorded else None
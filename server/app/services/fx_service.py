@@ -0,0 +1,212 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Protocol
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.core.metrics import metrics
+
+
+class FxUnavailable(Exception):
+    """Rates could not be fetched and there is nothing cached to fall back on."""
+
+
+# -----------------------------
+# Providers
+# -----------------------------
+class RateProvider(Protocol):
+    name: str
+
+    async def fetch(self, base: str) -> Dict[str, float]:
+        """Every rate the provider has for `base`, as units of currency per one unit of base."""
+
+
+class ExchangeRateHostProvider:
+    name = "exchangerate_host"
+
+    def __init__(self, url: str, access_key: Optional[str] = None):
+        self.url = url
+        self.access_key = access_key
+
+    async def fetch(self, base: str) -> Dict[str, float]:
+        params = {"base": base}
+        if self.access_key:
+            params["access_key"] = self.access_key
+        resp = await get_http_client().get(self.url, params=params)
+        resp.raise_for_status()
+        body = resp.json()
+        rates = body.get("rates") if isinstance(body, dict) else None
+        if not isinstance(rates, dict):
+            raise FxUnavailable("Invalid response from exchange rate API")
+        return {code.upper(): float(rate) for code, rate in rates.items()}
+
+
+# Units per US dollar; fixed so results are reproducible offline
+FAKE_USD_RATES = {
+    "USD": 1.0, "EUR": 0.92, "GBP": 0.79, "KES": 129.0, "NGN": 1550.0, "GHS": 15.5,
+    "INR": 83.2, "CNY": 7.2, "JPY": 150.0, "CAD": 1.37, "AUD": 1.52, "MXN": 17.1,
+}
+
+
+class FakeRateProvider:
+    """Fixed rates and no network, for local development, tests and benchmarks."""
+
+    name = "fake"
+
+    def __init__(self, usd_rates: Optional[Dict[str, float]] = None, latency: float = 0.0):
+        self.usd_rates = dict(usd_rates or FAKE_USD_RATES)
+        self.latency = latency
+        self.calls = 0
+
+    async def fetch(self, base: str) -> Dict[str, float]:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if base not in self.usd_rates:
+            raise FxUnavailable(f"Unknown base currency {base}")
+        per_base = self.usd_rates[base]
+        return {code: rate / per_base for code, rate in self.usd_rates.items()}
+
+
+PROVIDERS = {
+    "exchangerate_host": lambda: ExchangeRateHostProvider(settings.FX_API_URL, settings.FX_API_KEY),
+    "fake": FakeRateProvider,
+}
+
+
+def create_provider(name: str) -> RateProvider:
+    try:
+        return PROVIDERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown FX_PROVIDER {name!r}; expected one of {', '.join(PROVIDERS)}") from None
+
+
+# -----------------------------
+# Cached, coalesced rates
+# -----------------------------
+class RateTable(NamedTuple):
+    rates: Dict[str, float]  # units per one unit of the pivot currency
+    fetched_at: float  # time.monotonic()
+    fetched_on: datetime  # UTC wall clock, for recording the table against a date
+
+    def cross(self, base: str, targets: List[str]) -> Dict[str, Optional[float]]:
+        """Units of each target per one unit of `base`; None for currencies the table doesn't quote."""
+        per_base = self.rates.get(base)
+        return {
+            target: round(self.rates[target] / per_base, 6) if per_base and target in self.rates else None
+            for target in targets
+        }
+
+
+class FxRateService:
+    """
+    Exchange rates for any pair, derived from a single table of rates
+    against the pivot currency: EUR->KES is pivot[KES] / pivot[EUR], so one
+    upstream call serves every base.
+
+    The table is fresh for `ttl` seconds. For `stale` seconds after that it
+    is still served while one background refresh runs. Beyond that, callers
+    wait for the refresh. All callers share whichever refresh is in flight
+    (single-flight), so a burst of requests makes one upstream call. If the
+    upstream fails, the last table is served however old it is.
+    """
+
+    def __init__(self, provider: RateProvider, pivot: str, ttl: float, stale: float):
+        self.provider = provider
+        self.pivot = pivot
+        self.ttl = ttl
+        self.stale = stale
+        self._table: Optional[RateTable] = None
+        self._inflight: Optional[asyncio.Task] = None
+
+        self.hits = metrics.counter("fx.hits")
+        self.stale_served = metrics.counter("fx.stale_served")
+        self.coalesced = metrics.counter("fx.coalesced")
+        self.upstream_calls = metrics.counter("fx.upstream_calls")
+        self.upstream_errors = metrics.counter("fx.upstream_errors")
+        self.upstream_ms = metrics.histogram("fx.upstream_ms")
+
+    async def _refresh(self) -> RateTable:
+        self.upstream_calls.inc()
+        start = time.perf_counter()
+        try:
+            rates = await self.provider.fetch(self.pivot)
+        except Exception as e:
+            # Whatever the provider raised, it's an upstream failure: fall back to the last table
+            self.upstream_errors.inc()
+            raise FxUnavailable(f"Failed to fetch exchange rates: {e}") from e
+        finally:
+            self.upstream_ms.observe((time.perf_counter() - start) * 1000)
+        rates[self.pivot] = 1.0
+        self._table = RateTable(rates, time.monotonic(), datetime.utcnow())
+        return self._table
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        if self._inflight is task:
+            self._inflight = None
+        # Background refreshes have no awaiter; retrieve their error here
+        if not task.cancelled() and task.exception() is not None:
+            print(f"[FX] Refresh failed: {task.exception()}")
+
+    def _refresh_once(self) -> asyncio.Task:
+        """The refresh in flight, or a new one; every caller shares its result."""
+        task = self._inflight
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._refresh())
+            task.add_done_callback(self._refresh_done)
+            self._inflight = task
+        else:
+            self.coalesced.inc()
+        return task
+
+    def expired(self, table: RateTable) -> bool:
+        """True once `table` is past its stale window and only served because the upstream is failing."""
+        return time.monotonic() - table.fetched_at >= self.ttl + self.stale
+
+    async def table(self) -> RateTable:
+        table = self._table
+        age = time.monotonic() - table.fetched_at if table else None
+        if table and age < self.ttl:
+            self.hits.inc()
+            return table
+        if table and age < self.ttl + self.stale:
+            self.stale_served.inc()
+            self._refresh_once()
+            return table
+        try:
+            # Shielded: a caller that disconnects doesn't cancel everyone else's refresh
+            return await asyncio.shield(self._refresh_once())
+        except FxUnavailable:
+            if table is None:
+                raise
+            self.stale_served.inc()
+            return table
+
+    async def rates(self, base: str, targets: List[str]) -> Dict[str, Optional[float]]:
+        """Units of each target per one unit of `base`; None for currencies the provider doesn't quote."""
+        return (await self.table()).cross(base, targets)
+
+    def stats(self) -> dict:
+        table = self._table
+        return {
+            "provider": self.provider.name,
+            "pivot": self.pivot,
+            "currencies": len(table.rates) if table else 0,
+            "age_seconds": round(time.monotonic() - table.fetched_at, 1) if table else None,
+            "refreshing": self._inflight is not None,
+            "hits": self.hits.value,
+            "stale_served": self.stale_served.value,
+            "coalesced": self.coalesced.value,
+            "upstream_calls": self.upstream_calls.value,
+            "upstream_errors": self.upstream_errors.value,
+            "upstream_ms": self.upstream_ms.snapshot(),
+        }
+
+
+fx_rates = FxRateService(
+    create_provider(settings.FX_PROVIDER),
+    pivot=settings.FX_PIVOT_CURRENCY,
+    ttl=settings.FX_TTL_SECONDS,
+    stale=settings.FX_STALE_SECONDS,
+)
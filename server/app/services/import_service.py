@@ -0,0 +1,391 @@
+import csv
+import io
+import json
+import os
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import redis
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.redis import redis_client
+from app.db.session import SessionLocal
+from app.models.expenses import Expense
+from app.schemas.expenses import ExpenseCreate
+from app.services.conversion_service import touch_ledger
+
+IMPORT_BATCH_SIZE = 10_000
+IMPORT_JOB_TTL_SECONDS = 24 * 3600
+IMPORT_MAX_ERRORS = 1000  # per-row errors kept for the job status endpoint
+IMPORT_FORMATS = ("csv", "ofx")
+DEFAULT_CATEGORY = "Uncategorized"
+DEFAULT_CURRENCY = "USD"
+
+CSV_ALIASES = {
+    "date": ("date", "transaction date", "posted date", "posting date"),
+    "amount": ("amount", "value"),  # signed: debits negative, credits positive
+    "debit": ("debit", "withdrawal", "withdrawals"),  # unsigned; blank on credit rows
+    "description": ("description", "memo", "payee", "name", "details"),
+    "category": ("category",),
+    "currency": ("currency", "currency code"),
+}
+DATE_FORMATS = ("%m/%d/%Y", "%Y/%m/%d", "%d.%m.%Y", "%Y%m%d")
+
+
+# -----------------------------
+# Job state (Redis)
+# -----------------------------
+class ImportJobStore:
+    """Progress and per-row errors for import jobs, shared across workers via Redis."""
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"import_job:{job_id}"
+
+    @staticmethod
+    def create(user_id: int, filename: str, fmt: str) -> str:
+        job_id = uuid.uuid4().hex
+        key = ImportJobStore._key(job_id)
+        redis_client.hset(key, mapping={
+            "job_id": job_id,
+            "user_id": user_id,
+            "filename": filename,
+            "format": fmt,
+            "status": "queued",
+            "processed": 0,
+            "inserted": 0,
+            "duplicates": 0,
+            "skipped": 0,
+            "failed": 0,
+            "created_at": datetime.utcnow().isoformat(),
+        })
+        redis_client.expire(key, IMPORT_JOB_TTL_SECONDS)
+        return job_id
+
+    @staticmethod
+    def update(job_id: str, **fields) -> None:
+        try:
+            redis_client.hset(ImportJobStore._key(job_id), mapping=fields)
+        except redis.RedisError as e:
+            print(f"[Import] Could not record progress for {job_id}: {e}")
+
+    @staticmethod
+    def add_errors(job_id: str, errors: List[dict]) -> None:
+        if not errors:
+            return
+        key = ImportJobStore._key(job_id) + ":errors"
+        try:
+            pipe = redis_client.pipeline()
+            pipe.rpush(key, *[json.dumps(e) for e in errors])
+            pipe.ltrim(key, 0, IMPORT_MAX_ERRORS - 1)
+            pipe.expire(key, IMPORT_JOB_TTL_SECONDS)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"[Import] Could not record errors for {job_id}: {e}")
+
+    @staticmethod
+    def get(job_id: str) -> Optional[dict]:
+        key = ImportJobStore._key(job_id)
+        job = redis_client.hgetall(key)
+        if not job:
+            return None
+        for field in ("user_id", "processed", "inserted", "duplicates", "skipped", "failed"):
+            job[field] = int(job.get(field, 0))
+        job["errors"] = [json.loads(e) for e in redis_client.lrange(key + ":errors", 0, -1)]
+        return job
+
+
+# -----------------------------
+# Parsing
+# -----------------------------
+def _parse_amount(raw: str) -> float:
+    cleaned = re.sub(r"[^\d.,\-()]", "", raw or "").replace(",", "")
+    negative = cleaned.startswith("(") and cleaned.endswith(")")
+    value = float(cleaned.strip("()"))
+    return -value if negative else value
+
+
+def _parse_date(raw: str) -> Optional[str]:
+    """Normalize common bank date formats to ISO; ISO input passes through for pydantic."""
+    raw = (raw or "").strip()
+    if not raw:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(raw, fmt).isoformat()
+        except ValueError:
+            continue
+    return raw
+
+
+def parse_csv(stream) -> Iterator[Tuple[int, dict]]:
+    """(row number, raw fields) from a CSV with a header row; columns matched by common bank aliases."""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text_stream)
+    header = [h.strip().lower() for h in next(reader, [])]
+    columns: Dict[str, int] = {}
+    for field, aliases in CSV_ALIASES.items():
+        for alias in aliases:
+            if alias in header:
+                columns[field] = header.index(alias)
+                break
+
+    signed = "amount" in columns
+    columns.pop("debit" if signed else "amount", None)
+    for line_no, values in enumerate(reader, start=2):
+        if not any(values):
+            continue
+        row = {field: values[idx] if idx < len(values) else "" for field, idx in columns.items()}
+        if signed:
+            row["debits_only"] = True
+        elif "debit" in row:
+            row["amount"] = row.pop("debit")
+            row["credit"] = not row["amount"].strip()
+        yield line_no, row
+
+
+OFX_TRANSACTION = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.S | re.I)
+OFX_TAG = re.compile(r"<(\w+)>([^<\r\n]*)")
+OFX_CURDEF = re.compile(r"<CURDEF>\s*(\w+)", re.I)
+
+
+def parse_ofx(stream, chunk_size: int = 64 * 1024) -> Iterator[Tuple[int, dict]]:
+    """
+    (transaction number, raw fields) from an OFX/QFX statement, scanning the
+    file in chunks so only one partial transaction is buffered at a time.
+    """
+    buffer = ""
+    number = 0
+    currency = None  # the statement's CURDEF, which precedes its transactions
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            buffer += chunk.decode("utf-8", errors="replace")
+        if currency is None:
+            curdef = OFX_CURDEF.search(buffer)
+            currency = curdef.group(1) if curdef else None
+        last_end = 0
+        for match in OFX_TRANSACTION.finditer(buffer):
+            number += 1
+            tags = {tag.upper(): value.strip() for tag, value in OFX_TAG.findall(match.group(1))}
+            yield number, {
+                "date": (tags.get("DTPOSTED") or "")[:8],
+                "amount": tags.get("TRNAMT", ""),
+                "description": tags.get("NAME") or tags.get("MEMO") or "",
+                "category": tags.get("TRNTYPE", "").title() or None,
+                "currency": tags.get("CURSYM") or currency,  # <CURRENCY> overrides CURDEF per transaction
+                "debits_only": True,
+            }
+            last_end = match.end()
+        buffer = buffer[last_end:]
+        if not chunk:
+            return
+
+
+def validate(row: dict, currency: str = DEFAULT_CURRENCY) -> Tuple[Optional[ExpenseCreate], Optional[str]]:
+    """
+    ExpenseCreate for an expense row, (None, None) for a skipped credit, or
+    (None, error). `currency` applies to rows whose statement doesn't name one.
+    """
+    if row.get("credit"):
+        return None, None  # blank debit cell: the credit side of a debit/credit export
+    try:
+        amount = _parse_amount(row.get("amount", ""))
+    except ValueError:
+        return None, f"Invalid amount: {row.get('amount')!r}"
+    if row.get("debits_only") and amount >= 0:
+        return None, None  # deposits, refunds and salary in a signed column aren't expenses
+    try:
+        expense = ExpenseCreate(
+            category=(row.get("category") or DEFAULT_CATEGORY)[:100],
+            amount=abs(amount),  # signed columns record debits as negatives; debit columns unsigned
+            currency=(row.get("currency") or "").strip().upper() or currency,
+            description=(row.get("description") or "")[:255],
+            date=_parse_date(row.get("date", "")),
+        )
+    except ValidationError as e:
+        return None, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+    if expense.date is None:
+        return None, "date: Field required"
+    return expense, None
+
+
+# -----------------------------
+# Bulk load
+# -----------------------------
+STAGE_TABLE_SQL = """
+    CREATE TEMP TABLE expense_import (
+        date timestamp, amount double precision, currency varchar(3), category varchar(100),
+        description varchar(255)
+    ) ON COMMIT DROP
+"""
+
+# A row is a duplicate when it matches an expense that existed before the
+# import. Repeats within the statement itself are separate transactions (two
+# identical coffees on one day) and are all inserted. Both loaders apply this.
+INSERT_FROM_STAGE_SQL = """
+    INSERT INTO expenses (user_id, date, amount, currency, category, description)
+    SELECT :user_id, s.date, s.amount, s.currency, s.category, s.description
+    FROM expense_import s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM expenses e
+        WHERE e.user_id = :user_id
+          AND e.date = s.date
+          AND e.amount = s.amount
+          AND e.currency = s.currency
+          AND e.description = s.description
+    )
+"""
+
+
+class _PostgresLoader:
+    """
+    Stages batches with COPY, then inserts everything not already present in
+    one statement; its NOT EXISTS sees the table as it was before the insert.
+    """
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.staged = 0
+        db.execute(text(STAGE_TABLE_SQL))
+
+    def add(self, batch: List[ExpenseCreate]) -> None:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for e in batch:
+            writer.writerow([e.date.isoformat(), e.amount, e.currency, e.category, e.description or ""])
+        buffer.seek(0)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY expense_import (date, amount, currency, category, description) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+        self.staged += len(batch)
+
+    def finish(self) -> Tuple[int, int]:
+        inserted = self.db.execute(text(INSERT_FROM_STAGE_SQL), {"user_id": self.user_id}).rowcount
+        return inserted, self.staged - inserted
+
+
+class _ExecutemanyLoader:
+    """
+    Fallback for SQLite and other dialects: dedupe per batch in Python, insert
+    with executemany. Only rows up to the highest id seen at the start count
+    as existing, so earlier batches of this import never dedupe later ones.
+    """
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.inserted = 0
+        self.duplicates = 0
+        self.last_existing_id = db.scalar(select(func.max(Expense.id)).where(Expense.user_id == user_id))
+
+    def add(self, batch: List[ExpenseCreate]) -> None:
+        dates = [e.date for e in batch]
+        existing = set(self.db.execute(
+            select(Expense.date, Expense.amount, Expense.currency, Expense.description).where(
+                Expense.user_id == self.user_id,
+                Expense.id <= self.last_existing_id,
+                Expense.date >= min(dates),
+                Expense.date <= max(dates),
+            )
+        ).all()) if self.last_existing_id is not None else set()
+        rows = []
+        for e in batch:
+            if (e.date, e.amount, e.currency, e.description or "") in existing:
+                self.duplicates += 1
+                continue
+            rows.append({
+                "user_id": self.user_id,
+                "date": e.date,
+                "amount": e.amount,
+                "currency": e.currency,
+                "category": e.category,
+                "description": e.description or "",
+            })
+        if rows:
+            self.db.execute(insert(Expense), rows)
+            self.inserted += len(rows)
+
+    def finish(self) -> Tuple[int, int]:
+        return self.inserted, self.duplicates
+
+
+class ExpenseImportService:
+    @staticmethod
+    def run(job_id: str, user_id: int, path: str, fmt: str, currency: str = DEFAULT_CURRENCY) -> None:
+        """
+        Parse, validate, dedupe and bulk-insert one uploaded statement.
+        `currency` is for rows the statement gives no currency for.
+        Runs as a background task; all inserts commit together.
+        """
+        ImportJobStore.update(job_id, status="running", started_at=datetime.utcnow().isoformat())
+        started = time.perf_counter()
+        processed = skipped = failed = 0
+        try:
+            with SessionLocal() as db, open(path, "rb") as stream:
+                is_postgres = db.get_bind().dialect.name == "postgresql"
+                loader = _PostgresLoader(db, user_id) if is_postgres else _ExecutemanyLoader(db, user_id)
+                rows = parse_csv(stream) if fmt == "csv" else parse_ofx(stream)
+
+                batch: List[ExpenseCreate] = []
+                errors: List[dict] = []
+                for row_no, raw in rows:
+                    processed += 1
+                    expense, error = validate(raw, currency)
+                    if error:
+                        failed += 1
+                        errors.append({"row": row_no, "error": error})
+                    elif expense is None:
+                        skipped += 1
+                    else:
+                        batch.append(expense)
+
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        loader.add(batch)
+                        batch = []
+                        ImportJobStore.add_errors(job_id, errors)
+                        errors = []
+                        ImportJobStore.update(job_id, processed=processed, skipped=skipped, failed=failed)
+
+                if batch:
+                    loader.add(batch)
+                ImportJobStore.add_errors(job_id, errors)
+
+                inserted, duplicates = loader.finish()
+                if inserted:
+                    touch_ledger(db, user_id)
+                db.commit()
+
+            ImportJobStore.update(
+                job_id,
+                status="done",
+                processed=processed,
+                inserted=inserted,
+                duplicates=duplicates,
+                skipped=skipped,
+                failed=failed,
+                duration_ms=round((time.perf_counter() - started) * 1000),
+                finished_at=datetime.utcnow().isoformat(),
+            )
+        except Exception as e:
+            ImportJobStore.update(
+                job_id,
+                status="failed",
+                processed=processed,
+                error=str(e),
+                finished_at=datetime.utcnow().isoformat(),
+            )
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
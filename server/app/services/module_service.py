@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.financial import FinancialModule, QuizQuestion, Section
+
+# Columns compared to decide whether an existing row changed
+SECTION_FIELDS = ("title", "content", "reviewed_by", "region", "tags", "download_url")
+QUIZ_FIELDS = ("question", "options", "answer")
+
+
+def section_values(s) -> dict:
+    return {
+        "title": s.title,
+        "content": s.content,
+        "reviewed_by": s.reviewed_by,
+        "region": s.region,
+        "tags": ",".join(s.tags or []),
+        "download_url": s.download_url,
+        "last_updated": s.last_updated,  # only used for new sections
+    }
+
+
+def quiz_values(q) -> dict:
+    return {
+        "question": q.question,
+        "options": ",".join(q.options or []),
+        "answer": q.answer,
+    }
+
+
+def _same(a, b) -> bool:
+    # NULL and "" are the same to the client (serializers render both as "")
+    return (a if a is not None else "") == (b if b is not None else "")
+
+
+def diff_rows(existing: Dict[int, dict], incoming: Sequence, values, fields: Sequence[str], kind: str):
+    """
+    Split a payload into (inserts, updates, delete ids) against the module's
+    current rows. Items without an id are new; existing rows missing from the
+    payload are deleted; rows whose values are unchanged are left alone.
+    """
+    inserts: List[dict] = []
+    updates: List[dict] = []
+    seen = set()
+    for item in incoming:
+        row = values(item)
+        if item.id is None:
+            inserts.append(row)
+            continue
+        if item.id not in existing:
+            raise HTTPException(status_code=400, detail=f"{kind} {item.id} does not belong to this module")
+        if item.id in seen:
+            raise HTTPException(status_code=400, detail=f"{kind} {item.id} appears more than once")
+        seen.add(item.id)
+        if not all(_same(existing[item.id][f], row[f]) for f in fields):
+            updates.append({"id": item.id, **row})
+    deletes = [row_id for row_id in existing if row_id not in seen]
+    return inserts, updates, deletes
+
+
+class ModuleService:
+    @staticmethod
+    def apply_update(db: Session, module: FinancialModule, module_in) -> dict:
+        """
+        Bring a module's sections and quiz in line with `module_in` using at
+        most one INSERT, one executemany UPDATE and one DELETE per table.
+        Unchanged rows keep their ids and aren't written; only sections whose
+        content changed get a new last_updated. The caller commits.
+        """
+        now = datetime.utcnow()
+        if module.title != module_in.title:
+            module.title = module_in.title
+
+        existing_sections = {
+            row.id: row._asdict()
+            for row in db.execute(
+                select(Section.id, *[getattr(Section, f) for f in SECTION_FIELDS])
+                .where(Section.module_id == module.id)
+            )
+        }
+        inserts, updates, deletes = diff_rows(
+            existing_sections, module_in.sections or [], section_values, SECTION_FIELDS, "Section"
+        )
+        if inserts:
+            db.execute(insert(Section), [
+                {**row, "module_id": module.id, "last_updated": row["last_updated"] or now} for row in inserts
+            ])
+        if updates:
+            db.execute(update(Section), [{**row, "last_updated": now} for row in updates])
+        if deletes:
+            db.execute(delete(Section).where(Section.id.in_(deletes)))
+        section_counts = {"inserted": len(inserts), "updated": len(updates), "deleted": len(deletes)}
+
+        existing_quiz = {
+            row.id: row._asdict()
+            for row in db.execute(
+                select(QuizQuestion.id, *[getattr(QuizQuestion, f) for f in QUIZ_FIELDS])
+                .where(QuizQuestion.module_id == module.id)
+            )
+        }
+        inserts, updates, deletes = diff_rows(
+            existing_quiz, module_in.quiz or [], quiz_values, QUIZ_FIELDS, "Quiz question"
+        )
+        if inserts:
+            db.execute(insert(QuizQuestion), [{**row, "module_id": module.id} for row in inserts])
+        if updates:
+            db.execute(update(QuizQuestion), updates)
+        if deletes:
+            db.execute(delete(QuizQuestion).where(QuizQuestion.id.in_(deletes)))
+        quiz_counts = {"inserted": len(inserts), "updated": len(updates), "deleted": len(deletes)}
+
+        # Bulk statements bypass the relationship collections; reload them on next access
+        db.expire(module, ["sections", "quiz"])
+        return {"sections": section_counts, "quiz": quiz_counts}
@@ -0,0 +1,223 @@
+import calendar
+import heapq
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.scheduler import register_job
+from app.db.session import AsyncSessionLocal
+from app.models.payments import PaymentRecurrence, PaymentStatus, RecurrenceFrequency, ScheduledPayment
+from app.services.scheduled_payment_service import effective_status
+
+# Longest window /payments/occurrences expands in one call
+OCCURRENCE_MAX_WINDOW_DAYS = 400
+
+
+# -----------------------------
+# Rule arithmetic
+# -----------------------------
+def _add_months(start: datetime, months: int) -> datetime:
+    index = start.year * 12 + start.month - 1 + months
+    year, month = divmod(index, 12)
+    day = min(start.day, calendar.monthrange(year, month + 1)[1])
+    return start.replace(year=year, month=month + 1, day=day)
+
+
+def _months_per_step(rule: PaymentRecurrence) -> int:
+    return rule.interval * (12 if rule.frequency == RecurrenceFrequency.yearly else 1)
+
+
+def _days_per_step(rule: PaymentRecurrence) -> int:
+    return rule.interval * (7 if rule.frequency == RecurrenceFrequency.weekly else 1)
+
+
+def _is_monthly(rule: PaymentRecurrence) -> bool:
+    return rule.frequency in (RecurrenceFrequency.monthly, RecurrenceFrequency.yearly)
+
+
+def occurrence_at(rule: PaymentRecurrence, n: int) -> Optional[datetime]:
+    """The n-th occurrence (0-based), or None past the rule's count/until. O(1)."""
+    if rule.count is not None and n >= rule.count:
+        return None
+    if _is_monthly(rule):
+        at = _add_months(rule.starts_at, n * _months_per_step(rule))
+    else:
+        at = rule.starts_at + timedelta(days=n * _days_per_step(rule))
+    if rule.until is not None and at > rule.until:
+        return None
+    return at
+
+
+def first_index_at_or_after(rule: PaymentRecurrence, moment: datetime) -> int:
+    """Index of the first occurrence at or after `moment`, without walking from the start."""
+    if moment <= rule.starts_at:
+        return 0
+    if _is_monthly(rule):
+        months = (moment.year - rule.starts_at.year) * 12 + moment.month - rule.starts_at.month
+        n = months // _months_per_step(rule)
+        while _add_months(rule.starts_at, n * _months_per_step(rule)) < moment:
+            n += 1
+        return n
+    step = timedelta(days=_days_per_step(rule))
+    return -(-(moment - rule.starts_at) // step)  # ceil
+
+
+def expand(rule: PaymentRecurrence, start: datetime, end: datetime, from_index: int = 0) -> Iterator[Tuple[datetime, int]]:
+    """(date, index) for occurrences in [start, end), in order, skipping indexes below `from_index`."""
+    n = max(from_index, first_index_at_or_after(rule, start))
+    while True:
+        at = occurrence_at(rule, n)
+        if at is None or at >= end:
+            return
+        yield at, n
+        n += 1
+
+
+def _initial_status(at: datetime, now: datetime) -> PaymentStatus:
+    return PaymentStatus.due if at < now else PaymentStatus.pending
+
+
+class RecurrenceService:
+    @staticmethod
+    def reset(rule: PaymentRecurrence, now: datetime) -> None:
+        """
+        Re-point the rule at its first future occurrence after an edit, keeping
+        any past occurrences the materializer hasn't reached yet.
+        """
+        rule.next_index = min(rule.next_index or 0, first_index_at_or_after(rule, now))
+        rule.next_occurrence_at = occurrence_at(rule, rule.next_index)
+
+    @staticmethod
+    async def drop_future(db: AsyncSession, rule_id: int, now: datetime) -> None:
+        """Remove materialized occurrences that haven't happened yet, so they regenerate from the edited rule."""
+        await db.execute(
+            delete(ScheduledPayment)
+            .where(
+                ScheduledPayment.recurrence_id == rule_id,
+                ScheduledPayment.status == PaymentStatus.pending,
+                ScheduledPayment.scheduled_date >= now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def list_occurrences(db: AsyncSession, user_id: int, start: datetime, end: datetime) -> List[dict]:
+        """
+        Every payment in [start, end): materialized rows from the (user_id,
+        scheduled_date) index plus occurrences the job hasn't created yet,
+        expanded from the user's rules. Cost follows the window and the number
+        of rules, not the amount of history.
+        """
+        rows = await db.scalars(
+            select(ScheduledPayment)
+            .where(
+                ScheduledPayment.user_id == user_id,
+                ScheduledPayment.scheduled_date >= start,
+                ScheduledPayment.scheduled_date < end,
+            )
+            .order_by(ScheduledPayment.scheduled_date, ScheduledPayment.id)
+        )
+        now = datetime.utcnow()
+        materialized = (
+            (p.scheduled_date, 0, {
+                "payment_id": p.id,
+                "recurrence_id": p.recurrence_id,
+                "amount": p.amount,
+                "description": p.description or "",
+                "scheduled_date": p.scheduled_date,
+                "status": effective_status(p, now),
+            })
+            for p in rows.all()
+        )
+
+        rules = await db.scalars(
+            select(PaymentRecurrence).where(
+                PaymentRecurrence.user_id == user_id,
+                PaymentRecurrence.next_occurrence_at.is_not(None),
+                PaymentRecurrence.next_occurrence_at < end,
+            )
+        )
+
+        def virtual(rule: PaymentRecurrence):
+            for at, _ in expand(rule, start, end, from_index=rule.next_index):
+                yield at, 1, {
+                    "payment_id": None,
+                    "recurrence_id": rule.id,
+                    "amount": rule.amount,
+                    "description": rule.description or "",
+                    "scheduled_date": at,
+                    "status": _initial_status(at, now),
+                }
+
+        streams = [materialized] + [virtual(rule) for rule in rules.all()]
+        merged = heapq.merge(*streams, key=lambda item: (item[0], item[1]))
+        return [item for _, _, item in merged]
+
+    @staticmethod
+    async def materialize(db: AsyncSession, horizon: datetime, max_rows: int) -> int:
+        """
+        Create ScheduledPayment rows for every occurrence up to `horizon`.
+
+        Due rules are loaded by the partial next_occurrence_at index and kept
+        in a min-heap keyed on their next occurrence; popping the heap emits
+        occurrences across all rules in date order, so when `max_rows` cuts a
+        run short it is always the latest occurrences that wait for the next
+        run. Rules locked by a concurrent edit are skipped.
+        """
+        now = datetime.utcnow()
+        rules = (await db.scalars(
+            select(PaymentRecurrence)
+            .where(
+                PaymentRecurrence.next_occurrence_at.is_not(None),
+                PaymentRecurrence.next_occurrence_at <= horizon,
+            )
+            .order_by(PaymentRecurrence.next_occurrence_at)
+            .limit(max_rows)
+            .with_for_update(skip_locked=True)
+        )).all()
+        by_id = {rule.id: rule for rule in rules}
+        heap = [(rule.next_occurrence_at, rule.id) for rule in rules]
+        heapq.heapify(heap)
+
+        rows = []
+        while heap and len(rows) < max_rows:
+            at, rule_id = heapq.heappop(heap)
+            rule = by_id[rule_id]
+            rows.append({
+                "user_id": rule.user_id,
+                "recurrence_id": rule.id,
+                "amount": rule.amount,
+                "description": rule.description or "",
+                "scheduled_date": at,
+                "status": _initial_status(at, now),
+            })
+            rule.next_index += 1
+            rule.next_occurrence_at = occurrence_at(rule, rule.next_index)
+            if rule.next_occurrence_at is not None and rule.next_occurrence_at <= horizon:
+                heapq.heappush(heap, (rule.next_occurrence_at, rule.id))
+
+        if rows:
+            await db.execute(
+                pg_insert(ScheduledPayment)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["recurrence_id", "scheduled_date"])
+            )
+        await db.commit()
+        return len(rows)
+
+
+@register_job("payment_recurrences", interval=settings.RECURRENCE_MATERIALIZE_INTERVAL_SECONDS)
+async def materialize_recurrences():
+    horizon = datetime.utcnow() + timedelta(days=settings.RECURRENCE_HORIZON_DAYS)
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            created = await RecurrenceService.materialize(db, horizon, settings.RECURRENCE_BATCH_SIZE)
+        total += created
+        if created < settings.RECURRENCE_BATCH_SIZE:
+            break
+    return f"{total} occurrence(s) materialized" if total else None
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import false, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.scheduler import register_job
+from app.db.session import AsyncSessionLocal
+from app.models.engagement import UserEngagement
+from app.models.notification import Notification
+
+
+def reminder_key(engagement_id: int, critical_date: datetime, snoozed_until: Optional[datetime]) -> str:
+    """One reminder per deadline, plus one more each time a snooze runs out."""
+    snooze = snoozed_until.isoformat() if snoozed_until else ""
+    return f"engagement:{engagement_id}:{critical_date.isoformat()}:{snooze}"
+
+
+def reminder_message(module_name: str, critical_date: datetime, now: datetime) -> tuple:
+    when = critical_date.strftime("%b %d, %Y")
+    if critical_date < now:
+        return f"Deadline passed: {module_name}", f"{module_name} was due on {when}."
+    return f"Deadline approaching: {module_name}", f"{module_name} is due on {when}."
+
+
+class ReminderService:
+    @staticmethod
+    async def sweep(db: AsyncSession, now: Optional[datetime] = None, batch_size: Optional[int] = None) -> int:
+        """
+        Enqueue a notification for every open deadline inside the reminder
+        window, walking the open-deadlines partial index in (critical_date, id)
+        order one batch at a time. Snoozed engagements are skipped until the
+        snooze ends. Returns the number of engagements reminded.
+        """
+        now = now or datetime.utcnow()
+        batch_size = batch_size or settings.REMINDER_BATCH_SIZE
+        window_start = now - timedelta(days=settings.REMINDER_LOOKBACK_DAYS)
+        window_end = now + timedelta(hours=settings.REMINDER_LEAD_HOURS)
+
+        total = 0
+        after = None
+        while True:
+            stmt = (
+                select(
+                    UserEngagement.id,
+                    UserEngagement.user_id,
+                    UserEngagement.module_name,
+                    UserEngagement.critical_date,
+                    UserEngagement.snoozed_until,
+                )
+                .where(
+                    UserEngagement.is_done == false(),
+                    UserEngagement.reminded_at.is_(None),
+                    UserEngagement.critical_date.is_not(None),
+                    UserEngagement.critical_date >= window_start,
+                    UserEngagement.critical_date <= window_end,
+                    or_(UserEngagement.snoozed_until.is_(None), UserEngagement.snoozed_until <= now),
+                )
+                .order_by(UserEngagement.critical_date, UserEngagement.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            if after is not None:
+                stmt = stmt.where(tuple_(UserEngagement.critical_date, UserEngagement.id) > after)
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                return total
+
+            notifications = []
+            for engagement_id, user_id, module_name, critical_date, snoozed_until in rows:
+                title, message = reminder_message(module_name, critical_date, now)
+                notifications.append({
+                    "user_id": user_id,
+                    "type": "alert",
+                    "title": title,
+                    "message": message,
+                    "dedupe_key": reminder_key(engagement_id, critical_date, snoozed_until),
+                    "engagement_id": engagement_id,
+                    "created_at": now,
+                })
+            await db.execute(
+                pg_insert(Notification)
+                .values(notifications)
+                .on_conflict_do_nothing(index_elements=["dedupe_key"])
+            )
+            await db.execute(
+                update(UserEngagement)
+                .where(UserEngagement.id.in_([row.id for row in rows]))
+                .values(reminded_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+            total += len(rows)
+            if len(rows) < batch_size:
+                return total
+            after = (rows[-1].critical_date, rows[-1].id)
+
+
+@register_job("engagement_reminders", interval=settings.REMINDER_SWEEP_INTERVAL_SECONDS)
+async def send_engagement_reminders():
+    async with AsyncSessionLocal() as db:
+        reminded = await ReminderService.sweep(db)
+    return f"{reminded} reminder(s) enqueued" if reminded else None
@@ -0,0 +1,158 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.rollups import MonthlyRollup
+
+# Longest range /summary will answer in one call
+SUMMARY_MAX_MONTHS = 120
+
+# (source table, rollup kind, category expression); mirrors migration 0010_rollup_currency
+ROLLUP_SOURCES = [
+    ("expenses", "expense", "category"),
+    ("income", "income", "''"),
+]
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def months_between(start: date, end: date) -> int:
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def _change(current: float, previous: Optional[float]):
+    if previous is None:
+        return None, None
+    delta = current - previous
+    pct = round(delta / previous * 100, 2) if previous else None
+    return round(delta, 2), pct
+
+
+class RollupService:
+    @staticmethod
+    def rebuild(db: Session, user_id: Optional[int] = None) -> int:
+        """
+        Recompute monthly_rollups from expenses and income, for one user or
+        everyone. Writes to the source tables are blocked (reads are not) until
+        the caller commits, so trigger deltas can't interleave with the rebuild.
+        Returns the number of rollup rows written.
+        """
+        params = {"user_id": user_id}
+        user_filter = "" if user_id is None else " AND user_id = :user_id"
+
+        db.execute(text("LOCK TABLE expenses, income IN SHARE MODE"))
+        db.execute(text("DELETE FROM monthly_rollups WHERE true" + user_filter), params)
+        written = 0
+        for table, kind, category in ROLLUP_SOURCES:
+            written += db.execute(text(f"""
+                INSERT INTO monthly_rollups (user_id, month, kind, currency, category, total, count)
+                SELECT user_id, date_trunc('month', date)::date, '{kind}', currency, {category}, sum(amount), count(*)
+                FROM {table}
+                WHERE date IS NOT NULL{user_filter}
+                GROUP BY 1, 2, 4, 5
+            """), params).rowcount
+        return written
+
+    @staticmethod
+    async def summary(db: AsyncSession, user_id: int, start: date, end: date) -> dict:
+        """
+        Totals, category breakdown and month-over-month changes for [start, end]
+        (inclusive months) in each currency the user has rows in, read from the
+        rollup only. Amounts are never added across currencies; /summary/converted
+        reports everything in one currency.
+        """
+        # One extra month in front so the first month in range has a delta
+        rows = await db.execute(
+            select(MonthlyRollup.currency, MonthlyRollup.month, MonthlyRollup.kind,
+                   MonthlyRollup.category, MonthlyRollup.total, MonthlyRollup.count)
+            .where(
+                MonthlyRollup.user_id == user_id,
+                MonthlyRollup.month >= add_months(start, -1),
+                MonthlyRollup.month <= end,
+                MonthlyRollup.count > 0,
+            )
+        )
+        by_currency: Dict[str, list] = defaultdict(list)
+        for currency, *row in rows:
+            by_currency[currency].append(row)
+        return {
+            "start": start,
+            "end": end,
+            "currencies": [
+                RollupService._currency_summary(currency, by_currency[currency], start, end)
+                for currency in sorted(by_currency)
+            ],
+        }
+
+    @staticmethod
+    def _currency_summary(currency: str, rows, start: date, end: date) -> dict:
+        expenses: Dict[date, float] = defaultdict(float)
+        income: Dict[date, float] = defaultdict(float)
+        by_month_category: Dict[date, Dict[str, float]] = defaultdict(dict)
+        category_totals: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        for month, kind, category, total, count in rows:
+            if kind == "income":
+                income[month] += total
+                continue
+            expenses[month] += total
+            if month >= start:
+                by_month_category[month][category] = round(total, 2)
+                category_totals[category][0] += total
+                category_totals[category][1] += count
+
+        months = []
+        previous = add_months(start, -1)
+        prev_expenses = expenses.get(previous)
+        prev_income = income.get(previous)
+        for i in range(months_between(start, end) + 1):
+            month = add_months(start, i)
+            spent, earned = expenses.get(month, 0.0), income.get(month, 0.0)
+            expense_change, expense_pct = _change(spent, prev_expenses)
+            income_change, income_pct = _change(earned, prev_income)
+            months.append({
+                "month": month,
+                "expenses": round(spent, 2),
+                "income": round(earned, 2),
+                "net": round(earned - spent, 2),
+                "expense_change": expense_change,
+                "income_change": income_change,
+                "expense_change_pct": expense_pct,
+                "income_change_pct": income_pct,
+                "categories": by_month_category.get(month, {}),
+            })
+            prev_expenses, prev_income = spent, earned
+
+        total_expenses = sum(m["expenses"] for m in months)
+        total_income = sum(m["income"] for m in months)
+        categories = sorted(
+            (
+                {
+                    "category": category,
+                    "total": round(total, 2),
+                    "count": count,
+                    "share": round(total / total_expenses, 4) if total_expenses else 0.0,
+                }
+                for category, (total, count) in category_totals.items()
+            ),
+            key=lambda c: c["total"],
+            reverse=True,
+        )
+        return {
+            "currency": currency,
+            "total_expenses": round(total_expenses, 2),
+            "total_income": round(total_income, 2),
+            "net": round(total_income - total_expenses, 2),
+            "categories": categories,
+            "months": months,
+        }
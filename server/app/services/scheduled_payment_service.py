@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.scheduler import register_job
+from app.db.session import AsyncSessionLocal
+from app.models.payments import PaymentStatus, ScheduledPayment
+
+
+def effective_status(payment: ScheduledPayment, now: datetime) -> PaymentStatus:
+    """Status as of `now`, for rows the background job hasn't reached yet."""
+    if payment.status == PaymentStatus.pending and payment.scheduled_date < now:
+        return PaymentStatus.due
+    return payment.status
+
+
+class ScheduledPaymentService:
+    @staticmethod
+    async def mark_overdue(db: AsyncSession, now: Optional[datetime] = None, batch_size: Optional[int] = None) -> int:
+        """
+        Move every pending payment scheduled before `now` to due, one
+        set-based UPDATE per batch (committed separately, so row locks are
+        short). Rows locked by a concurrent user edit are skipped and picked
+        up on the next run. Returns the number of rows updated.
+        """
+        now = now or datetime.utcnow()
+        batch_size = batch_size or settings.PAYMENT_DUE_BATCH_SIZE
+        total = 0
+        while True:
+            overdue = (
+                select(ScheduledPayment.id)
+                .where(
+                    ScheduledPayment.status == PaymentStatus.pending,
+                    ScheduledPayment.scheduled_date < now,
+                )
+                .order_by(ScheduledPayment.scheduled_date)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                update(ScheduledPayment)
+                .where(ScheduledPayment.id.in_(overdue.scalar_subquery()))
+                .values(status=PaymentStatus.due)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+
+@register_job("payments_due", interval=settings.PAYMENT_DUE_INTERVAL_SECONDS)
+async def mark_overdue_payments():
+    async with AsyncSessionLocal() as db:
+        updated = await ScheduledPaymentService.mark_overdue(db)
+    return f"{updated} payment(s) marked due" if updated else None
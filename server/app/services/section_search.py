@@ -0,0 +1,260 @@
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from app.models.financial import FinancialModule, Section, SectionTag
+
+# Text search configuration; must match the generated column (migration 0007)
+SEARCH_CONFIG = "english"
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+SNIPPET_WORDS = 35
+
+# ts_rank's default weights for the A (title), C (tags) and B (content) parts
+TITLE_WEIGHT, TAG_WEIGHT, CONTENT_WEIGHT = 1.0, 0.2, 0.4
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+search_vector = literal_column("sections.search_vector", type_=TSVECTOR)
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Query tags the way the section_tags trigger stores them; accepts repeated or comma-separated values."""
+    seen = []
+    for value in tags or []:
+        for tag in value.split(","):
+            tag = tag.strip().lower()[:100]
+            if tag and tag not in seen:
+                seen.append(tag)
+    return seen
+
+
+def _split_tags(tags: Optional[str]) -> List[str]:
+    # As the catalog serializes them
+    return tags.split(",") if tags else []
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [w.lower() for w in _WORD.findall(text or "")]
+
+
+def _visible_to(user_id: int):
+    return or_(FinancialModule.user_id.is_(None), FinancialModule.user_id == user_id)
+
+
+def postgres_search_statement(user_id: int, q: Optional[str], tags: Sequence[str], region: Optional[str], limit: int, offset: int):
+    """
+    Ranked page of matching sections. The page is picked first and only its
+    rows go through ts_headline, which re-parses the whole content.
+    """
+    criteria = [_visible_to(user_id)]
+    if region:
+        criteria.append(Section.region == region)
+    if tags:
+        # Sections carrying every requested tag; answered from the (tag, section_id) key
+        criteria.append(Section.id.in_(
+            select(SectionTag.section_id)
+            .where(SectionTag.tag.in_(tags))
+            .group_by(SectionTag.section_id)
+            .having(func.count() == len(tags))
+        ))
+    if q:
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        criteria.append(search_vector.op("@@")(query))
+        rank = func.ts_rank_cd(search_vector, query)
+    else:
+        rank = literal_column("0.0")
+
+    page = (
+        select(
+            Section.id.label("section_id"),
+            Section.module_id,
+            FinancialModule.title.label("module_title"),
+            Section.title,
+            Section.region,
+            Section.tags,
+            Section.content,
+            rank.label("rank"),
+        )
+        .join(FinancialModule, FinancialModule.id == Section.module_id)
+        .where(*criteria)
+        .order_by(rank.desc(), Section.id)
+        .limit(limit)
+        .offset(offset)
+        .subquery()
+    )
+    if q:
+        snippet = func.ts_headline(SEARCH_CONFIG, page.c.content, func.websearch_to_tsquery(SEARCH_CONFIG, q), SNIPPET_OPTIONS)
+    else:
+        snippet = func.left(page.c.content, 300)
+    return (
+        select(
+            page.c.section_id, page.c.module_id, page.c.module_title, page.c.title,
+            page.c.region, page.c.tags, page.c.rank, snippet.label("snippet"),
+        )
+        .order_by(page.c.rank.desc(), page.c.section_id)
+    )
+
+
+# -----------------------------
+# Fallback for databases without full-text search (SQLite)
+# -----------------------------
+def make_snippet(content: str, terms: Set[str], words: int = SNIPPET_WORDS) -> str:
+    """A window of `words` words around the first matching word, matches wrapped like ts_headline's."""
+    spans = [(m.start(), m.end(), m.group().lower() in terms) for m in _WORD.finditer(content or "")]
+    if not spans:
+        return ""
+    first = next((i for i, (_, _, hit) in enumerate(spans) if hit), 0)
+    start = max(0, min(first - words // 3, len(spans) - words))
+    window = spans[start:start + words]
+    out, pos = [], window[0][0]
+    for begin, end, hit in window:
+        out.append(content[pos:begin])
+        out.append(f"<mark>{content[begin:end]}</mark>" if hit else content[begin:end])
+        pos = end
+    return "".join(out)
+
+
+class InvertedIndex:
+    """
+    In-memory term -> {section_id: weighted term frequency} postings over
+    every section. Terms are lower-cased words without stemming, so it is
+    stricter than the Postgres `english` configuration ("taxes" does not
+    match "tax"). Queries AND their terms like websearch_to_tsquery and
+    rank by tf-idf with ts_rank's per-field weights.
+    """
+
+    def __init__(self, rows: Iterable):
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self.docs: Dict[int, dict] = {}
+        for row in rows:
+            self.docs[row.section_id] = {
+                "section_id": row.section_id,
+                "module_id": row.module_id,
+                "owner_id": row.user_id,
+                "title": row.title,
+                "region": row.region,
+                "tags": row.tags,
+                "tag_set": set(normalize_tags([row.tags or ""])),
+                "content": row.content,
+            }
+            for text, weight in ((row.title, TITLE_WEIGHT), (row.tags, TAG_WEIGHT), (row.content, CONTENT_WEIGHT)):
+                for term in tokenize(text):
+                    postings = self.postings[term]
+                    postings[row.section_id] = postings.get(row.section_id, 0.0) + weight
+
+    def match(self, terms: Sequence[str]) -> Dict[int, float]:
+        """section_id -> score for sections containing every term."""
+        lists = sorted((self.postings.get(t, {}) for t in set(terms)), key=len)
+        if not lists or not lists[0]:
+            return {}
+        hits = set(lists[0])
+        for postings in lists[1:]:
+            hits &= postings.keys()
+        scores = dict.fromkeys(hits, 0.0)
+        for postings in lists:
+            idf = math.log(1 + len(self.docs) / len(postings))
+            for section_id in hits:
+                scores[section_id] += postings[section_id] * idf
+        return scores
+
+
+class SectionSearchService:
+    _index: Optional[Tuple[int, InvertedIndex]] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def search(
+        db: Session,
+        user_id: int,
+        q: Optional[str],
+        tags: Sequence[str],
+        region: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> List[dict]:
+        """Sections the user can see, matching `q` (web-search syntax) and all of `tags`, best first."""
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = postgres_search_statement(user_id, q, tags, region, limit, offset)
+            return [
+                {**row._asdict(), "tags": _split_tags(row.tags), "rank": float(row.rank)}
+                for row in db.execute(stmt)
+            ]
+        return SectionSearchService._search_fallback(db, user_id, q, tags, region, limit, offset)
+
+    @staticmethod
+    def _fallback_index(db: Session) -> InvertedIndex:
+        # Every write to a section adds or removes an id or gives it a new
+        # last_updated, so the (id, last_updated) pairs change with it. An
+        # aggregate such as max(last_updated) would not: an update can be
+        # older than a section created with a later, client-supplied date.
+        # Reading two narrow columns is still far cheaper than a rebuild.
+        # Module titles can change on their own and are looked up per query.
+        signature = hash(tuple(db.execute(
+            select(Section.id, Section.last_updated).order_by(Section.id)
+        ).all()))
+        with SectionSearchService._lock:
+            cached = SectionSearchService._index
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        rows = db.execute(
+            select(
+                Section.id.label("section_id"),
+                Section.module_id,
+                FinancialModule.user_id,
+                Section.title,
+                Section.region,
+                Section.tags,
+                Section.content,
+            ).join(FinancialModule, FinancialModule.id == Section.module_id)
+        )
+        index = InvertedIndex(rows)
+        with SectionSearchService._lock:
+            SectionSearchService._index = (signature, index)
+        return index
+
+    @staticmethod
+    def _search_fallback(db, user_id, q, tags, region, limit, offset) -> List[dict]:
+        index = SectionSearchService._fallback_index(db)
+        terms = tokenize(q)
+        scores = index.match(terms) if terms else dict.fromkeys(index.docs, 0.0)
+
+        wanted = set(tags)
+        hits = []
+        for section_id, score in scores.items():
+            doc = index.docs[section_id]
+            if doc["owner_id"] is not None and doc["owner_id"] != user_id:
+                continue
+            if region and doc["region"] != region:
+                continue
+            if not wanted <= doc["tag_set"]:
+                continue
+            hits.append((-score, section_id))
+        hits.sort()
+
+        page = [index.docs[section_id] for _, section_id in hits[offset:offset + limit]]
+        module_titles = dict(db.execute(
+            select(FinancialModule.id, FinancialModule.title)
+            .where(FinancialModule.id.in_({doc["module_id"] for doc in page}))
+        ).all()) if page else {}
+
+        term_set = set(terms)
+        results = []
+        for doc in page:
+            results.append({
+                "section_id": doc["section_id"],
+                "module_id": doc["module_id"],
+                "module_title": module_titles.get(doc["module_id"], ""),
+                "title": doc["title"],
+                "region": doc["region"],
+                "tags": _split_tags(doc["tags"]),
+                "rank": scores[doc["section_id"]],
+                "snippet": make_snippet(doc["content"], term_set) if term_set else (doc["content"] or "")[:300],
+            })
+        return results
@@ -0,0 +1,27 @@
+import json
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.http_cache import VersionedBodyCache
+from app.models.tax_resource import TaxResource
+from app.schemas.tax_resource import TaxResourceOut
+
+
+def _build_resources(db: Session) -> str:
+    resources = db.scalars(select(TaxResource).order_by(TaxResource.created_at.desc())).all()
+    return json.dumps(
+        jsonable_encoder([TaxResourceOut.from_orm(r) for r in resources]),
+        separators=(",", ":"),
+    )
+
+
+# Every tax resource, newest first, as the JSON body of GET /tax-resources
+tax_resources_cache = VersionedBodyCache(
+    "tax_resources",
+    _build_resources,
+    local_ttl=settings.CATALOG_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.CATALOG_TTL_SECONDS,
+)
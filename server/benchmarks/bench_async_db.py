@@ -0,0 +1,92 @@
+"""
+Benchmark: sync `SessionLocal` route vs async `AsyncSessionLocal` route under
+many concurrent clients.
+
+Both routes run the same per-user expense listing against the configured
+database. The sync route is a plain `def` handler, so every request first has
+to win one of anyio's threadpool slots (40 by default) before it can check out
+a connection; the async route awaits the pool directly.
+
+    cd server && python -m benchmarks.bench_async_db --clients 500 --user-id 1
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.dependencies.db import get_async_db, get_db
+from app.db.session import async_engine, engine
+from app.models.expenses import Expense
+
+
+def build_app(user_id: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_expenses(db: Session = Depends(get_db)):
+        return len(db.query(Expense).filter(Expense.user_id == user_id).all())
+
+    @app.get("/async")
+    async def async_expenses(db: AsyncSession = Depends(get_async_db)):
+        expenses = await db.scalars(select(Expense).where(Expense.user_id == user_id))
+        return len(expenses.all())
+
+    return app
+
+
+async def run_clients(app: FastAPI, path: str, clients: int, requests_per_client: int) -> tuple[list[float], float]:
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", limits=limits, timeout=None) as client:
+        latencies: list[float] = []
+
+        async def worker():
+            for _ in range(requests_per_client):
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await client.get(path)  # warm the pool
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+
+def report(label: str, latencies: list[float], elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    rps = len(latencies) / elapsed
+    print(f"{label:<8} p50={p50:8.2f}ms  p99={p99:8.2f}ms  max={latencies[-1]:8.2f}ms  {rps:8.1f} req/s")
+
+
+async def amain(args) -> None:
+    app = build_app(args.user_id)
+    try:
+        for label, path in (("sync", "/sync"), ("async", "/async")):
+            latencies, elapsed = await run_clients(app, path, args.clients, args.requests)
+            report(label, latencies, elapsed)
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5, help="requests per client")
+    parser.add_argument("--user-id", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(amain(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: bulk expense import throughput.
+
+Writes a synthetic bank-statement CSV, runs the import job synchronously for
+a throwaway user, and prints the job summary. A second run of the same file
+measures the dedupe path (everything should come back as duplicates). The
+user and rows are deleted afterwards. Needs Postgres and Redis.
+
+    cd server && python -m benchmarks.bench_expense_import --rows 100000
+"""
+import argparse
+import csv
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.services.import_service import ExpenseImportService, ImportJobStore
+
+
+def write_statement(path: str, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date", "Description", "Amount", "Category"])
+        for i in range(rows):
+            day = start + timedelta(minutes=i)
+            writer.writerow([
+                day.strftime("%Y-%m-%dT%H:%M:%S"),
+                f"Merchant {i % 500}",
+                f"-{random.randint(100, 50000) / 100:.2f}",
+                random.choice(["Food", "Rent", "Transport", "Books"]),
+            ])
+        writer.writerow(["not-a-date", "broken row", "abc", ""])
+
+
+def run_job(user_id: int, statement: str) -> dict:
+    # The job deletes its input, so hand it a copy
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    shutil.copyfile(statement, path)
+    job_id = ImportJobStore.create(user_id, "bench.csv", "csv")
+    start = time.perf_counter()
+    ExpenseImportService.run(job_id, user_id, path, "csv")
+    job = ImportJobStore.get(job_id)
+    job["wall_ms"] = round((time.perf_counter() - start) * 1000)
+    return job
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        user_id = conn.execute(text("""
+            INSERT INTO users (email, username, hashed_password, education, nationality,
+                               is_active, is_verified, is_superuser, created_at, updated_at)
+            VALUES ('bench@import.local', 'bench_import', 'x', 'n/a', 'n/a',
+                    true, true, false, now(), now())
+            RETURNING id
+        """)).scalar_one()
+
+    statement = tempfile.mktemp(suffix=".csv")
+    try:
+        write_statement(statement, args.rows)
+        for label in ("first import", "re-import (dedupe)"):
+            job = run_job(user_id, statement)
+            print(
+                f"{label:<20} status={job['status']} processed={job['processed']:,} "
+                f"inserted={job['inserted']:,} duplicates={job['duplicates']:,} failed={job['failed']} "
+                f"wall={job['wall_ms']}ms ({job['processed'] / max(job['wall_ms'], 1) * 1000:,.0f} rows/s)"
+            )
+            if job.get("error"):
+                print(f"  error: {job['error']}")
+    finally:
+        if os.path.exists(statement):
+            os.remove(statement)
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM expenses WHERE user_id = :u"), {"u": user_id})
+            conn.execute(text("DELETE FROM users WHERE id = :u"), {"u": user_id})
+
+
+if __name__ == "__main__":
+    main()
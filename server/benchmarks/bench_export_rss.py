@@ -0,0 +1,95 @@
+"""
+Benchmark: resident memory while streaming a large export.
+
+Seeds N expense rows for a throwaway user (committed, so the export's own
+session can see them), drains `ExportService.stream()` exactly as the
+StreamingResponse would, and samples RSS as it goes. Flat RSS means memory
+is bounded by the cursor batch and chunk size, not by the row count. The
+seeded user and rows are deleted afterwards.
+
+    cd server && python -m benchmarks.bench_export_rss --rows 5000000 --gzip
+"""
+import argparse
+import os
+import resource
+import time
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.services.export_service import ExportService
+
+
+def rss_mb() -> float:
+    """Current RSS (Linux /proc); falls back to peak RSS elsewhere."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def seed(rows: int) -> int:
+    with engine.begin() as conn:
+        user_id = conn.execute(text("""
+            INSERT INTO users (email, username, hashed_password, education, nationality,
+                               is_active, is_verified, is_superuser, created_at, updated_at)
+            VALUES ('bench@export.local', 'bench_export', 'x', 'n/a', 'n/a',
+                    true, true, false, now(), now())
+            RETURNING id
+        """)).scalar_one()
+        conn.execute(text("""
+            INSERT INTO expenses (user_id, category, amount, description, date)
+            SELECT :user_id, 'bench', g % 1000, 'row ' || g, now() - (g || ' seconds')::interval
+            FROM generate_series(1, :rows) g
+        """), {"user_id": user_id, "rows": rows})
+    return user_id
+
+
+def cleanup(user_id: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM expenses WHERE user_id = :u"), {"u": user_id})
+        conn.execute(text("DELETE FROM users WHERE id = :u"), {"u": user_id})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"seeding {args.rows:,} rows...")
+    user_id = seed(args.rows)
+    try:
+        baseline = rss_mb()
+        peak = baseline
+        sent = 0
+        chunks = 0
+        marks = []
+        sample_every = max(1, (args.rows * 60 // (64 * 1024)) // args.samples)  # ~60 bytes/row
+
+        start = time.perf_counter()
+        for chunk in ExportService.stream("expenses", user_id, args.format, args.gzip):
+            sent += len(chunk)
+            chunks += 1
+            if chunks % sample_every == 0:
+                current = rss_mb()
+                peak = max(peak, current)
+                marks.append((sent, current))
+        elapsed = time.perf_counter() - start
+
+        for sent_at, current in marks:
+            print(f"  {sent_at / 2**20:10.1f} MiB sent   rss={current:8.1f} MiB")
+        print(
+            f"rows={args.rows:,} bytes={sent / 2**20:.1f} MiB in {elapsed:.1f}s "
+            f"({args.rows / elapsed:,.0f} rows/s)  rss baseline={baseline:.1f} MiB peak={peak:.1f} MiB"
+        )
+    finally:
+        cleanup(user_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: a burst of concurrent currency-tracing lookups.
+
+Fires N concurrent rate lookups for mixed bases (USD, EUR, KES, ...) against
+a fake provider with simulated upstream latency, first with the cache cold
+and then warm. It reports wall time and how many upstream calls were made.
+The upstream count should stay at 1 however large N is. No network, Redis or
+database needed.
+
+    cd server && python -m benchmarks.bench_fx_rates --requests 1000 --latency 0.2
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.services.fx_service import FakeRateProvider, FxRateService
+
+BASES = ["USD", "EUR", "KES", "GBP", "NGN"]
+TARGETS = ["EUR", "KES", "GBP", "INR"]
+
+
+async def burst(service: FxRateService, requests: int):
+    latencies = []
+
+    async def one(i: int):
+        start = time.perf_counter()
+        await service.rates(BASES[i % len(BASES)], TARGETS)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    latencies.sort()
+    return (
+        (time.perf_counter() - start) * 1000,
+        statistics.median(latencies),
+        latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    )
+
+
+async def main_async(args):
+    provider = FakeRateProvider(latency=args.latency)
+    service = FxRateService(provider, pivot="USD", ttl=300, stale=3600)
+
+    print(f"{args.requests} concurrent lookups, {args.latency * 1000:.0f} ms upstream latency")
+    print(f"{'cache':<6} {'wall ms':>10} {'median ms':>10} {'p99 ms':>10} {'upstream calls':>15}")
+    for label in ("cold", "warm"):
+        before = provider.calls
+        wall, median, p99 = await burst(service, args.requests)
+        print(f"{label:<6} {wall:>10.1f} {median:>10.2f} {p99:>10.2f} {provider.calls - before:>15}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated upstream latency, seconds")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Regression benchmark: latency of a cheap endpoint while slow, blocking
+logins are in flight.
+
+A sync login handler that blocks for ~250ms (bcrypt-like) is served twice:
+once behind the current `handle_exceptions`, once behind the previous
+always-async wrapper. With the old wrapper the blocking body runs on the
+event loop and `/ping` latency tracks the login queue; with the current one
+it stays flat.
+
+    cd server && python -m benchmarks.bench_handle_exceptions
+"""
+import argparse
+import asyncio
+import inspect
+import statistics
+import time
+from functools import wraps
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.decorators.handle_exceptions import handle_exceptions
+
+
+def legacy_handle_exceptions(func):
+    """The pre-fix wrapper: always async, calls sync bodies inline."""
+    is_coroutine = asyncio.iscoroutinefunction(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if is_coroutine:
+            return await func(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    wrapper.__signature__ = inspect.signature(func)
+    return wrapper
+
+
+def build_app(decorator, login_seconds: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    @decorator
+    def login():
+        time.sleep(login_seconds)  # stands in for bcrypt + DB
+        return {"ok": True}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def measure(app: FastAPI, logins: int, pings: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login_tasks = [asyncio.create_task(client.post("/login")) for _ in range(logins)]
+        await asyncio.sleep(0.01)  # let the logins start
+
+        latencies = []
+        for _ in range(pings):
+            start = time.perf_counter()
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.005)
+
+        await asyncio.gather(*login_tasks)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<28} p50={p50:8.2f}ms  p99={p99:8.2f}ms  max={latencies[-1]:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--pings", type=int, default=50)
+    parser.add_argument("--login-seconds", type=float, default=0.25)
+    args = parser.parse_args()
+
+    for label, decorator in (
+        ("legacy (async wrapper)", legacy_handle_exceptions),
+        ("handle_exceptions", handle_exceptions),
+    ):
+        app = build_app(decorator, args.login_seconds)
+        latencies = asyncio.run(measure(app, args.logins, args.pings))
+        report(label, latencies)
+
+
+if __name__ == "__main__":
+    main()
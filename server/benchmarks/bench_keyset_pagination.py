@@ -0,0 +1,93 @@
+"""
+Benchmark: page fetch latency at increasing depth, keyset vs OFFSET, over
+1M expense rows for one user.
+
+Seeds the rows inside a transaction on the configured (migrated) Postgres
+database and rolls back at the end. Keyset pages use the same `Keyset` helper
+as `GET /expenses`; the OFFSET column shows what the cost would be without it.
+
+    cd server && python -m benchmarks.bench_keyset_pagination --rows 1000000
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.pagination import Keyset, PageParams, encode_cursor
+from app.db.session import engine
+from app.models.expenses import Expense
+
+keyset = Keyset(Expense.date, Expense.id)
+
+
+def seed(session: Session, rows: int) -> int:
+    user_id = session.execute(text("""
+        INSERT INTO users (email, username, hashed_password, education, nationality,
+                           is_active, is_verified, is_superuser, created_at, updated_at)
+        VALUES ('bench@pagination.local', 'bench_pagination', 'x', 'n/a', 'n/a',
+                true, true, false, now(), now())
+        RETURNING id
+    """)).scalar_one()
+    session.execute(text("""
+        INSERT INTO expenses (user_id, category, amount, description, date)
+        SELECT :user_id, 'bench', 1, '', now() - (g || ' seconds')::interval
+        FROM generate_series(1, :rows) g
+    """), {"user_id": user_id, "rows": rows})
+    session.execute(text("ANALYZE expenses"))
+    return user_id
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        try:
+            user_id = seed(session, args.rows)
+            base = select(Expense).where(Expense.user_id == user_id)
+
+            print(f"{'depth (rows)':>14}  {'keyset ms':>10}  {'offset ms':>10}")
+            for depth in (0, 1_000, 10_000, 100_000, args.rows - args.limit):
+                if depth >= args.rows:
+                    continue
+                # Cursor pointing at the row just before `depth`, as a client would hold it
+                cursor = None
+                if depth:
+                    date, ident = session.execute(
+                        select(Expense.date, Expense.id)
+                        .where(Expense.user_id == user_id)
+                        .order_by(Expense.date.desc(), Expense.id.desc())
+                        .offset(depth - 1)
+                        .limit(1)
+                    ).one()
+                    cursor = encode_cursor([date, ident])
+
+                page = PageParams(limit=args.limit, cursor=cursor)
+                keyset_ms = timed(lambda: session.scalars(keyset.apply(base, page)).all(), args.repeat)
+                offset_ms = timed(
+                    lambda: session.scalars(
+                        base.order_by(Expense.date.desc(), Expense.id.desc()).offset(depth).limit(args.limit)
+                    ).all(),
+                    args.repeat,
+                )
+                print(f"{depth:>14,}  {keyset_ms:>10.2f}  {offset_ms:>10.2f}")
+        finally:
+            session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark: saving a 200-section module after editing one section.
+
+Compares the old save path (delete every section and question, re-insert
+them all) with `ModuleService.apply_update`, which diffs the payload against
+the stored rows. Reports median/p99 latency, statements sent and rows
+written per save. Runs inside a transaction on the configured (migrated)
+database and rolls back at the end.
+
+    cd server && python -m benchmarks.bench_module_update --sections 200 --repeat 50
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.session import engine
+from app.models.financial import FinancialModule, QuizQuestion, Section
+from app.schemas.financial import FinancialModuleUpdate
+from app.services.module_service import ModuleService
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+    def reset(self):
+        self.statements = 0
+
+
+def seed(session: Session, sections: int, questions: int) -> int:
+    module = FinancialModule(title="Bench module", user_id=None)
+    session.add(module)
+    session.flush()
+    session.execute(insert(Section), [
+        {
+            "module_id": module.id,
+            "title": f"Section {i}",
+            "content": "Lorem ipsum dolor sit amet. " * 40,
+            "last_updated": datetime.utcnow(),
+            "reviewed_by": "bench",
+            "region": "US",
+            "tags": "tax,visa,bench",
+        }
+        for i in range(sections)
+    ])
+    session.execute(insert(QuizQuestion), [
+        {"module_id": module.id, "question": f"Q{i}?", "options": "A,B,C", "answer": "A"}
+        for i in range(questions)
+    ])
+    return module.id
+
+
+def payload(session: Session, module_id: int, edit: int, with_ids: bool) -> FinancialModuleUpdate:
+    """The module as the admin editor sends it back, with one section's content changed."""
+    sections = session.scalars(select(Section).where(Section.module_id == module_id).order_by(Section.id)).all()
+    quiz = session.scalars(select(QuizQuestion).where(QuizQuestion.module_id == module_id).order_by(QuizQuestion.id)).all()
+    return FinancialModuleUpdate(
+        title="Bench module",
+        sections=[
+            {
+                "id": s.id if with_ids else None,
+                "title": s.title,
+                "content": s.content + (f" edit {edit}" if i == 0 else ""),
+                "reviewed_by": s.reviewed_by,
+                "region": s.region,
+                "tags": s.tags.split(","),
+            }
+            for i, s in enumerate(sections)
+        ],
+        quiz=[
+            {"id": q.id if with_ids else None, "question": q.question, "options": q.options.split(","), "answer": q.answer}
+            for q in quiz
+        ],
+    )
+
+
+def rewrite_all(session: Session, module_id: int, module_in: FinancialModuleUpdate) -> int:
+    """The previous save path, kept here for comparison. Returns rows written."""
+    session.execute(delete(Section).where(Section.module_id == module_id))
+    session.execute(delete(QuizQuestion).where(QuizQuestion.module_id == module_id))
+    for s in module_in.sections:
+        session.add(Section(
+            module_id=module_id, title=s.title, content=s.content, last_updated=datetime.utcnow(),
+            reviewed_by=s.reviewed_by, region=s.region, tags=",".join(s.tags),
+        ))
+    for q in module_in.quiz:
+        session.add(QuizQuestion(module_id=module_id, question=q.question, options=",".join(q.options), answer=q.answer))
+    session.flush()
+    return 2 * (len(module_in.sections) + len(module_in.quiz))
+
+
+def apply_diff(session: Session, module: FinancialModule, module_in: FinancialModuleUpdate) -> int:
+    counts = ModuleService.apply_update(session, module, module_in)
+    session.flush()
+    return sum(n for table in counts.values() for n in table.values())
+
+
+def run(session, counter, module_id, repeat, save, with_ids):
+    samples, statements, rows = [], [], []
+    for i in range(repeat):
+        module_in = payload(session, module_id, i, with_ids)
+        module = session.get(FinancialModule, module_id)
+        counter.reset()
+        start = time.perf_counter()
+        written = save(session, module, module_in)
+        samples.append((time.perf_counter() - start) * 1000)
+        statements.append(counter.statements)
+        rows.append(written)
+        session.expire_all()
+    samples.sort()
+    return (
+        statistics.median(samples),
+        samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        statistics.median(statements),
+        statistics.median(rows),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    counter = StatementCounter()
+    with Session(engine) as session:
+        try:
+            module_id = seed(session, args.sections, args.questions)
+            session.flush()
+            event.listen(engine, "before_cursor_execute", counter)
+
+            results = {
+                "delete + reinsert": run(
+                    session, counter, module_id, args.repeat,
+                    lambda s, m, p: rewrite_all(s, m.id, p), with_ids=False,
+                ),
+                "diff": run(
+                    session, counter, module_id, args.repeat,
+                    apply_diff, with_ids=True,
+                ),
+            }
+        finally:
+            event.remove(engine, "before_cursor_execute", counter)
+            session.rollback()
+
+    print(f"{args.sections} sections / {args.questions} questions, one section edited per save")
+    print(f"{'path':<20} {'median ms':>10} {'p99 ms':>10} {'statements':>11} {'rows written':>13}")
+    for name, (median, p99, statements, rows) in results.items():
+        print(f"{name:<20} {median:>10.2f} {p99:>10.2f} {statements:>11.0f} {rows:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Microbenchmark: password verifications ("logins") per second per core at
+each work factor, plus aggregate throughput through the process pool.
+
+    cd server && python -m benchmarks.bench_password_hashing --rounds 10 11 12 13
+    cd server && python -m benchmarks.bench_password_hashing --argon2   # needs argon2-cffi
+"""
+import argparse
+import os
+import time
+from concurrent.futures import wait
+
+from app.core.password_hashing import PasswordHasher, build_context, _verify
+
+PASSWORD = "correct horse battery staple"
+
+
+def single_core(params: tuple, seconds: float) -> float:
+    ctx = build_context(params)
+    hashed = ctx.hash(PASSWORD)
+    done = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        ctx.verify(PASSWORD, hashed)
+        done += 1
+    return done / (time.perf_counter() - start)
+
+
+def pooled(hasher: PasswordHasher, total: int) -> float:
+    hashed = hasher.hash(PASSWORD)  # also warms up the workers
+    start = time.perf_counter()
+    futures = [hasher._submit(_verify, PASSWORD, hashed) for _ in range(total)]
+    wait(futures)
+    return total / (time.perf_counter() - start)
+
+
+def run(label: str, hasher: PasswordHasher, seconds: float, total: int) -> None:
+    per_core = single_core(hasher.params, seconds)
+    pool_rate = pooled(hasher, total)
+    hasher.shutdown()
+    print(
+        f"{label:<24} {per_core:8.1f} logins/s/core   "
+        f"{pool_rate:8.1f} logins/s with {hasher.workers} workers   "
+        f"{1000 / per_core:7.1f} ms/login"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--argon2", action="store_true")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--total", type=int, default=64)
+    args = parser.parse_args()
+
+    for rounds in args.rounds:
+        hasher = PasswordHasher(scheme="bcrypt", bcrypt_rounds=rounds, workers=args.workers)
+        run(f"bcrypt rounds={rounds}", hasher, args.seconds, args.total)
+
+    if args.argon2:
+        for time_cost in (2, 3, 4):
+            hasher = PasswordHasher(scheme="argon2", argon2_time_cost=time_cost, workers=args.workers)
+            run(f"argon2id t={time_cost} m=64MiB", hasher, args.seconds, args.total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""baseline schema
+
+The schema as `Base.metadata.create_all()` used to build it at import time.
+Tables that already exist are left alone, so databases created that way
+adopt this revision on their first `alembic upgrade head`.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name, *columns, **kwargs):
+    # Offline (`--sql`) there is no database to inspect; the script is for a fresh one
+    if context.is_offline_mode() or not sa.inspect(op.get_bind()).has_table(name):
+        op.create_table(name, *columns, **kwargs)
+
+
+def _user_fk(ondelete=None):
+    return sa.ForeignKey("users.id", ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("email", sa.String(255), nullable=False, unique=True, index=True),
+        sa.Column("username", sa.String(50), nullable=False, unique=True, index=True),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(100), nullable=True),
+        sa.Column("visa_status", sa.String(50), nullable=True),
+        sa.Column("education", sa.String(100), nullable=False),
+        sa.Column("nationality", sa.String(100), nullable=False),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("is_verified", sa.Boolean()),
+        sa.Column("is_superuser", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    _create_table(
+        "user_audit_logs",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("action", sa.String(100), nullable=False),
+        sa.Column("timestamp", sa.DateTime()),
+        sa.Column("details", sa.String(500), nullable=True),
+    )
+    _create_table(
+        "user_documents",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("document_type", sa.String(50), nullable=False),
+        sa.Column("file_name", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(255), nullable=False),
+        sa.Column("tags", sa.String(255)),
+        sa.Column("uploaded_at", sa.DateTime()),
+    )
+    _create_table(
+        "bank_accounts",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("account_number", sa.String(20), nullable=False),
+        sa.Column("balance", sa.Float()),
+        sa.Column("last_sync", sa.DateTime()),
+    )
+    _create_table(
+        "expenses",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(255)),
+        sa.Column("date", sa.DateTime()),
+    )
+    _create_table(
+        "income",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(255)),
+        sa.Column("date", sa.DateTime()),
+    )
+    _create_table(
+        "currency_tracing",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(500), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("date", sa.String(50), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    _create_table(
+        "user_engagements",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("module_name", sa.String(255), nullable=False),
+        sa.Column("action", sa.String(100), nullable=False),
+        sa.Column("timestamp", sa.DateTime()),
+        sa.Column("critical_date", sa.DateTime(), nullable=True),
+        sa.Column("snoozed_until", sa.DateTime(), nullable=True),
+        sa.Column("is_done", sa.Boolean()),
+    )
+    _create_table(
+        "financial_modules",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+    )
+    _create_table(
+        "sections",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("module_id", sa.Integer(), sa.ForeignKey("financial_modules.id"), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("last_updated", sa.DateTime()),
+        sa.Column("reviewed_by", sa.String(255), nullable=True),
+        sa.Column("region", sa.String(50)),
+        sa.Column("tags", sa.String()),
+        sa.Column("download_url", sa.String(1024), nullable=True),
+    )
+    _create_table(
+        "quiz_questions",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("module_id", sa.Integer(), sa.ForeignKey("financial_modules.id"), nullable=False),
+        sa.Column("question", sa.String(), nullable=False),
+        sa.Column("options", sa.String(), nullable=False),
+        sa.Column("answer", sa.String(), nullable=False),
+    )
+    _create_table(
+        "subscriptions",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("plan_name", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(50)),
+        sa.Column("mrr", sa.Float()),
+        sa.Column("churned", sa.Boolean()),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("ended_at", sa.DateTime(), nullable=True),
+    )
+    _create_table(
+        "tax_resources",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk("CASCADE"), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("type", sa.String(100), nullable=False),
+        sa.Column("access", sa.String(20), nullable=False),
+        sa.Column("download_url", sa.String(500), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    _create_table(
+        "payments",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("currency", sa.String(10)),
+        sa.Column("status", sa.String(50)),
+        sa.Column("promo_code", sa.String(50), nullable=True),
+        sa.Column("refunded", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("refunded_at", sa.DateTime(), nullable=True),
+    )
+    _create_table(
+        "support_tickets",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk("CASCADE"), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(1000), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("created_on", sa.DateTime()),
+        sa.Column("last_updated", sa.DateTime()),
+    )
+    _create_table(
+        "scheduled_payments",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), _user_fk(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(255)),
+        sa.Column("scheduled_date", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "done", "due", name="paymentstatus"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    for table in (
+        "scheduled_payments",
+        "support_tickets",
+        "payments",
+        "tax_resources",
+        "subscriptions",
+        "quiz_questions",
+        "sections",
+        "financial_modules",
+        "user_engagements",
+        "currency_tracing",
+        "income",
+        "expenses",
+        "bank_accounts",
+        "user_documents",
+        "user_audit_logs",
+        "users",
+    ):
+        op.drop_table(table)
+    sa.Enum(name="paymentstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,71 @@
+"""hot-path indexes
+
+Composite indexes matched to the list routes (filter by user, order by date)
+and partial indexes for the admin/dashboard predicates. Mirrored in the
+models' `__table_args__`; `scripts/check_query_plans.py` verifies the
+planner actually uses them.
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_hot_path_indexes"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, extra kwargs)
+INDEXES = [
+    ("ix_expenses_user_id_date", "expenses", ["user_id", "date"], {}),
+    ("ix_income_user_id_date", "income", ["user_id", "date"], {}),
+    ("ix_user_documents_user_id_uploaded_at", "user_documents", ["user_id", "uploaded_at"], {}),
+    ("ix_bank_accounts_user_id", "bank_accounts", ["user_id"], {}),
+    ("ix_currency_tracing_user_id_created_at", "currency_tracing", ["user_id", "created_at"], {}),
+    ("ix_user_engagements_user_id_critical_date", "user_engagements", ["user_id", "critical_date"], {}),
+    (
+        "ix_scheduled_payments_user_id_scheduled_date_status",
+        "scheduled_payments",
+        ["user_id", "scheduled_date", "status"],
+        {},
+    ),
+    (
+        "ix_scheduled_payments_pending_scheduled_date",
+        "scheduled_payments",
+        ["scheduled_date"],
+        {"postgresql_where": sa.text("status = 'pending'")},
+    ),
+    ("ix_support_tickets_user_id_created_on", "support_tickets", ["user_id", "created_on"], {}),
+    ("ix_support_tickets_status_created_on", "support_tickets", ["status", "created_on"], {}),
+    ("ix_payments_user_id_created_at", "payments", ["user_id", "created_at"], {}),
+    (
+        "ix_payments_not_refunded_created_at",
+        "payments",
+        ["created_at"],
+        {"postgresql_where": sa.text("refunded = false"), "postgresql_include": ["amount"]},
+    ),
+    ("ix_subscriptions_user_id", "subscriptions", ["user_id"], {}),
+    (
+        "ix_subscriptions_not_churned",
+        "subscriptions",
+        ["started_at"],
+        {"postgresql_where": sa.text("churned = false")},
+    ),
+    ("ix_financial_modules_user_id", "financial_modules", ["user_id"], {}),
+    ("ix_sections_module_id", "sections", ["module_id"], {}),
+    ("ix_quiz_questions_module_id", "quiz_questions", ["module_id"], {}),
+    ("ix_tax_resources_user_id_created_at", "tax_resources", ["user_id", "created_at"], {}),
+    ("ix_user_audit_logs_user_id", "user_audit_logs", ["user_id"], {}),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, kwargs in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True, **kwargs)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
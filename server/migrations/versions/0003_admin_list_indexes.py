@@ -0,0 +1,31 @@
+"""admin list indexes
+
+Sort-key indexes for the cursor-paginated admin lists, which page over whole
+tables ordered by creation time.
+
+Revision ID: 0003_admin_list_indexes
+Revises: 0002_hot_path_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = "0003_admin_list_indexes"
+down_revision = "0002_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_payments_created_at", "payments", ["created_at"]),
+    ("ix_subscriptions_started_at", "subscriptions", ["started_at"]),
+    ("ix_support_tickets_created_on", "support_tickets", ["created_on"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
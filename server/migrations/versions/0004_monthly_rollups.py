@@ -0,0 +1,109 @@
+"""monthly rollups
+
+Per-user, per-month, per-category totals for expenses and income, kept in
+step with the source tables by statement-level triggers. The triggers read
+the statement's transition tables, so a bulk INSERT/UPDATE/DELETE costs one
+aggregated upsert rather than one per row, and an UPDATE that moves a row to
+another month or category subtracts it from the old bucket and adds it to
+the new one. Existing rows are backfilled once here.
+
+Revision ID: 0004_monthly_rollups
+Revises: 0003_admin_list_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_monthly_rollups"
+down_revision = "0003_admin_list_indexes"
+branch_labels = None
+depends_on = None
+
+# (source table, rollup kind, category expression)
+SOURCES = [
+    ("expenses", "expense", "category"),
+    ("income", "income", "''"),
+]
+
+
+def _deltas(rows: str, category: str, sign: str) -> str:
+    return f"""
+        SELECT user_id, date_trunc('month', date)::date AS month, {category} AS category,
+               {sign}amount AS amount, {sign}1 AS n
+        FROM {rows}
+        WHERE date IS NOT NULL
+    """
+
+
+def _upsert(kind: str, deltas: str) -> str:
+    # Fixed ORDER BY so concurrent statements lock rollup rows in the same order
+    return f"""
+        INSERT INTO monthly_rollups AS r (user_id, month, kind, category, total, count)
+        SELECT user_id, month, '{kind}', category, sum(amount), sum(n)
+        FROM ({deltas}) d
+        GROUP BY user_id, month, category
+        HAVING sum(n) <> 0 OR sum(amount) <> 0
+        ORDER BY user_id, month, category
+        ON CONFLICT (user_id, month, kind, category)
+        DO UPDATE SET total = r.total + EXCLUDED.total, count = r.count + EXCLUDED.count;
+    """
+
+
+def _sync_function(table: str, kind: str, category: str) -> str:
+    inserted = _deltas("new_rows", category, "")
+    deleted = _deltas("old_rows", category, "-")
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_rollup_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {_upsert(kind, inserted)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {_upsert(kind, deleted)}
+        ELSE
+            {_upsert(kind, inserted + " UNION ALL " + deleted)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+TRIGGERS = [
+    ("insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("delete", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_rollups",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("kind", sa.String(10), primary_key=True),
+        sa.Column("category", sa.String(100), primary_key=True),
+        sa.Column("total", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, kind, category in SOURCES:
+        op.execute(_sync_function(table, kind, category))
+        for suffix, event, referencing in TRIGGERS:
+            op.execute(f"""
+                CREATE TRIGGER {table}_rollup_{suffix}
+                AFTER {event} ON {table}
+                REFERENCING {referencing}
+                FOR EACH STATEMENT EXECUTE FUNCTION {table}_rollup_sync()
+            """)
+        op.execute(_upsert(kind, _deltas(table, category, "")))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table, _, _ in SOURCES:
+            for suffix, _, _ in TRIGGERS:
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_rollup_{suffix} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {table}_rollup_sync()")
+    op.drop_table("monthly_rollups")
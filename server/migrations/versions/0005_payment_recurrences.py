@@ -0,0 +1,69 @@
+"""payment recurrences
+
+Recurrence rules for scheduled payments, plus a link from each materialized
+occurrence back to its rule. The unique (recurrence_id, scheduled_date)
+index lets the materializer insert with ON CONFLICT DO NOTHING.
+
+Revision ID: 0005_payment_recurrences
+Revises: 0004_monthly_rollups
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_payment_recurrences"
+down_revision = "0004_monthly_rollups"
+branch_labels = None
+depends_on = None
+
+FREQUENCY = sa.Enum("daily", "weekly", "monthly", "yearly", name="recurrencefrequency")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payment_recurrences",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(255)),
+        sa.Column("frequency", FREQUENCY, nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("starts_at", sa.DateTime(), nullable=False),
+        sa.Column("until", sa.DateTime(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=True),
+        sa.Column("next_index", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_occurrence_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_payment_recurrences_user_id", "payment_recurrences", ["user_id"])
+    op.create_index(
+        "ix_payment_recurrences_next_occurrence_at",
+        "payment_recurrences",
+        ["next_occurrence_at"],
+        postgresql_where=sa.text("next_occurrence_at IS NOT NULL"),
+    )
+
+    # Batch mode: SQLite can't add a column with a foreign key in place
+    with op.batch_alter_table("scheduled_payments") as batch:
+        batch.add_column(sa.Column("recurrence_id", sa.Integer(), nullable=True))
+        batch.create_foreign_key(
+            "scheduled_payments_recurrence_id_fkey",
+            "payment_recurrences",
+            ["recurrence_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+    op.create_index(
+        "ux_scheduled_payments_recurrence_occurrence",
+        "scheduled_payments",
+        ["recurrence_id", "scheduled_date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_scheduled_payments_recurrence_occurrence", table_name="scheduled_payments")
+    with op.batch_alter_table("scheduled_payments") as batch:
+        batch.drop_column("recurrence_id")
+    op.drop_table("payment_recurrences")
+    FREQUENCY.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""engagement reminders
+
+Notification outbox with a unique dedupe key, a reminded_at marker on
+engagements, and a partial index over open, not-yet-reminded deadlines for
+the reminder sweep.
+
+Revision ID: 0006_engagement_reminders
+Revises: 0005_payment_recurrences
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_engagement_reminders"
+down_revision = "0005_payment_recurrences"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("user_engagements", sa.Column("reminded_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_user_engagements_open_deadlines",
+        "user_engagements",
+        ["critical_date", "id"],
+        postgresql_where=sa.text("is_done = false AND reminded_at IS NULL AND critical_date IS NOT NULL"),
+        postgresql_include=["snoozed_until"],
+    )
+
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("type", sa.String(20), nullable=False, server_default="default"),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("message", sa.String(1000), nullable=False, server_default=""),
+        sa.Column("dedupe_key", sa.String(200), nullable=False, unique=True),
+        sa.Column(
+            "engagement_id",
+            sa.Integer(),
+            sa.ForeignKey("user_engagements.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("read_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_notifications_user_id_created_at", "notifications", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("notifications")
+    op.drop_index("ix_user_engagements_open_deadlines", table_name="user_engagements")
+    op.drop_column("user_engagements", "reminded_at")
@@ -0,0 +1,89 @@
+"""section search
+
+Full-text search over module sections: a generated, GIN-indexed tsvector
+column on `sections` (title weighted A, tags C, content B), a `section_tags`
+table holding each section's tags lower-cased and trimmed, maintained by a
+row trigger that only fires when `tags` actually changes, and an index on
+`sections.region` for region filtering. Existing tags are backfilled here.
+
+Revision ID: 0007_section_search
+Revises: 0006_engagement_reminders
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_section_search"
+down_revision = "0006_engagement_reminders"
+branch_labels = None
+depends_on = None
+
+# Must match SEARCH_CONFIG in app/services/section_search.py
+SEARCH_CONFIG = "english"
+
+# Normalized, de-duplicated tags of a comma-separated `tags` value
+TAG_ROWS = """
+    SELECT DISTINCT left(lower(btrim(t)), 100) AS tag
+    FROM unnest(string_to_array({tags}, ',')) AS t
+    WHERE btrim(t) <> ''
+"""
+
+
+def upgrade() -> None:
+    op.create_index("ix_sections_region", "sections", ["region"])
+    op.create_table(
+        "section_tags",
+        sa.Column("tag", sa.String(100), primary_key=True),
+        sa.Column("section_id", sa.Integer(), sa.ForeignKey("sections.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index("ix_section_tags_section_id", "section_tags", ["section_id"])
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(f"""
+        ALTER TABLE sections ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', replace(coalesce(tags, ''), ',', ' ')), 'C') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'B')
+        ) STORED
+    """)
+    op.execute("CREATE INDEX ix_sections_search_vector ON sections USING gin (search_vector)")
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION sections_tags_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM section_tags WHERE section_id = NEW.id;
+        END IF;
+        INSERT INTO section_tags (tag, section_id)
+        SELECT tag, NEW.id FROM ({TAG_ROWS.format(tags="NEW.tags")}) t;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER sections_tags_insert
+        AFTER INSERT ON sections
+        FOR EACH ROW EXECUTE FUNCTION sections_tags_sync()
+    """)
+    op.execute("""
+        CREATE TRIGGER sections_tags_update
+        AFTER UPDATE OF tags ON sections
+        FOR EACH ROW WHEN (OLD.tags IS DISTINCT FROM NEW.tags)
+        EXECUTE FUNCTION sections_tags_sync()
+    """)
+    op.execute(f"""
+        INSERT INTO section_tags (tag, section_id)
+        SELECT t.tag, s.id FROM sections s, LATERAL ({TAG_ROWS.format(tags="s.tags")}) t
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS sections_tags_update ON sections")
+        op.execute("DROP TRIGGER IF EXISTS sections_tags_insert ON sections")
+        op.execute("DROP FUNCTION IF EXISTS sections_tags_sync()")
+        op.execute("DROP INDEX IF EXISTS ix_sections_search_vector")
+        op.execute("ALTER TABLE sections DROP COLUMN IF EXISTS search_vector")
+    op.drop_table("section_tags")
+    op.drop_index("ix_sections_region", table_name="sections")
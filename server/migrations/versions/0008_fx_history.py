@@ -0,0 +1,36 @@
+"""fx history and transaction currencies
+
+Daily exchange-rate history keyed (base, quote, date), so the rate in force
+on a day is one backward index probe, and an ISO 4217 currency on expenses
+and income. Existing rows are USD, the currency the app assumed so far; the
+constant default makes the new columns metadata-only on Postgres 11+.
+
+Revision ID: 0008_fx_history
+Revises: 0007_section_search
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_fx_history"
+down_revision = "0007_section_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fx_rates",
+        sa.Column("base", sa.String(3), primary_key=True),
+        sa.Column("quote", sa.String(3), primary_key=True),
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column("rate", sa.Float(), nullable=False),
+    )
+    for table in ("expenses", "income"):
+        op.add_column(table, sa.Column("currency", sa.String(3), nullable=False, server_default="USD"))
+
+
+def downgrade() -> None:
+    for table in ("expenses", "income"):
+        op.drop_column(table, "currency")
+    op.drop_table("fx_rates")
@@ -0,0 +1,51 @@
+"""currency trace series
+
+Traced pairs become one row per (user, base, quote) on currency_tracing,
+with a last_traced_at the sampler uses to pick active pairs. fx_rate_points
+holds the sampled series in raw, hourly and daily OHLC tiers, keyed so a
+range read for one pair and tier is a single index range scan, plus a
+(resolution, bucket_start) index for compaction and retention.
+
+Revision ID: 0009_currency_trace_series
+Revises: 0008_fx_history
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_currency_trace_series"
+down_revision = "0008_fx_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("currency_tracing", sa.Column("base", sa.String(3), nullable=True))
+    op.add_column("currency_tracing", sa.Column("quote", sa.String(3), nullable=True))
+    op.add_column("currency_tracing", sa.Column("last_traced_at", sa.DateTime(), nullable=True))
+    op.create_index("ux_currency_tracing_user_pair", "currency_tracing", ["user_id", "base", "quote"], unique=True)
+    op.create_index("ix_currency_tracing_last_traced_at", "currency_tracing", ["last_traced_at"])
+
+    op.create_table(
+        "fx_rate_points",
+        sa.Column("base", sa.String(3), primary_key=True),
+        sa.Column("quote", sa.String(3), primary_key=True),
+        sa.Column("resolution", sa.String(4), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("open", sa.Float(), nullable=False),
+        sa.Column("high", sa.Float(), nullable=False),
+        sa.Column("low", sa.Float(), nullable=False),
+        sa.Column("close", sa.Float(), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False, server_default="1"),
+    )
+    # Compaction windows and retention sweep one tier across all pairs
+    op.create_index("ix_fx_rate_points_resolution_bucket", "fx_rate_points", ["resolution", "bucket_start"])
+
+
+def downgrade() -> None:
+    op.drop_table("fx_rate_points")
+    op.drop_index("ix_currency_tracing_last_traced_at", table_name="currency_tracing")
+    op.drop_index("ux_currency_tracing_user_pair", table_name="currency_tracing")
+    op.drop_column("currency_tracing", "last_traced_at")
+    op.drop_column("currency_tracing", "quote")
+    op.drop_column("currency_tracing", "base")
@@ -0,0 +1,102 @@
+"""rollup currency
+
+Monthly rollups gain currency as a key column, so /summary reports totals
+per currency instead of adding USD and KES amounts together. The rollup is
+derived data: the table is recreated with the wider key, the trigger
+functions from 0004 are replaced with currency-aware ones (the triggers
+themselves keep calling them by name), and the rollup is rebuilt from the
+source tables under the same lock RollupService.rebuild takes.
+
+Revision ID: 0010_rollup_currency
+Revises: 0009_currency_trace_series
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_rollup_currency"
+down_revision = "0009_currency_trace_series"
+branch_labels = None
+depends_on = None
+
+# (source table, rollup kind, category expression); as in 0004
+SOURCES = [
+    ("expenses", "expense", "category"),
+    ("income", "income", "''"),
+]
+
+
+def _deltas(rows: str, category: str, sign: str, currency: bool) -> str:
+    return f"""
+        SELECT user_id, date_trunc('month', date)::date AS month, {category} AS category,
+               {"currency," if currency else ""} {sign}amount AS amount, {sign}1 AS n
+        FROM {rows}
+        WHERE date IS NOT NULL
+    """
+
+
+def _upsert(kind: str, deltas: str, currency: bool) -> str:
+    # Fixed ORDER BY so concurrent statements lock rollup rows in the same order
+    bucket = "currency, category" if currency else "category"
+    return f"""
+        INSERT INTO monthly_rollups AS r (user_id, month, kind, {bucket}, total, count)
+        SELECT user_id, month, '{kind}', {bucket}, sum(amount), sum(n)
+        FROM ({deltas}) d
+        GROUP BY user_id, month, {bucket}
+        HAVING sum(n) <> 0 OR sum(amount) <> 0
+        ORDER BY user_id, month, {bucket}
+        ON CONFLICT (user_id, month, kind, {bucket})
+        DO UPDATE SET total = r.total + EXCLUDED.total, count = r.count + EXCLUDED.count;
+    """
+
+
+def _sync_function(table: str, kind: str, category: str, currency: bool) -> str:
+    inserted = _deltas("new_rows", category, "", currency)
+    deleted = _deltas("old_rows", category, "-", currency)
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_rollup_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {_upsert(kind, inserted, currency)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {_upsert(kind, deleted, currency)}
+        ELSE
+            {_upsert(kind, inserted + " UNION ALL " + deleted, currency)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def _recreate(currency: bool) -> None:
+    op.drop_table("monthly_rollups")
+    columns = [
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("kind", sa.String(10), primary_key=True),
+    ]
+    if currency:
+        columns.append(sa.Column("currency", sa.String(3), primary_key=True))
+    columns += [
+        sa.Column("category", sa.String(100), primary_key=True),
+        sa.Column("total", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    ]
+    op.create_table("monthly_rollups", *columns)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Writes to the sources wait until the new functions and backfill commit
+    op.execute("LOCK TABLE expenses, income IN SHARE MODE")
+    for table, kind, category in SOURCES:
+        op.execute(_sync_function(table, kind, category, currency))
+        op.execute(_upsert(kind, _deltas(table, category, "", currency), currency))
+
+
+def upgrade() -> None:
+    _recreate(currency=True)
+
+
+def downgrade() -> None:
+    _recreate(currency=False)
@@ -0,0 +1,195 @@
+"""
+Query-plan check: exits non-zero if a hot-path route query is planned as a
+sequential scan.
+
+Seeds synthetic users and per-user rows inside a transaction, ANALYZEs, runs
+EXPLAIN on the same query shapes the routes issue, then rolls everything
+back. Run it against a migrated Postgres database:
+
+    cd server && alembic upgrade head && python -m scripts.check_query_plans
+"""
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import false, select, text
+
+from app.db.session import engine
+from app.models import (
+    BankAccount,
+    CurrencyTrace,
+    Expense,
+    Income,
+    MonthlyRollup,
+    Payment,
+    ScheduledPayment,
+    SupportTicket,
+    UserDocument,
+    UserEngagement,
+)
+from app.models.payments import PaymentStatus
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, username, hashed_password, education, nationality,
+                       is_active, is_verified, is_superuser, created_at, updated_at)
+    SELECT 'plan' || g || '@check.local', 'plan_check_' || g, 'x', 'n/a', 'n/a',
+           true, true, false, now(), now()
+    FROM generate_series(1, :users) g
+    """,
+    """
+    CREATE TEMP TABLE plan_users ON COMMIT DROP AS
+    SELECT id FROM users WHERE username LIKE 'plan_check_%'
+    """,
+    """
+    INSERT INTO expenses (user_id, category, amount, description, date)
+    SELECT u.id, 'food', 10, '', now() - (g || ' hours')::interval
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO income (user_id, amount, description, date)
+    SELECT u.id, 100, '', now() - (g || ' hours')::interval
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO user_documents (user_id, document_type, file_name, file_path, tags, uploaded_at)
+    SELECT u.id, 'passport', 'f', 'p', '', now() - (g || ' hours')::interval
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO bank_accounts (user_id, name, type, account_number, balance, last_sync)
+    SELECT u.id, 'acct', 'checking', '0000', 0, now()
+    FROM plan_users u, generate_series(1, 3) g
+    """,
+    """
+    INSERT INTO currency_tracing (user_id, title, description, status, date, created_at)
+    SELECT u.id, 't', 'd', 'traced', '2025-01-01', now() - (g || ' hours')::interval
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO user_engagements (user_id, module_name, action, timestamp, critical_date, is_done)
+    SELECT u.id, 'm', 'viewed', now(), now() + (g || ' days')::interval, false
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO scheduled_payments (user_id, amount, description, scheduled_date, status)
+    SELECT u.id, 50, '', now() + (g || ' days')::interval,
+           (CASE WHEN g % 20 = 0 THEN 'pending' ELSE 'done' END)::paymentstatus
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO support_tickets (user_id, subject, description, status, created_on, last_updated)
+    SELECT u.id, 's', 'd', CASE WHEN g % 20 = 0 THEN 'Open' ELSE 'Closed' END,
+           now() - (g || ' hours')::interval, now()
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO payments (user_id, amount, currency, status, refunded, created_at)
+    SELECT u.id, 9.99, 'USD', 'completed', g % 50 = 0, now() - (g || ' hours')::interval
+    FROM plan_users u, generate_series(1, :rows) g
+    """,
+]
+
+
+def route_queries(user_id: int):
+    """(label, statement) pairs mirroring what the routes send to the database."""
+    now = datetime.utcnow()
+    return [
+        ("GET /expenses", select(Expense).where(Expense.user_id == user_id).order_by(Expense.date.desc())),
+        ("GET /income", select(Income).where(Income.user_id == user_id).order_by(Income.date.desc())),
+        (
+            "GET /documents",
+            select(UserDocument).where(UserDocument.user_id == user_id).order_by(UserDocument.uploaded_at.desc()),
+        ),
+        (
+            "GET /summary",
+            select(MonthlyRollup).where(
+                MonthlyRollup.user_id == user_id,
+                MonthlyRollup.month >= (now - timedelta(days=365)).date(),
+            ),
+        ),
+        ("GET /bank-accounts", select(BankAccount).where(BankAccount.user_id == user_id)),
+        (
+            "GET /currency-tracing",
+            select(CurrencyTrace).where(CurrencyTrace.user_id == user_id).order_by(CurrencyTrace.created_at.desc()),
+        ),
+        ("GET /engagements", select(UserEngagement).where(UserEngagement.user_id == user_id)),
+        (
+            "engagement reminder sweep",
+            select(UserEngagement.id)
+            .where(
+                UserEngagement.is_done == false(),
+                UserEngagement.reminded_at.is_(None),
+                UserEngagement.critical_date.is_not(None),
+                UserEngagement.critical_date >= now - timedelta(days=7),
+                UserEngagement.critical_date <= now + timedelta(hours=72),
+            )
+            .order_by(UserEngagement.critical_date, UserEngagement.id),
+        ),
+        (
+            "GET /payments",
+            select(ScheduledPayment)
+            .where(ScheduledPayment.user_id == user_id)
+            .order_by(ScheduledPayment.scheduled_date),
+        ),
+        (
+            "scheduled payments falling due",
+            select(ScheduledPayment.id).where(
+                ScheduledPayment.status == PaymentStatus.pending,
+                ScheduledPayment.scheduled_date < now,
+            ),
+        ),
+        (
+            "GET /support-tickets",
+            select(SupportTicket).where(SupportTicket.user_id == user_id).order_by(SupportTicket.created_on.desc()),
+        ),
+        (
+            "admin open tickets",
+            select(SupportTicket).where(SupportTicket.status == "Open").order_by(SupportTicket.created_on.desc()),
+        ),
+        ("user payments", select(Payment).where(Payment.user_id == user_id).order_by(Payment.created_at.desc())),
+    ]
+
+
+def seq_scans(plan: dict) -> list:
+    """Relations read by a Seq Scan anywhere in the plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=50, help="rows per user in each table")
+    args = parser.parse_args()
+
+    failures = 0
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            for sql in SEED_SQL:
+                conn.execute(text(sql), {"users": args.users, "rows": args.rows})
+            conn.execute(text("ANALYZE"))
+            user_id = conn.execute(text("SELECT min(id) FROM plan_users")).scalar_one()
+
+            for label, stmt in route_queries(user_id):
+                sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+                plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar_one()[0]["Plan"]
+                scanned = seq_scans(plan)
+                if scanned:
+                    failures += 1
+                    print(f"FAIL  {label}: seq scan on {', '.join(scanned)}")
+                else:
+                    print(f"ok    {label}: {plan['Node Type']}")
+        finally:
+            trans.rollback()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Rebuild the monthly expense/income rollups from the source tables.
+
+The rollup is maintained incrementally by triggers; run this after restoring
+data, bulk-editing outside the app, or if totals ever look off. Blocks writes
+to expenses and income (not reads) while it runs.
+
+    cd server && python -m scripts.rebuild_rollups            # everyone
+    cd server && python -m scripts.rebuild_rollups --user-id 42
+"""
+import argparse
+import time
+
+from app.db.session import SessionLocal
+from app.services.rollup_service import RollupService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, default=None, help="Only rebuild this user's rollups")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        written = RollupService.rebuild(db, args.user_id)
+        db.commit()
+    scope = f"user {args.user_id}" if args.user_id is not None else "all users"
+    print(f"Rebuilt {written:,} rollup rows for {scope} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
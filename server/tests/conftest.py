@@ -0,0 +1,58 @@
+"""
+Shared fixtures. Tests run against SQLite files (sync and aiosqlite engines
+over the same file) and never need Postgres, Redis or the network.
+"""
+import os
+
+# Settings without defaults; set before anything imports app.core.config
+for name, value in {
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "test",
+    "JWT_SECRET_KEY": "test-secret",
+    "SMTP_USER": "test",
+    "SMTP_PASSWORD": "test",
+    "REDIS_URL": "redis://127.0.0.1:1/0",  # nothing listens here; Redis consumers degrade
+    "ENVIRONMENT": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401  registers every table on Base.metadata
+from app.models.base import Base
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    """A fresh SQLite database with the full schema."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def engine(db_url):
+    engine = create_engine(db_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def async_session_factory(db_url):
+    # NullPool: each test runs its own event loop, so connections must not outlive a session
+    async_engine = create_async_engine(db_url.replace("sqlite://", "sqlite+aiosqlite://", 1), poolclass=NullPool)
+    return async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
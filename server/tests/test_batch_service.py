@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.expenses import Expense
+from app.schemas.expenses import ExpenseBatch, ExpenseBatchUpdate
+from app.api.v1.routes.expenses import EXPENSE_BATCH_FIELDS
+from app.services.batch_service import BatchService
+
+SPENT_AT = datetime(2025, 3, 14, 9, 30)
+
+
+def seed(session_factory, user_id=1):
+    with session_factory() as db:
+        expenses = [
+            Expense(user_id=user_id, category="Misc", amount=12.5, currency="EUR", description="lunch", date=SPENT_AT),
+            Expense(user_id=user_id, category="Misc", amount=40.0, currency="USD", description="books", date=SPENT_AT),
+        ]
+        db.add_all(expenses)
+        db.commit()
+        return [expense.id for expense in expenses]
+
+
+def test_update_single_field_keeps_the_others(session_factory, async_session_factory):
+    first, second = seed(session_factory)
+    batch = ExpenseBatch(update=[ExpenseBatchUpdate(id=first, category="Food")])
+
+    async def run():
+        async with async_session_factory() as db:
+            return await BatchService.apply(db, Expense, 1, batch, EXPENSE_BATCH_FIELDS)
+
+    results = asyncio.run(run())
+
+    assert [(r["id"], r["status"]) for r in results] == [(first, "updated")]
+    with session_factory() as db:
+        rows = {e.id: e for e in db.scalars(select(Expense))}
+    assert (rows[first].category, rows[first].amount, rows[first].currency) == ("Food", 12.5, "EUR")
+    assert (rows[first].description, rows[first].date) == ("lunch", SPENT_AT)
+    assert rows[second].category == "Misc"
+
+
+def test_update_of_another_users_row_is_not_found(session_factory, async_session_factory):
+    (first, _) = seed(session_factory, user_id=2)
+    batch = ExpenseBatch(update=[ExpenseBatchUpdate(id=first, amount=1.0)])
+
+    async def run():
+        async with async_session_factory() as db:
+            return await BatchService.apply(db, Expense, 1, batch, EXPENSE_BATCH_FIELDS)
+
+    assert asyncio.run(run())[0]["status"] == "not_found"
+    with session_factory() as db:
+        assert db.get(Expense, first).amount == 12.5
+
+
+def test_postgres_values_columns_are_cast_to_the_target_types():
+    # A field no operation sets is NULL in every VALUES row, which Postgres types as text
+    ops = [ExpenseBatchUpdate(id=1, category="Food")]
+    stmt = BatchService.update_statement(Expense, 1, ops, EXPENSE_BATCH_FIELDS, "postgresql")
+    sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+
+    assert "coalesce(CAST(changes.amount AS FLOAT), expenses.amount)" in sql
+    assert "coalesce(CAST(changes.date AS TIMESTAMP WITHOUT TIME ZONE), expenses.date)" in sql
+    assert "coalesce(CAST(changes.currency AS VARCHAR(3)), expenses.currency)" in sql
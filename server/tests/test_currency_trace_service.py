@@ -0,0 +1,124 @@
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services import currency_trace_service
+from app.services.currency_trace_service import (
+    HISTORY_MAX_POINTS,
+    TIER_MAX_SPAN,
+    CurrencyTraceService,
+    covers,
+    pick_resolution,
+    sample_traced_pairs,
+)
+from app.services.fx_service import FakeRateProvider, FxRateService, RateTable
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+@pytest.mark.parametrize("resolution", ["raw", "hour"])
+def test_fine_resolution_does_not_cover_a_wider_range(resolution):
+    span = TIER_MAX_SPAN[resolution]
+
+    assert covers(resolution, NOW - span, NOW)
+    assert not covers(resolution, NOW - span - timedelta(minutes=1), NOW)
+
+
+def test_day_resolution_covers_any_range():
+    assert covers("day", NOW - timedelta(days=3650), NOW)
+
+
+def test_tier_spans_fit_the_point_limit():
+    assert TIER_MAX_SPAN["raw"] / timedelta(minutes=1) <= HISTORY_MAX_POINTS
+    assert TIER_MAX_SPAN["hour"] / timedelta(hours=1) <= HISTORY_MAX_POINTS
+
+
+def test_picked_resolution_always_covers_the_range():
+    for days in (1, 2, 3, 60, 61, 400):
+        start = NOW - timedelta(days=days)
+        assert covers(pick_resolution(start, NOW, NOW), start, NOW)
+
+
+class FakeDb:
+    """Answers the first query with `rows` and keeps every later statement."""
+
+    def __init__(self, rows=(), rowcount=0):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows, self.rows = self.rows, []
+        return type("Result", (), {"all": lambda self: rows, "rowcount": self.rowcount})()
+
+    async def scalars(self, stmt):
+        return await self.execute(stmt)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _table(fetched_on, age=0.0):
+    return RateTable({"USD": 1.0, "EUR": 0.92, "KES": 129.0}, time.monotonic() - age, fetched_on)
+
+
+def test_sample_stamps_points_with_the_table_fetch_time():
+    db = FakeDb(rows=[("EUR", "KES"), ("USD", "EUR"), ("USD", "XXX")], rowcount=2)
+    fetched_on = datetime(2026, 10, 17, 11, 58, 30, 123456)
+
+    sampled = asyncio.run(CurrencyTraceService.sample(db, _table(fetched_on), NOW))
+
+    insert = db.statements[-1].compile().params
+    assert sampled == 2
+    assert {value for key, value in insert.items() if key.startswith("bucket_start")} == {fetched_on.replace(microsecond=0)}
+    assert round(129.0 / 0.92, 6) in insert.values()
+
+
+def test_sampler_skips_a_table_it_already_sampled(monkeypatch):
+    service = FxRateService(FakeRateProvider(), pivot="USD", ttl=300, stale=3600)
+    service._table = _table(datetime(2026, 10, 17, 11, 58))
+    calls = []
+
+    async def sample(db, table, now):
+        calls.append(table.fetched_on)
+        return 1
+
+    monkeypatch.setattr(currency_trace_service, "fx_rates", service)
+    monkeypatch.setattr(currency_trace_service, "AsyncSessionLocal", lambda: contextlib.nullcontext(FakeDb()))
+    monkeypatch.setattr(currency_trace_service, "_last_sampled_on", None)
+    monkeypatch.setattr(CurrencyTraceService, "sample", staticmethod(sample))
+
+    async def ticks():
+        first, again = await sample_traced_pairs(), await sample_traced_pairs()
+        service._table = _table(datetime(2026, 10, 17, 12, 3))
+        return first, again, await sample_traced_pairs()
+
+    assert asyncio.run(ticks()) == ("1 pair(s) sampled", None, "1 pair(s) sampled")
+    assert calls == [datetime(2026, 10, 17, 11, 58), datetime(2026, 10, 17, 12, 3)]
+
+
+def test_reading_recently_touched_pairs_does_not_write():
+    record = {"title": "USD to EUR", "description": "Current rate: 0.92", "status": "traced", "date": NOW}
+    db = FakeDb(rows=["EUR", "KES"])
+
+    written = asyncio.run(CurrencyTraceService.record(db, 1, "USD", {"EUR": record, "KES": record}, NOW))
+
+    assert written == 0
+    assert len(db.statements) == 1  # only the freshness check
+    assert db.commits == 0
+
+
+def test_stale_and_new_pairs_are_written():
+    record = {"title": "USD to EUR", "description": "Current rate: 0.92", "status": "traced", "date": NOW}
+    db = FakeDb(rows=["EUR"])
+
+    written = asyncio.run(CurrencyTraceService.record(db, 1, "USD", {"EUR": record, "KES": record}, NOW))
+
+    assert written == 1
+    assert "KES" in db.statements[-1].compile().params.values()
+    assert db.commits == 1
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from datetime import date, datetime
+
+from app.services import fx_history
+from app.services.fx_service import FakeRateProvider, FxRateService, RateTable
+
+
+class NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _run_job(monkeypatch, table):
+    service = FxRateService(FakeRateProvider(), pivot="USD", ttl=300, stale=3600)
+    service._table = table
+    recorded = []
+
+    async def record(db, pivot, table, day):
+        recorded.append(day)
+        return len(table.rates) - 1
+
+    monkeypatch.setattr(fx_history, "fx_rates", service)
+    monkeypatch.setattr(fx_history, "AsyncSessionLocal", NullSession)
+    monkeypatch.setattr(fx_history.FxHistoryService, "record", staticmethod(record))
+    return asyncio.run(fx_history.record_fx_history()), recorded
+
+
+def test_rates_are_recorded_under_the_day_they_were_fetched(monkeypatch):
+    table = RateTable({"USD": 1.0, "EUR": 0.92}, time.monotonic(), datetime(2026, 10, 16, 23, 59))
+
+    result, recorded = _run_job(monkeypatch, table)
+
+    assert recorded == [date(2026, 10, 16)]
+    assert result == "1 rate(s) recorded for 2026-10-16"
+
+
+def test_expired_fallback_table_is_not_recorded(monkeypatch):
+    table = RateTable({"USD": 1.0, "EUR": 0.92}, time.monotonic() - 3900, datetime(2026, 10, 16, 12, 0))
+    async def down(self, base):
+        raise RuntimeError("down")
+
+    # The refresh the job triggers fails, so the old table comes back as the fallback
+    monkeypatch.setattr(FakeRateProvider, "fetch", down)
+
+    result, recorded = _run_job(monkeypatch, table)
+
+    assert result is None
+    assert recorded == []
+
+
+class FakeDb:
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+    async def execute(self, stmt):
+        return type("Result", (), {"rowcount": self.rowcount})()
+
+    async def commit(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.bumps = 0
+
+    async def incr(self, key):
+        self.bumps += 1
+
+
+def test_history_version_is_bumped_only_when_rates_change(monkeypatch):
+    table = RateTable({"USD": 1.0, "EUR": 0.92, "KES": 129.0}, time.monotonic(), datetime(2026, 10, 16))
+    redis = FakeRedis()
+    monkeypatch.setattr(fx_history, "get_redis", lambda: redis)
+    record = fx_history.FxHistoryService.record
+
+    unchanged = asyncio.run(record(FakeDb(rowcount=0), "USD", table, date(2026, 10, 16)))
+    assert (unchanged, redis.bumps) == (0, 0)
+
+    changed = asyncio.run(record(FakeDb(rowcount=1), "USD", table, date(2026, 10, 16)))
+    assert (changed, redis.bumps) == (1, 1)
@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import fx_service
+from app.services.fx_service import ExchangeRateHostProvider, FakeRateProvider, FxRateService, FxUnavailable
+
+
+class FlakyProvider(FakeRateProvider):
+    """Answers the first `succeed` calls, then raises like a broken upstream client."""
+
+    def __init__(self, succeed: int, error: Exception, **kwargs):
+        super().__init__(**kwargs)
+        self.succeed = succeed
+        self.error = error
+
+    async def fetch(self, base):
+        if self.calls >= self.succeed:
+            self.calls += 1
+            raise self.error
+        return await super().fetch(base)
+
+
+def test_concurrent_callers_share_one_upstream_call():
+    provider = FakeRateProvider(latency=0.05)
+    service = FxRateService(provider, pivot="USD", ttl=300, stale=3600)
+
+    async def burst():
+        return await asyncio.gather(*(service.rates("EUR", ["KES", "GBP"]) for _ in range(1000)))
+
+    results = asyncio.run(burst())
+
+    assert provider.calls == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_stale_table_is_served_while_one_refresh_runs():
+    provider = FakeRateProvider(latency=0.2)
+    service = FxRateService(provider, pivot="USD", ttl=0.05, stale=60)
+
+    async def run():
+        first = await service.table()
+        await asyncio.sleep(0.06)
+        start = time.perf_counter()
+        stale = await asyncio.gather(*(service.table() for _ in range(50)))
+        waited = time.perf_counter() - start
+        await asyncio.sleep(0.3)  # let the background refresh land
+        return first, stale, waited, service._table
+
+    first, stale, waited, refreshed = asyncio.run(run())
+
+    assert all(table is first for table in stale)
+    assert waited < 0.1  # nobody waited for the upstream
+    assert provider.calls == 2
+    assert refreshed is not first
+
+
+def test_any_base_is_derived_from_the_pivot_table():
+    provider = FakeRateProvider()
+    service = FxRateService(provider, pivot="USD", ttl=300, stale=3600)
+
+    async def run():
+        return await service.rates("EUR", ["KES", "EUR", "XXX"]), await service.rates("XXX", ["USD"])
+
+    eur, unknown_base = asyncio.run(run())
+
+    assert eur == {"KES": round(129.0 / 0.92, 6), "EUR": 1.0, "XXX": None}
+    assert unknown_base == {"USD": None}
+    assert provider.calls == 1
+
+
+@pytest.mark.parametrize("error", [RuntimeError("client bug"), httpx.ConnectError("refused"), KeyError("rates")])
+def test_upstream_failure_falls_back_to_the_last_table(error):
+    provider = FlakyProvider(succeed=1, error=error)
+    service = FxRateService(provider, pivot="USD", ttl=0, stale=0)
+
+    async def run():
+        first = await service.table()
+        return first, await service.table()
+
+    first, fallback = asyncio.run(run())
+
+    assert fallback is first
+    assert provider.calls == 2
+
+
+def test_upstream_failure_without_a_table_is_fx_unavailable():
+    service = FxRateService(FlakyProvider(succeed=0, error=RuntimeError("down")), pivot="USD", ttl=300, stale=3600)
+
+    with pytest.raises(FxUnavailable):
+        asyncio.run(service.table())
+
+
+@pytest.mark.parametrize("body", [[1, 2], "rates", {"rates": None}, {"error": "quota"}])
+def test_malformed_provider_body_is_fx_unavailable(monkeypatch, body):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    monkeypatch.setattr(fx_service, "get_http_client", lambda: httpx.AsyncClient(transport=transport))
+    provider = ExchangeRateHostProvider("https://rates.test/latest")
+
+    with pytest.raises(FxUnavailable):
+        asyncio.run(provider.fetch("USD"))
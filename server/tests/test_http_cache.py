@@ -0,0 +1,40 @@
+import socket
+import time
+
+import redis
+
+from app.core import http_cache
+from app.core.config import settings
+from app.core.http_cache import VersionCounter
+
+
+def test_version_client_has_a_short_socket_timeout():
+    kwargs = http_cache._version_client.connection_pool.connection_kwargs
+
+    assert kwargs["socket_timeout"] == settings.HTTP_CACHE_REDIS_TIMEOUT_MS / 1000
+    assert kwargs["socket_connect_timeout"] == settings.HTTP_CACHE_REDIS_TIMEOUT_MS / 1000
+
+
+def test_hung_redis_falls_back_instead_of_blocking(monkeypatch):
+    # Accepts connections but never answers, like a Redis stuck on a slow command
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    host, port = server.getsockname()
+    monkeypatch.setattr(http_cache, "_version_client", redis.Redis(
+        host=host,
+        port=port,
+        socket_timeout=http_cache._version_client.connection_pool.connection_kwargs["socket_timeout"],
+        decode_responses=True,
+    ))
+    counter = VersionCounter("http_cache:test:version")
+
+    try:
+        start = time.perf_counter()
+        assert counter.current() is None
+        counter.bump()  # logs and carries on
+        elapsed = time.perf_counter() - start
+    finally:
+        server.close()
+
+    assert elapsed < 1.0
@@ -0,0 +1,108 @@
+import io
+
+from sqlalchemy import select
+
+from app.models.expenses import Expense
+from app.services.import_service import _ExecutemanyLoader, parse_csv, parse_ofx, validate
+
+
+def validated(rows, currency="USD"):
+    results = [validate(row, currency) for _, row in rows]
+    expenses = [expense for expense, _ in results if expense]
+    skipped = sum(1 for expense, error in results if expense is None and error is None)
+    return expenses, skipped
+
+
+def test_signed_csv_skips_credits():
+    statement = (
+        "Date,Description,Amount\n"
+        "2025-03-01,Groceries,-42.10\n"
+        "2025-03-02,Salary,2500.00\n"
+        "2025-03-03,Refund,(5.00)\n"
+        "2025-03-04,Deposit,+10\n"
+    )
+    expenses, skipped = validated(parse_csv(io.BytesIO(statement.encode())))
+
+    assert [(e.description, e.amount) for e in expenses] == [("Groceries", 42.10), ("Refund", 5.0)]
+    assert skipped == 2
+
+
+def test_debit_column_is_unsigned_and_blank_cells_are_credits():
+    statement = (
+        "Posted Date,Payee,Debit,Credit\n"
+        "03/01/2025,Rent,1200.00,\n"
+        "03/02/2025,Salary,,2500.00\n"
+    )
+    expenses, skipped = validated(parse_csv(io.BytesIO(statement.encode())))
+
+    assert [(e.description, e.amount) for e in expenses] == [("Rent", 1200.0)]
+    assert skipped == 1
+
+
+def test_currency_from_column_then_default():
+    statement = (
+        "Date,Description,Amount,Currency\n"
+        "2025-03-01,Matatu,-150,kes\n"
+        "2025-03-02,Coffee,-3.50,\n"
+    )
+    expenses, _ = validated(parse_csv(io.BytesIO(statement.encode())), currency="EUR")
+
+    assert [e.currency for e in expenses] == ["KES", "EUR"]
+
+
+def test_ofx_currency_from_curdef():
+    statement = (
+        "<OFX><STMTRS><CURDEF>GBP<BANKTRANLIST>"
+        "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250301<TRNAMT>-12.00<NAME>Tube</STMTTRN>"
+        "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250302<TRNAMT>-30.00<NAME>Hotel"
+        "<CURRENCY><CURRATE>1.17<CURSYM>EUR</CURRENCY></STMTTRN>"
+        "<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250303<TRNAMT>100.00<NAME>Pay</STMTTRN>"
+        "</BANKTRANLIST></STMTRS></OFX>"
+    )
+    expenses, skipped = validated(parse_ofx(io.BytesIO(statement.encode()), chunk_size=16))
+
+    assert [(e.description, e.currency) for e in expenses] == [("Tube", "GBP"), ("Hotel", "EUR")]
+    assert skipped == 1
+
+
+def test_executemany_loader_inserts_currency_and_dedupes_per_currency(session_factory):
+    statement = (
+        "Date,Description,Amount,Currency\n"
+        "2025-03-01,Transfer,-100,KES\n"
+        "2025-03-01,Transfer,-100,USD\n"
+    )
+    expenses, _ = validated(parse_csv(io.BytesIO(statement.encode())))
+
+    with session_factory() as db:
+        _ExecutemanyLoader(db, user_id=1).add(expenses[:1])
+        db.commit()
+
+        loader = _ExecutemanyLoader(db, user_id=1)
+        loader.add(expenses)
+        db.commit()
+        assert loader.finish() == (1, 1)
+        assert sorted(db.scalars(select(Expense.currency))) == ["KES", "USD"]
+
+
+def test_executemany_loader_only_dedupes_rows_from_before_the_import(session_factory):
+    statement = (
+        "Date,Description,Amount\n"
+        "2025-03-01,Coffee,-3.50\n"
+        "2025-03-01,Coffee,-3.50\n"
+        "2025-03-02,Rent,-1200\n"
+    )
+    expenses, _ = validated(parse_csv(io.BytesIO(statement.encode())))
+    coffee, _, rent = expenses
+
+    with session_factory() as db:
+        _ExecutemanyLoader(db, user_id=1).add([rent])
+        db.commit()
+
+        loader = _ExecutemanyLoader(db, user_id=1)
+        loader.add(expenses)  # coffee twice within the batch, rent already present
+        loader.add([coffee, rent])  # coffee again in a later batch
+        db.commit()
+
+        assert loader.finish() == (3, 2)
+        descriptions = sorted(db.scalars(select(Expense.description)))
+        assert descriptions == ["Coffee", "Coffee", "Coffee", "Rent"]
@@ -0,0 +1,28 @@
+from alembic.config import Config
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+
+config = Config("alembic.ini")
+script = ScriptDirectory.from_config(config)
+
+
+def migrate(engine, step):
+    # migrations/env.py always targets settings.DATABASE_URL, so drive the scripts directly
+    with engine.begin() as conn, EnvironmentContext(config, script, fn=step) as env:
+        env.configure(connection=conn)
+        with env.begin_transaction():
+            env.run_migrations()
+
+
+def test_chain_upgrades_and_downgrades_on_sqlite():
+    engine = create_engine("sqlite://")
+
+    migrate(engine, lambda rev, ctx: script._upgrade_revs("head", rev))
+    foreign_keys = inspect(engine).get_foreign_keys("scheduled_payments")
+    assert {"recurrence_id": "payment_recurrences"}.items() <= {
+        fk["constrained_columns"][0]: fk["referred_table"] for fk in foreign_keys
+    }.items()
+
+    migrate(engine, lambda rev, ctx: script._downgrade_revs("base", rev))
+    assert inspect(engine).get_table_names() == ["alembic_version"]
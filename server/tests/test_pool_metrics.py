@@ -0,0 +1,21 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.core.metrics import metrics
+from app.db.pool_metrics import instrument_engine
+
+
+def test_failed_statements_leave_no_timing_behind():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_failures")
+    query_ms = metrics.histogram("db.test_failures.query_ms")
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+        assert "query_started_at" not in conn.info
+    assert query_ms.snapshot()["count"] == 2
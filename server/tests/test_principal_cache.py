@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from app.core import principal_cache as module
+from app.core.principal_cache import Principal, PrincipalCache
+
+PRINCIPAL = Principal(id=7, email="a@b.c", username="a", full_name=None,
+                      is_active=True, is_verified=True, is_superuser=False)
+
+
+class StalledRedis:
+    """Accepts commands and never answers, like a Redis behind a dropped connection."""
+
+    async def get(self, key):
+        await asyncio.sleep(5)
+
+    async def setex(self, key, ttl, value):
+        await asyncio.sleep(5)
+
+
+def test_unresponsive_redis_is_a_fast_miss(monkeypatch):
+    monkeypatch.setattr(module, "get_redis", StalledRedis)
+    cache = PrincipalCache(max_entries=10, local_ttl=15, redis_ttl=300, redis_timeout=0.05)
+
+    timeouts = cache.redis_timeouts.value  # metrics are process-wide
+
+    async def run():
+        start = time.perf_counter()
+        missed = await cache.aget(PRINCIPAL.id)
+        await cache.aset(PRINCIPAL)
+        return missed, time.perf_counter() - start
+
+    missed, elapsed = asyncio.run(run())
+
+    assert missed is None
+    assert elapsed < 1
+    assert cache.redis_timeouts.value - timeouts == 2
+    # The local tier still works without Redis
+    assert asyncio.run(cache.aget(PRINCIPAL.id)) == PRINCIPAL
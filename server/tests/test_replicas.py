@@ -0,0 +1,121 @@
+import redis
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.api.dependencies import db as db_dependency
+from app.core import read_your_writes
+from app.core.metrics import metrics
+from app.core.security import create_access_token
+from app.db.replicas import ReplicaRouter
+
+
+@pytest.fixture
+def replica(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def broken_replica(tmp_path):
+    # The directory doesn't exist, so every connect fails like an unreachable host
+    engine = create_engine(f"sqlite:///{tmp_path / 'gone' / 'replica.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_healthy_replica_serves_reads(engine, replica):
+    router = ReplicaRouter(engine, [replica])
+
+    assert router.pick() is replica
+    assert router.session().get_bind() is replica
+
+
+def test_falls_back_to_primary_when_replica_fails_health_check(engine, broken_replica):
+    router = ReplicaRouter(engine, [broken_replica])
+    fallbacks = metrics.counter("db.replicas.fallbacks").value
+
+    assert router.pick() is engine
+    assert router.stats()["replicas"][0]["healthy"] is False
+    assert metrics.counter("db.replicas.fallbacks").value == fallbacks + 1
+
+
+def test_skips_only_the_failed_replica(engine, replica, broken_replica):
+    router = ReplicaRouter(engine, [broken_replica, replica])
+
+    assert {router.pick() for _ in range(4)} == {replica}
+
+
+def test_replica_marked_down_mid_request_recovers_on_next_check(engine, replica):
+    router = ReplicaRouter(engine, [replica], health_check_interval=3600)
+    router.pick()
+    router.mark_unhealthy(replica)
+
+    assert router.pick() is engine
+    router.check_health(force=True)
+    assert router.pick() is replica
+
+
+# -----------------------------
+# Read-your-writes pinning
+# -----------------------------
+class FakeRedis:
+    def __init__(self):
+        self.keys = {}
+
+    async def set(self, key, value, ex=None):
+        self.keys[key] = value
+
+    def exists(self, key):
+        return int(key in self.keys)
+
+
+class DownRedis:
+    def exists(self, key):
+        raise redis.ConnectionError("connection refused")
+
+
+@pytest.fixture
+def client(monkeypatch, engine, replica):
+    store = FakeRedis()
+    monkeypatch.setattr(read_your_writes, "redis_client", store)
+    monkeypatch.setattr(read_your_writes, "get_redis", lambda: store)
+    monkeypatch.setattr(db_dependency, "read_router", ReplicaRouter(engine, [replica]))
+
+    app = FastAPI()
+    app.middleware("http")(read_your_writes.read_your_writes_middleware)
+
+    @app.post("/items")
+    def write():
+        return {}
+
+    @app.get("/items")
+    def read(db=Depends(db_dependency.get_read_db)):
+        return {"bind": "primary" if db.get_bind() is engine else "replica"}
+
+    return TestClient(app)
+
+
+def auth(user_id):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_reads_go_to_the_replica_without_a_recent_write(client):
+    assert client.get("/items", headers=auth(1)).json() == {"bind": "replica"}
+    assert client.get("/items").json() == {"bind": "replica"}
+
+
+def test_request_after_a_write_is_pinned_to_the_primary(client):
+    assert client.post("/items", headers=auth(1)).status_code == 200
+
+    assert client.get("/items", headers=auth(1)).json() == {"bind": "primary"}
+    # Only the writer is pinned
+    assert client.get("/items", headers=auth(2)).json() == {"bind": "replica"}
+
+
+def test_unknown_write_state_reads_from_the_primary(client, monkeypatch):
+    monkeypatch.setattr(read_your_writes, "redis_client", DownRedis())
+
+    assert client.get("/items", headers=auth(1)).json() == {"bind": "primary"}
@@ -0,0 +1,32 @@
+import asyncio
+from datetime import date
+
+from app.models.rollups import MonthlyRollup
+from app.services.rollup_service import RollupService
+
+
+def test_summary_keeps_currencies_apart(session_factory, async_session_factory):
+    with session_factory() as db:
+        db.add_all([
+            MonthlyRollup(user_id=1, month=date(2025, 1, 1), kind="expense", currency="USD", category="Food", total=100.0, count=2),
+            MonthlyRollup(user_id=1, month=date(2025, 2, 1), kind="expense", currency="USD", category="Food", total=150.0, count=3),
+            MonthlyRollup(user_id=1, month=date(2025, 2, 1), kind="expense", currency="KES", category="Food", total=9000.0, count=1),
+            MonthlyRollup(user_id=1, month=date(2025, 2, 1), kind="income", currency="KES", category="", total=20000.0, count=1),
+            MonthlyRollup(user_id=2, month=date(2025, 2, 1), kind="expense", currency="USD", category="Rent", total=999.0, count=1),
+        ])
+        db.commit()
+
+    async def run():
+        async with async_session_factory() as db:
+            return await RollupService.summary(db, 1, date(2025, 2, 1), date(2025, 2, 1))
+
+    result = asyncio.run(run())
+    by_currency = {c["currency"]: c for c in result["currencies"]}
+
+    assert sorted(by_currency) == ["KES", "USD"]
+    assert (by_currency["USD"]["total_expenses"], by_currency["USD"]["total_income"]) == (150.0, 0.0)
+    assert (by_currency["KES"]["total_expenses"], by_currency["KES"]["total_income"]) == (9000.0, 20000.0)
+    # Month-over-month changes compare like with like
+    assert by_currency["USD"]["months"][0]["expense_change"] == 50.0
+    assert by_currency["KES"]["months"][0]["expense_change"] is None
+    assert by_currency["USD"]["categories"] == [{"category": "Food", "total": 150.0, "count": 3, "share": 1.0}]
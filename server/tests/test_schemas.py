@@ -0,0 +1,20 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.expenses import ExpenseUpdate
+from app.schemas.income import IncomeUpdate
+
+UNCHANGED = {"amount": None, "description": None, "date": None}
+
+
+@pytest.mark.parametrize("schema, fields", [
+    (ExpenseUpdate, {**UNCHANGED, "category": None}),
+    (IncomeUpdate, UNCHANGED),
+])
+def test_update_currency_may_be_omitted_but_not_null(schema, fields):
+    assert "currency" not in schema(**fields).dict(exclude_unset=True)
+    assert schema(**fields, currency="EUR").currency == "EUR"
+    with pytest.raises(ValidationError):
+        schema(**fields, currency=None)
+    with pytest.raises(ValidationError):
+        schema(**fields, currency="euro")
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.financial import FinancialModule, Section
+from app.schemas.financial import FinancialModuleUpdate, SectionUpdate
+from app.services.module_service import ModuleService
+from app.services.section_search import SectionSearchService, normalize_tags
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    SectionSearchService._index = None
+    yield
+    SectionSearchService._index = None
+
+
+@pytest.fixture
+def catalog(session_factory):
+    with session_factory() as db:
+        basics = FinancialModule(title="Basics", user_id=None, sections=[
+            Section(title="Tax refund timeline", content="When the refund arrives after filing.",
+                    region="US", tags="Tax,Refunds"),
+            Section(title="Budgeting", content="A tax bracket is not a refund; plan monthly spending.",
+                    region="US", tags="budget"),
+            Section(title="Filing abroad", content="Tax rules for residents filing a refund claim abroad.",
+                    region="UK", tags="tax, abroad"),
+            Section(title="Emergency fund", content="Keep three months of expenses in savings.",
+                    region="US", tags="savings"),
+        ])
+        private = FinancialModule(title="Mine", user_id=2, sections=[
+            Section(title="Private tax notes", content="My own tax refund checklist.", region="US", tags="tax"),
+        ])
+        db.add_all([basics, private])
+        db.commit()
+        return {s.title: s.id for s in basics.sections + private.sections}
+
+
+def search(session_factory, q=None, tags=(), region=None, user_id=1, limit=20, offset=0):
+    with session_factory() as db:
+        return SectionSearchService.search(db, user_id, q, normalize_tags(tags), region, limit, offset)
+
+
+def titles(hits):
+    return [hit["title"] for hit in hits]
+
+
+def test_title_matches_rank_above_content_matches(session_factory, catalog):
+    hits = search(session_factory, "refund")
+
+    assert titles(hits)[0] == "Tax refund timeline"
+    assert set(titles(hits)) == {"Tax refund timeline", "Budgeting", "Filing abroad"}
+    assert [hit["rank"] for hit in hits] == sorted((hit["rank"] for hit in hits), reverse=True)
+    assert "<mark>refund</mark>" in hits[0]["snippet"]
+
+
+def test_every_term_must_match(session_factory, catalog):
+    assert set(titles(search(session_factory, "tax refund"))) == {"Tax refund timeline", "Budgeting", "Filing abroad"}
+    assert titles(search(session_factory, "refund abroad")) == ["Filing abroad"]
+    assert search(session_factory, "refund pension") == []
+
+
+def test_tag_filter_needs_all_tags_and_ignores_case(session_factory, catalog):
+    assert titles(search(session_factory, tags=["TAX"])) == ["Tax refund timeline", "Filing abroad"]
+    assert titles(search(session_factory, tags=["tax,refunds"])) == ["Tax refund timeline"]
+    assert titles(search(session_factory, "refund", tags=["abroad"], region="UK")) == ["Filing abroad"]
+
+
+def test_private_sections_are_visible_to_their_owner_only(session_factory, catalog):
+    assert "Private tax notes" not in titles(search(session_factory, "checklist", user_id=1))
+    assert titles(search(session_factory, "checklist", user_id=2)) == ["Private tax notes"]
+
+
+def test_index_follows_a_diff_update(session_factory, catalog):
+    assert titles(search(session_factory, "savings")) == ["Emergency fund"]
+
+    with session_factory() as db:
+        module = db.get(FinancialModule, db.get(Section, catalog["Emergency fund"]).module_id)
+        module_in = FinancialModuleUpdate(title=module.title, sections=[
+            SectionUpdate(id=s.id, title=s.title, content=s.content, region=s.region,
+                          tags=s.tags.split(","), last_updated=s.last_updated)
+            for s in module.sections if s.id != catalog["Emergency fund"]
+        ] + [SectionUpdate(id=catalog["Emergency fund"], title="Emergency fund",
+                           content="Park a cash buffer in a high-yield account.", region="US", tags=["savings"])])
+        counts = ModuleService.apply_update(db, module, module_in)
+        db.commit()
+    assert counts["sections"] == {"inserted": 0, "updated": 1, "deleted": 0}
+
+    assert search(session_factory, "three months") == []
+    assert titles(search(session_factory, "buffer")) == ["Emergency fund"]
+
+
+def test_index_follows_an_update_older_than_the_newest_section(session_factory, catalog):
+    # A section created with a future last_updated keeps max(last_updated) fixed
+    with session_factory() as db:
+        module = db.get(FinancialModule, db.get(Section, catalog["Budgeting"]).module_id)
+        db.add(Section(module_id=module.id, title="Later", content="Scheduled content.",
+                       last_updated=datetime.utcnow() + timedelta(days=30)))
+        db.commit()
+    assert titles(search(session_factory, "scheduled")) == ["Later"]
+
+    with session_factory() as db:
+        module = db.get(FinancialModule, db.get(Section, catalog["Budgeting"]).module_id)
+        module_in = FinancialModuleUpdate(title=module.title, sections=[
+            SectionUpdate(id=s.id, title=s.title, region=s.region, tags=(s.tags or "").split(","),
+                          content="Zero-based budgeting." if s.id == catalog["Budgeting"] else s.content)
+            for s in module.sections
+        ])
+        ModuleService.apply_update(db, module, module_in)
+        db.commit()
+
+    assert titles(search(session_factory, "zero")) == ["Budgeting"]